@@ -0,0 +1,63 @@
+"""
+봉 아카이브 기간 조회 스크립트
+
+봇이 기록한 봉 아카이브(archive/)에서 종목/인터벌/기간에 해당하는 봉만 읽어 표로 출력합니다.
+기간이 겹치는 파티션만 열고 필요한 구간만 읽으므로 아카이브 크기와 무관하게 빠르게 조회됩니다.
+
+사용법:
+    python archive_query.py TQQQ 1 2026-09                 # 2026년 9월 1분봉
+    python archive_query.py TQQQ 1 2026-09-14 2026-09-15   # 하루 (종료 시각 미포함)
+    python archive_query.py TQQQ day 2026-01-01 2026-10-01
+    python archive_query.py --list
+"""
+
+import argparse
+import os
+import time
+import numpy as np
+import pandas as pd
+from bar_archive import BarArchive
+
+
+def parseRange(start, end):
+    """조회 기간 (종료를 생략하면 시작 단위(연/월/일)의 다음 값까지)"""
+    if start is None:
+        return None, None
+    start = np.datetime64(start)
+    if end is None:
+        end = start + 1
+    return start, np.datetime64(end)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="봉 아카이브 기간 조회")
+    parser.add_argument("ticker", nargs="?", help="종목 코드")
+    parser.add_argument("interval", nargs="?", help="인터벌 (day 또는 분 단위 숫자)")
+    parser.add_argument("start", nargs="?", help="시작 (예: 2026-09, 2026-09-14, 2026-09-14T09:30)")
+    parser.add_argument("end", nargs="?", help="종료 (미포함, 생략 시 시작 단위의 다음 값)")
+    parser.add_argument("--dir", default=os.getenv("BAR_ARCHIVE_DIR") or "archive", help="아카이브 디렉토리")
+    parser.add_argument("--list", action="store_true", help="기록된 종목/인터벌별 파티션 요약")
+    args = parser.parse_args()
+
+    archive = BarArchive(args.dir)
+    if args.list or not (args.ticker and args.interval):
+        for interval, ticker in archive.getSeries():
+            partitions = archive.getPartitions(ticker, interval)
+            count = sum(entry[0] for entry in partitions.values())
+            first, last = min(partitions), max(partitions)
+            print(f"{ticker:<6} {interval:>4} | 파티션 {len(partitions):>4}개 ({first} ~ {last}) | 봉 {count:,}개")
+        return
+
+    start, end = parseRange(args.start, args.end)
+    started = time.perf_counter()
+    chart = archive.query(args.ticker, args.interval, start, end)
+    elapsed = time.perf_counter() - started
+
+    frame = pd.DataFrame(chart._asdict()).set_index('ts')
+    pd.set_option('display.width', 120)
+    print(frame)
+    print(f"{args.ticker} {args.interval} {start} ~ {end}: 봉 {len(frame):,}개 ({elapsed * 1000:.1f}ms)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,271 @@
+"""
+종목/인터벌/기간 분할 봉 데이터 아카이브 모듈
+"""
+
+import json
+import os
+import queue
+import threading
+import time
+import numpy as np
+from utils.chart_util import ChartArrays
+from utils.logger_util import LoggerUtil
+
+
+class BarArchive:
+    """조회한 마감 봉을 인터벌/종목/기간 단위 컬럼형 파일로 쌓아 두는 아카이브
+
+    파일 구성: {root}/{interval}/{TICKER}/{partition}.npy
+    - partition: 분봉은 미국 현지 일자(YYYYMMDD), 일봉은 연도(YYYY)
+    - 각 파일은 (6, 봉 수) float64 배열로 행이 컬럼(ts, open, high, low, close, volume)이라
+      한 컬럼이 연속 메모리에 놓이며, 메모리 매핑(mmap)으로 필요한 구간만 읽습니다.
+      (mmap 읽기를 위해 압축하지 않으며, 분봉 하루 분량은 약 20KB)
+    - ts는 거래소 현지시간 기준 epoch 초 (ChartArrays.ts와 같은 기준)
+    {root}/index.json에 파티션별 (봉 수, 첫 ts, 마지막 ts)를 기록해 두고 조회 시 기간이 겹치는 파티션만 엽니다.
+
+    write는 큐에 넣기만 하고 파일 기록은 백그라운드 스레드가 처리하므로 매매 사이클을 막지 않습니다
+    (큐가 가득 차면 버리고 건수만 셉니다). 인덱스 파일은 변경이 있을 때 index_interval마다 한 번씩 저장합니다.
+    """
+
+    COLUMNS = ChartArrays._fields
+    INDEX_FILE = "index.json"
+
+    def __init__(self, root, queue_size=1000, index_interval=5.0):
+        """
+        Args:
+            root (str): 아카이브 디렉토리
+            queue_size (int): 기록 대기 큐 크기 (초과분은 버림)
+            index_interval (float): 인덱스 파일 저장 주기 (초)
+        """
+        self.logger = LoggerUtil().get_logger()
+        self.root = root
+        self.index_interval = index_interval
+        self.lock = threading.Lock()
+        self.index = self._loadIndex()  # {"interval/TICKER": {partition: [봉 수, 첫 ts, 마지막 ts]}}
+        self.index_dirty = False
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.stats = {'bars': 0, 'files': 0, 'dropped': 0, 'errors': 0}
+        self.writer = None
+
+    def _startWriter(self):
+        """기록 스레드 시작 (첫 기록 요청 시, 조회만 하는 경우에는 만들지 않음)"""
+        with self.lock:
+            if self.writer is None:
+                self.writer = threading.Thread(target=self._run, name="bar-archive-writer", daemon=True)
+                self.writer.start()
+
+    def _loadIndex(self):
+        path = os.path.join(self.root, self.INDEX_FILE)
+        if not os.path.exists(path):
+            return {}
+        try:
+            with open(path, encoding='utf-8') as f:
+                return json.load(f)
+        except Exception as e:
+            self.logger.warning(f"봉 아카이브 인덱스를 읽을 수 없어 새로 만듭니다: {e}")
+            return {}
+
+    def _saveIndex(self):
+        path = os.path.join(self.root, self.INDEX_FILE)
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.index, f, separators=(',', ':'), sort_keys=True)
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _seriesKey(ticker, interval):
+        return f"{interval}/{str(ticker).upper()}"
+
+    def _partitionPath(self, series_key, partition):
+        return os.path.join(self.root, series_key, f"{partition}.npy")
+
+    @staticmethod
+    def _partitionKeys(ts, interval):
+        """ts(datetime64[s]) 배열의 파티션 키 (분봉: YYYYMMDD, 일봉: YYYY)"""
+        if interval == "day":
+            return ts.astype('datetime64[Y]').astype(str)
+        return np.char.replace(ts.astype('datetime64[D]').astype(str), '-', '')
+
+    def write(self, ticker, interval, chart, count=None):
+        """마감 봉 기록 요청 (대기하지 않음, 기록 후 변경하지 않는 배열을 넘김)
+        Args:
+            ticker (str): 종목 코드
+            interval (str): 인터벌 (day 또는 분 단위 문자열)
+            chart (ChartArrays): 시간순 차트 배열
+            count (int): 앞에서부터 기록할 마감 봉 개수 (None이면 전체)
+        """
+        count = len(chart.ts) if count is None else count
+        if count <= 0:
+            return
+        if self.writer is None:
+            self._startWriter()
+        try:
+            self.queue.put_nowait((ticker, str(interval), chart, count))
+        except queue.Full:
+            self.stats['dropped'] += 1
+
+    def flush(self, timeout=10.0):
+        """대기 중인 기록을 마치고 인덱스 저장
+        Returns:
+            bool: 시간 내 모두 처리했는지 여부
+        """
+        deadline = time.monotonic() + timeout
+        while self.queue.unfinished_tasks:
+            if time.monotonic() >= deadline or self.writer is None or not self.writer.is_alive():
+                return False
+            time.sleep(0.01)
+        with self.lock:
+            self._saveIndexIfDirty()
+        return True
+
+    def close(self, timeout=10.0):
+        """남은 기록을 마치고 기록 스레드 종료"""
+        flushed = self.flush(timeout)
+        if self.writer is not None and self.writer.is_alive():
+            self.queue.put(None)
+            self.writer.join(timeout)
+        self.logger.info(f"봉 아카이브 종료: 봉 {self.stats['bars']}개, 파일 {self.stats['files']}회 기록, "
+                         f"버림 {self.stats['dropped']}건, 오류 {self.stats['errors']}건"
+                         + ("" if flushed else ", 미완료 기록 있음"))
+
+    def getStats(self):
+        """기록 통계 (대기 건수 포함)"""
+        return {**self.stats, 'pending': self.queue.unfinished_tasks}
+
+    def _run(self):
+        """기록 스레드 (인덱스는 변경이 있을 때 index_interval마다 저장)"""
+        last_save = time.monotonic()
+        while True:
+            try:
+                item = self.queue.get(timeout=self.index_interval)
+            except queue.Empty:
+                item = False
+
+            if item is None:
+                self.queue.task_done()
+                return
+            if item:
+                try:
+                    self._writeBars(*item)
+                except Exception as e:
+                    self.stats['errors'] += 1
+                    self.logger.error(f"{item[0]} {item[1]} 봉 아카이브 기록 실패: {e}")
+                finally:
+                    self.queue.task_done()
+
+            if time.monotonic() - last_save >= self.index_interval:
+                try:
+                    with self.lock:
+                        self._saveIndexIfDirty()
+                except Exception as e:
+                    self.logger.error(f"봉 아카이브 인덱스 저장 실패: {e}")
+                last_save = time.monotonic()
+
+    def _saveIndexIfDirty(self):
+        if self.index_dirty:
+            self._saveIndex()
+            self.index_dirty = False
+
+    def _writeBars(self, ticker, interval, chart, count):
+        """마감 봉 파일 기록 (새 봉이 있는 파티션만 다시 쓰며, 같은 ts의 봉은 새 값으로 교체)
+        Returns:
+            int: 새로 추가된 봉 개수
+        """
+        data = np.vstack([chart.ts[:count].astype('datetime64[s]').astype(np.int64).astype(np.float64)] +
+                         [np.asarray(column[:count], dtype=np.float64) for column in chart[1:]])
+        keys = self._partitionKeys(chart.ts[:count], interval)
+        series_key = self._seriesKey(ticker, interval)
+
+        # 인덱스는 기록 스레드만 변경하므로 사본에 반영한 뒤 잠금 안에서 교체 (조회는 잠금 안에서 사본을 읽음)
+        added = 0
+        changed = False
+        with self.lock:
+            entries = dict(self.index.get(series_key, {}))
+        boundaries = np.flatnonzero(keys[1:] != keys[:-1]) + 1
+        for start, end in zip(np.r_[0, boundaries], np.r_[boundaries, count]):
+            partition = str(keys[start])
+            rows = data[:, start:end]
+            entry = entries.get(partition)
+
+            path = self._partitionPath(series_key, partition)
+            existing = np.load(path, mmap_mode='r') if entry and os.path.exists(path) else None
+
+            # 이미 기록된 봉뿐이면 건너뜀 (마감 봉은 바뀌지 않으므로 매 사이클 같은 파일을 다시 쓰지 않음)
+            if (existing is not None and rows[0, 0] >= entry[1] and rows[0, -1] <= entry[2]
+                    and np.isin(rows[0], existing[0]).all()):
+                continue
+
+            previous = entry[0] if existing is not None else 0
+            if existing is not None:
+                rows = self._merge(np.asarray(existing), rows)
+                del existing
+
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            tmp_path = f"{path}.tmp.npy"
+            np.save(tmp_path, np.ascontiguousarray(rows))
+            os.replace(tmp_path, path)
+            entries[partition] = [int(rows.shape[1]), int(rows[0, 0]), int(rows[0, -1])]
+            added += int(rows.shape[1]) - previous
+            changed = True
+            self.stats['files'] += 1
+
+        if changed:
+            with self.lock:
+                self.index[series_key] = entries
+                self.index_dirty = True
+            self.stats['bars'] += added
+        return added
+
+    @staticmethod
+    def _merge(existing, rows):
+        """ts 기준 병합 (같은 ts는 새 값 우선, 시간순 정렬)"""
+        combined = np.hstack([existing, rows])
+        ts = combined[0]
+        # 뒤집은 배열에서 첫 등장 = 원래 배열의 마지막(새 값) 등장
+        _, reversed_index = np.unique(ts[::-1], return_index=True)
+        return combined[:, len(ts) - 1 - reversed_index]
+
+    def query(self, ticker, interval, start=None, end=None):
+        """기간 조회 (기간이 겹치는 파티션만 메모리 매핑으로 열고 ts 이진 탐색으로 구간만 읽음)
+        Args:
+            ticker (str): 종목 코드
+            interval (str): 인터벌
+            start (str | datetime64): 시작 시각 (포함, 예: "2026-09-01")
+            end (str | datetime64): 종료 시각 (미포함, 예: "2026-10-01")
+        Returns:
+            ChartArrays: 시간순 차트 배열 (없으면 빈 배열)
+        """
+        lo = np.datetime64(start, 's').astype(np.int64) if start is not None else -np.inf
+        hi = np.datetime64(end, 's').astype(np.int64) if end is not None else np.inf
+        series_key = self._seriesKey(ticker, str(interval))
+        with self.lock:
+            entries = dict(self.index.get(series_key, {}))
+
+        parts = []
+        for partition in sorted(entries):
+            _, first_ts, last_ts = entries[partition]
+            if last_ts < lo or first_ts >= hi:
+                continue
+            data = np.load(self._partitionPath(series_key, partition), mmap_mode='r')
+            i, j = np.searchsorted(data[0], [lo, hi], side='left')
+            if j > i:
+                parts.append(data[:, i:j])
+
+        if not parts:
+            empty = np.empty(0, dtype=np.float64)
+            return ChartArrays(np.empty(0, dtype='datetime64[s]'), empty, empty, empty, empty, empty)
+
+        data = parts[0] if len(parts) == 1 else np.hstack(parts)
+        return ChartArrays(data[0].astype(np.int64).astype('datetime64[s]'), *data[1:])
+
+    def getPartitions(self, ticker, interval):
+        """종목/인터벌의 파티션별 (봉 수, 첫 시각, 마지막 시각)"""
+        with self.lock:
+            entries = dict(self.index.get(self._seriesKey(ticker, str(interval)), {}))
+        return {partition: (count, np.datetime64(first_ts, 's'), np.datetime64(last_ts, 's'))
+                for partition, (count, first_ts, last_ts) in sorted(entries.items())}
+
+    def getSeries(self):
+        """기록된 (인터벌, 종목) 목록"""
+        with self.lock:
+            return [tuple(series_key.split('/', 1)) for series_key in sorted(self.index)]
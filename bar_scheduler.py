@@ -0,0 +1,114 @@
+"""
+봉 마감 시각 정렬 스케줄러 모듈
+"""
+
+import math
+from collections import deque
+from datetime import datetime, timedelta, time
+from utils.datetime_util import DateTimeUtil
+
+
+class BarScheduler:
+    """인터벌별 봉 마감 시각(미국 동부시간)을 계산하는 스케줄러
+
+    분봉 인터벌은 장 시작 시각을 기준으로 N분 경계마다, 일봉처럼 현재가로 미완성 봉을
+    평가하는 지표와 손절 점검은 LIVE 주기(CHECK_INTERVAL_MINUTES)마다 깨어납니다.
+    봉 마감 직후 차트에 마감 봉이 반영될 수 있도록 settle_seconds만큼 늦게 깨어납니다.
+    """
+
+    LIVE = "live"
+
+    def __init__(self, intervals, live_interval_minutes, anchor_time: time, settle_seconds=3.0):
+        """
+        Args:
+            intervals (iterable): 지표 인터벌 목록 (day 또는 분 단위 문자열)
+            live_interval_minutes (int): 실시간 평가 주기 (분)
+            anchor_time (time): 봉 경계 기준 시각 (미국 현지 장 시작 시각)
+            settle_seconds (float): 봉 마감 후 평가까지 대기 시간 (초)
+        """
+        # 인터벌 토큰 -> 주기(초), 일봉은 현재가 기준 평가이므로 LIVE 주기로 처리
+        self.periods = {self.LIVE: int(live_interval_minutes) * 60}
+        for interval in intervals:
+            if interval and interval != "day":
+                self.periods[interval] = int(interval) * 60
+
+        self.anchor_time = anchor_time
+        self.settle = timedelta(seconds=settle_seconds)
+
+        # 스케줄 지연 지표 (예정 시각 대비 실제 평가 시작 지연, 초)
+        self.lag_samples = deque(maxlen=500)
+        self.max_lag = 0.0
+        self.missed_boundaries = 0
+        self.last_due = {}  # {인터벌 토큰: 마지막으로 평가한 봉 경계}
+
+    def _getAnchor(self, now):
+        """now 이전의 가장 최근 기준 시각 (장 시작 시각)"""
+        anchor = DateTimeUtil.US_TIMEZONE.localize(datetime.combine(now.date(), self.anchor_time))
+        if anchor > now:
+            anchor = DateTimeUtil.US_TIMEZONE.localize(
+                datetime.combine(now.date() - timedelta(days=1), self.anchor_time)
+            )
+        return anchor
+
+    def _nextBoundary(self, anchor, now, period):
+        """now(마감 대기 포함) 이후 첫 봉 경계"""
+        elapsed = (now - self.settle - anchor).total_seconds()
+        return anchor + timedelta(seconds=(math.floor(elapsed / period) + 1) * period)
+
+    def nextBoundary(self, period, now=None):
+        """now(마감 대기 포함) 이후 period 주기의 첫 봉 경계"""
+        now = now or DateTimeUtil.get_us_now()
+        return self._nextBoundary(self._getAnchor(now), now, period)
+
+    def getDueTokens(self, boundary):
+        """봉 경계 시각에 마감되는 인터벌 토큰 목록"""
+        elapsed = int(round((boundary - self._getAnchor(boundary)).total_seconds()))
+        return {token for token, period in self.periods.items() if elapsed % period == 0}
+
+    def intervalToken(self, interval):
+        """지표 인터벌의 스케줄 토큰 (일봉은 LIVE 주기)"""
+        return self.LIVE if interval == "day" else interval
+
+    def isDue(self, interval, due):
+        """인터벌이 이번 평가에서 마감되었는지 여부 (due가 None이면 항상 평가)"""
+        return due is None or self.intervalToken(interval) in due
+
+    def getDelaySeconds(self, wakeup, now=None):
+        """깨어날 시각까지 남은 시간 (초)"""
+        now = now or DateTimeUtil.get_us_now()
+        return max(0.0, (wakeup - now).total_seconds())
+
+    def recordRun(self, wakeup, due, boundary, started_at=None):
+        """평가 시작 시각 기록 및 스케줄 지연 계산
+
+        Returns:
+            float: 예정 시각 대비 지연 (초)
+        """
+        started_at = started_at or DateTimeUtil.get_us_now()
+        lag = max(0.0, (started_at - wakeup).total_seconds())
+        self.lag_samples.append(lag)
+        self.max_lag = max(self.max_lag, lag)
+
+        # 이전 사이클이 길어져 건너뛴 봉 경계 수 집계 (건너뛴 봉은 다음 조회 때 함께 반영됨)
+        for token in due:
+            previous = self.last_due.get(token)
+            if previous is not None:
+                skipped = int((boundary - previous).total_seconds() // self.periods[token]) - 1
+                if skipped > 0:
+                    self.missed_boundaries += skipped
+            self.last_due[token] = boundary
+
+        return lag
+
+    def getLagStats(self):
+        """스케줄 지연 통계 (초)"""
+        if not self.lag_samples:
+            return {"count": 0, "last": 0.0, "avg": 0.0, "max": 0.0, "missed_boundaries": self.missed_boundaries}
+
+        return {
+            "count": len(self.lag_samples),
+            "last": self.lag_samples[-1],
+            "avg": sum(self.lag_samples) / len(self.lag_samples),
+            "max": self.max_lag,
+            "missed_boundaries": self.missed_boundaries
+        }
@@ -0,0 +1,100 @@
+"""
+캡처 로그 요약/재생 스크립트
+
+봇이 기록한 캡처 파일(captures/capture_*.bin)을 읽어 레코드 종류별 건수와 시간 범위를 출력하거나,
+실시간 체결가 프레임과 복호화된 체결통보를 실제 수신 경로(KisWebSocket 파서, 시세 버스)에 최대 속도로 다시 흘려
+처리량과 재생 결과를 확인합니다. API나 WebSocket 연결은 사용하지 않습니다.
+
+사용법:
+    python capture_replay.py captures/capture_20261019_092500.bin
+    python capture_replay.py captures/capture_20261019_092500.bin --replay
+    python capture_replay.py captures/capture_20261019_092500.bin --dump 20
+"""
+
+import argparse
+import time
+from collections import Counter
+from datetime import datetime
+from utils.capture_log import CaptureLog
+from utils.datetime_util import DateTimeUtil
+
+
+def printSummary(path):
+    """레코드 종류별 건수/크기와 벽시계 시간 범위 출력"""
+    counts = Counter()
+    sizes = Counter()
+    first_ns = last_ns = None
+    for record in CaptureLog.read(path):
+        name = CaptureLog.KIND_NAMES.get(record.kind, str(record.kind))
+        counts[name] += 1
+        sizes[name] += len(record.payload)
+        first_ns = record.wall_ns if first_ns is None else first_ns
+        last_ns = record.wall_ns
+
+    print(f"캡처 파일: {path}")
+    if first_ns is None:
+        print("레코드 없음")
+        return
+    print(f"기간: {datetime.fromtimestamp(first_ns / 1e9):%H:%M:%S.%f} ~ {datetime.fromtimestamp(last_ns / 1e9):%H:%M:%S.%f}")
+    for name, count in counts.most_common():
+        print(f"  {name:<9} {count:>8,}건 {sizes[name] / 1024:>10.1f}KB")
+
+
+def dumpRecords(path, count):
+    """앞쪽 레코드 count개 출력"""
+    for i, record in enumerate(CaptureLog.read(path)):
+        if i >= count:
+            break
+        name = CaptureLog.KIND_NAMES.get(record.kind, str(record.kind))
+        exchange = (f"{datetime.fromtimestamp(record.exchange_ns / 1e9, DateTimeUtil.US_TIMEZONE):%H:%M:%S}"
+                    if record.exchange_ns else "-")
+        print(f"{record.monotonic_ns / 1e9:14.6f} {name:<9} 거래소(ET) {exchange:>8} | {record.payload[:120].decode('utf-8', 'replace')}")
+
+
+def replay(path):
+    """체결가 프레임/복호화 체결통보를 수신 경로에 최대 속도로 재생"""
+    from kis_websocket import KisWebSocket
+    from market_data_bus import MarketDataBus
+    from utils.logger_util import LoggerUtil
+
+    websocket = KisWebSocket.__new__(KisWebSocket)
+    websocket.logger = LoggerUtil().get_logger()
+    websocket.price_callback = None
+    websocket.market_data_bus = MarketDataBus()
+    prices = websocket.market_data_bus.subscribe("replay", "price", conflate=True)
+
+    records = list(CaptureLog.read(path))
+    started = time.perf_counter()
+    frames = fills = 0
+    for record in records:
+        if record.kind == CaptureLog.KIND_WS_FRAME and record.payload[:1] == b"0":
+            websocket.handle_price_message(record.payload.decode('utf-8'))
+            frames += 1
+        elif record.kind == CaptureLog.KIND_FILL:
+            tr_id, count, data = record.payload.decode('utf-8').split('|', 2)
+            fills += len(websocket.parse_execution_records(data, int(count)))
+    elapsed = time.perf_counter() - started
+
+    span = (records[-1].monotonic_ns - records[0].monotonic_ns) / 1e9 if records else 0
+    print(f"재생: 체결가 프레임 {frames:,}건, 체결통보 {fills:,}건을 {elapsed * 1000:.1f}ms에 처리 "
+          f"(원래 {span:,.1f}초 분량)")
+    for event in prices.drain():
+        print(f"  {event.ticker:<6} 마지막 체결가 ${event.price:,.4f}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="캡처 로그 요약/재생")
+    parser.add_argument("path", help="캡처 파일 경로")
+    parser.add_argument("--replay", action="store_true", help="수신 경로에 최대 속도로 재생")
+    parser.add_argument("--dump", type=int, default=0, help="앞쪽 레코드 출력 개수")
+    args = parser.parse_args()
+
+    printSummary(args.path)
+    if args.dump:
+        dumpRecords(args.path, args.dump)
+    if args.replay:
+        replay(args.path)
+
+
+if __name__ == "__main__":
+    main()
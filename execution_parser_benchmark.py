@@ -0,0 +1,88 @@
+"""
+체결통보 파서 처리량 벤치마크 스크립트
+
+임의 키로 암호화한 체결통보 메시지를 만들어 기존 방식(메시지마다 AES CBC 객체 생성 + dict 파싱, 한 건만 처리)과
+현재 방식(키당 캐시한 복호화기 + ExecutionRecord, 메시지 내 여러 건 처리)의 초당 처리 건수를 비교합니다.
+실제 API나 WebSocket 연결은 사용하지 않습니다.
+
+사용법:
+    python execution_parser_benchmark.py
+    python execution_parser_benchmark.py --messages 20000 --records 3
+"""
+
+import argparse
+import time
+from base64 import b64decode, b64encode
+from Crypto.Cipher import AES
+from Crypto.Util.Padding import pad, unpad
+from kis_websocket import KisWebSocket, EXECUTION_FIELDS
+
+AES_KEY = "0123456789abcdef0123456789abcdef"
+AES_IV = "abcdef0123456789"
+
+
+def buildMessage(index, records):
+    """체결통보 메시지 생성 (records건을 '^'로 이어 붙여 한 번에 암호화)"""
+    rows = []
+    for n in range(records):
+        row = [''] * len(EXECUTION_FIELDS)
+        row[2] = f"{index:06d}{n:04d}"
+        row[4] = '02'
+        row[7] = 'AAPL'
+        row[8] = '10'
+        row[9] = '1895000'
+        row[10] = '093015'
+        row[12] = '2'
+        row[15] = '10'
+        rows.append('^'.join(row))
+    cipher = AES.new(AES_KEY.encode('utf-8'), AES.MODE_CBC, AES_IV.encode('utf-8'))
+    encrypted = b64encode(cipher.encrypt(pad('^'.join(rows).encode('utf-8'), AES.block_size))).decode()
+    return f"1|H0GSCNI0|{records:03d}|{encrypted}"
+
+
+def legacyParse(message):
+    """기존 방식: 메시지마다 CBC 객체 생성, 첫 레코드만 dict로 파싱"""
+    parts = message.split('|')
+    cipher = AES.new(AES_KEY.encode('utf-8'), AES.MODE_CBC, AES_IV.encode('utf-8'))
+    data = bytes.decode(unpad(cipher.decrypt(b64decode(parts[3])), AES.block_size))
+    values = data.split('^')
+    return [{name: values[i] if len(values) > i else '' for i, name in enumerate(EXECUTION_FIELDS)}]
+
+
+def measure(label, parse, messages):
+    started = time.perf_counter()
+    records = 0
+    for message in messages:
+        records += len(parse(message))
+    elapsed = time.perf_counter() - started
+    print(f"{label:<8} 메시지 {len(messages) / elapsed:>10,.0f}/s | 레코드 {records / elapsed:>10,.0f}/s "
+          f"| 처리 레코드 {records:,}")
+    return elapsed
+
+
+def main():
+    parser = argparse.ArgumentParser(description="체결통보 파서 처리량 비교")
+    parser.add_argument("--messages", type=int, default=10000, help="메시지 수")
+    parser.add_argument("--records", type=int, default=1, help="메시지당 체결 건수")
+    args = parser.parse_args()
+
+    messages = [buildMessage(i, args.records) for i in range(args.messages)]
+    websocket = KisWebSocket.__new__(KisWebSocket)
+    websocket.logger = None
+    websocket.aes_key = AES_KEY
+    websocket.aes_iv = AES_IV
+    websocket._cipher = None
+
+    # 결과 일치 확인 (첫 레코드 기준)
+    expected = legacyParse(messages[0])[0]
+    actual = websocket.parse_execution_frame(messages[0])
+    assert len(actual) == args.records
+    assert all(actual[0].get(name) == value for name, value in expected.items())
+
+    legacy = measure("기존", legacyParse, messages)
+    current = measure("현재", websocket.parse_execution_frame, messages)
+    print(f"메시지 처리 속도 {legacy / current:.2f}배")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+"""
+프로세스 시작 import 시간/메모리 예산 점검 스크립트
+
+새 파이썬 프로세스에서 `import main`을 여러 번 실행해 import 시간(중앙값)과 최대 RSS를 측정하고,
+예산을 넘거나 지연 로드 대상 모듈이 시작 시점에 로드되면 종료 코드 1로 실패합니다.
+
+측정 범위는 import 단계까지입니다. TradingBot 생성(토큰 발급)과 시작 준비 작업(잔고/미체결/차트 조회,
+장 시작 알림)은 증권사 API와 텔레그램을 호출하므로 여기서 측정하지 않고, 실행 중인 봇이 로그와
+getBotStatus()의 startup_seconds/first_decision_seconds로 보고합니다.
+
+사용법:
+    python import_budget_check.py
+    python import_budget_check.py --runs 7 --time-budget-ms 400 --rss-budget-mb 80 --verbose
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# 시작 시점에 로드되면 안 되는 모듈 (사용 시점에 지연 로드)
+LAZY_MODULES = ['pandas', 'ta', 'holidays', 'websockets', 'Crypto']
+
+PROBE = """
+import json, resource, sys, time
+started = time.perf_counter()
+import main
+elapsed_ms = (time.perf_counter() - started) * 1000
+rss_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+if sys.platform == 'darwin':
+    rss_kb //= 1024
+print(json.dumps({
+    'elapsed_ms': elapsed_ms,
+    'rss_mb': rss_kb / 1024,
+    'loaded': [name for name in %r if name in sys.modules]
+}))
+""" % (LAZY_MODULES,)
+
+
+def runProbe():
+    """새 프로세스에서 import main 1회 측정"""
+    result = subprocess.run(
+        [sys.executable, "-c", PROBE],
+        cwd=ROOT_DIR, capture_output=True, text=True, check=True
+    )
+    return json.loads(result.stdout.strip().splitlines()[-1])
+
+
+def printSlowestImports(count=15):
+    """-X importtime 기준 누적 import 시간 상위 모듈 출력"""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", "import main"],
+        cwd=ROOT_DIR, capture_output=True, text=True, check=True
+    )
+    rows = []
+    for line in result.stderr.splitlines():
+        parts = line.split("|")
+        if len(parts) != 3 or not parts[1].strip().isdigit():
+            continue
+        rows.append((int(parts[1]), parts[2].strip()))
+
+    print(f"누적 import 시간 상위 {count}개:")
+    for cumulative_us, module in sorted(rows, reverse=True)[:count]:
+        print(f"  {cumulative_us / 1000:8.1f}ms  {module}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="import 시간/메모리 예산 점검")
+    parser.add_argument("--runs", type=int, default=5, help="측정 횟수 (중앙값 사용)")
+    parser.add_argument("--time-budget-ms", type=float,
+                        default=float(os.getenv("IMPORT_TIME_BUDGET_MS", "400")), help="import 시간 예산 (ms)")
+    parser.add_argument("--rss-budget-mb", type=float,
+                        default=float(os.getenv("IMPORT_RSS_BUDGET_MB", "80")), help="최대 RSS 예산 (MB)")
+    parser.add_argument("--verbose", action="store_true", help="느린 import 모듈 출력")
+    args = parser.parse_args()
+
+    samples = [runProbe() for _ in range(args.runs)]
+    elapsed_ms = statistics.median(sample['elapsed_ms'] for sample in samples)
+    rss_mb = max(sample['rss_mb'] for sample in samples)
+    loaded = sorted({name for sample in samples for name in sample['loaded']})
+
+    print(f"import main: 중앙값 {elapsed_ms:.1f}ms (예산 {args.time_budget_ms:.0f}ms), "
+          f"최대 RSS {rss_mb:.1f}MB (예산 {args.rss_budget_mb:.0f}MB)")
+    if args.verbose:
+        printSlowestImports()
+
+    failures = []
+    if elapsed_ms > args.time_budget_ms:
+        failures.append(f"import 시간 예산 초과: {elapsed_ms:.1f}ms > {args.time_budget_ms:.0f}ms")
+    if rss_mb > args.rss_budget_mb:
+        failures.append(f"RSS 예산 초과: {rss_mb:.1f}MB > {args.rss_budget_mb:.0f}MB")
+    if loaded:
+        failures.append(f"지연 로드 대상 모듈이 시작 시점에 로드됨: {', '.join(loaded)}")
+
+    for failure in failures:
+        print(f"[실패] {failure}")
+    if failures:
+        sys.exit(1)
+    print("[통과] import 예산 이내")
+
+
+if __name__ == "__main__":
+    main()
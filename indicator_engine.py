@@ -0,0 +1,685 @@
+import copy
+import numpy as np
+from contextlib import nullcontext
+from typing import Optional, Callable
+from kis_price import KisPrice
+from utils.chart_util import ChartUtil
+from utils.ring_buffer import RingBuffer
+from utils.logger_util import LoggerUtil
+from utils.datetime_util import DateTimeUtil
+
+
+# 지표 노드 키 (이름, 파라미터...) - 입력 노드도 키로 표현되어 DAG를 구성함
+CLOSE = ('close',)
+CHANGE = ('change',)
+GAIN = ('gain',)
+LOSS = ('loss',)
+
+
+def emaKey(period, source=CLOSE):
+    """EMA(n) 노드 키"""
+    return ('ema', period, source)
+
+
+def wilderKey(period, source):
+    """와일더 평균(alpha=1/n) 노드 키"""
+    return ('wilder', period, source)
+
+
+def rsiKey(period=14):
+    """RSI(n) 노드 키"""
+    return ('rsi', period)
+
+
+def macdKey(fast_period=12, slow_period=26):
+    """MACD 라인 노드 키"""
+    return ('macd', fast_period, slow_period)
+
+
+def macdSignalKey(fast_period=12, slow_period=26, signal_period=9):
+    """MACD 시그널 라인 노드 키 (MACD 라인의 EMA)"""
+    return emaKey(signal_period, macdKey(fast_period, slow_period))
+
+
+def macdHistogramKey(fast_period=12, slow_period=26, signal_period=9):
+    """MACD 히스토그램 노드 키"""
+    return ('macd_hist', fast_period, slow_period, signal_period)
+
+
+def macdCrossKey(fast_period=12, slow_period=26, signal_period=9):
+    """MACD 골든크로스/데드크로스 감지 노드 키"""
+    return ('macd_cross', fast_period, slow_period, signal_period)
+
+
+class IndicatorRegistry:
+    """지표 노드 정의 등록소
+
+    각 지표는 입력 노드(종가, EMA(n), 와일더 평균 등)를 선언하고,
+    IndicatorGraph가 이를 바탕으로 (종목, 인터벌)별 계산 DAG를 구성합니다.
+    """
+
+    _nodes = {}
+
+    @classmethod
+    def register(cls, name):
+        """지표 노드 클래스 등록 데코레이터"""
+        def decorator(node_cls):
+            node_cls.name = name
+            cls._nodes[name] = node_cls
+            return node_cls
+        return decorator
+
+    @classmethod
+    def create(cls, key):
+        """노드 키로 지표 노드 인스턴스 생성"""
+        name, *params = key
+        if name not in cls._nodes:
+            raise KeyError(f"등록되지 않은 지표입니다: {name}")
+        return cls._nodes[name](*params)
+
+    @classmethod
+    def names(cls):
+        """등록된 지표 이름 목록"""
+        return list(cls._nodes.keys())
+
+
+class IndicatorNode:
+    """지표 노드 기본 클래스
+
+    step()은 (이전 상태, 입력값, 종가)를 받아 (새 상태, 값)을 반환하는 순수 함수로,
+    상태를 변경하지 않으므로 미완성 봉 미리보기 계산에도 그대로 사용할 수 있습니다.
+    값이 아직 유효하지 않으면 None을 반환합니다.
+    """
+
+    name = None
+
+    def __init__(self, *params):
+        self.params = params
+
+    def inputs(self):
+        """입력 노드 키 목록"""
+        return []
+
+    def initialState(self):
+        """초기 상태"""
+        return None
+
+    def lookback(self):
+        """값 계산에 필요한 최소 봉 수 (그래프 링 버퍼 크기 산정용)"""
+        return 1
+
+    def step(self, state, inputs, close):
+        raise NotImplementedError
+
+
+@IndicatorRegistry.register('close')
+class CloseNode(IndicatorNode):
+    """종가 (입력 소스)"""
+
+    def step(self, state, inputs, close):
+        return state, close
+
+
+@IndicatorRegistry.register('change')
+class ChangeNode(IndicatorNode):
+    """전봉 대비 변화량 (첫 봉은 None)"""
+
+    def inputs(self):
+        return [CLOSE]
+
+    def step(self, state, inputs, close):
+        price = inputs[0]
+        if state is None:
+            return price, None
+        return price, price - state
+
+
+@IndicatorRegistry.register('gain')
+class GainNode(IndicatorNode):
+    """상승폭 (ta RSI와 동일하게 첫 봉은 0)"""
+
+    def inputs(self):
+        return [CHANGE]
+
+    def step(self, state, inputs, close):
+        diff = inputs[0]
+        return state, diff if diff is not None and diff > 0 else 0.0
+
+
+@IndicatorRegistry.register('loss')
+class LossNode(IndicatorNode):
+    """하락폭 (ta RSI와 동일하게 첫 봉은 0)"""
+
+    def inputs(self):
+        return [CHANGE]
+
+    def step(self, state, inputs, close):
+        diff = inputs[0]
+        return state, -diff if diff is not None and diff < 0 else 0.0
+
+
+class _EwmNode(IndicatorNode):
+    """지수가중평균 공통 노드 (pandas ewm adjust=False, min_periods=n과 동일)
+
+    입력이 None인 구간(선행 지표가 아직 유효하지 않은 구간)은 건너뛰고,
+    첫 유효 입력값으로 시작해 n개가 쌓이면 값을 반환합니다.
+    """
+
+    def __init__(self, period, source=CLOSE):
+        super().__init__(period, source)
+        self.period = period
+        self.source = source
+        self.alpha = self._alpha(period)
+
+    def _alpha(self, period):
+        raise NotImplementedError
+
+    def inputs(self):
+        return [self.source]
+
+    def initialState(self):
+        return (0, None)  # (입력 개수, 평균)
+
+    def lookback(self):
+        return self.period
+
+    def step(self, state, inputs, close):
+        value = inputs[0]
+        if value is None:
+            return state, None
+
+        count, average = state
+        count += 1
+        average = value if average is None else average + self.alpha * (value - average)
+        return (count, average), (average if count >= self.period else None)
+
+
+@IndicatorRegistry.register('ema')
+class EmaNode(_EwmNode):
+    """EMA(n) (span=n)"""
+
+    def _alpha(self, period):
+        return 2.0 / (period + 1)
+
+
+@IndicatorRegistry.register('wilder')
+class WilderNode(_EwmNode):
+    """와일더 평균 (alpha=1/n)"""
+
+    def _alpha(self, period):
+        return 1.0 / period
+
+
+@IndicatorRegistry.register('rsi')
+class RsiNode(IndicatorNode):
+    """RSI(n) = 와일더 평균 상승폭 / 하락폭 기반"""
+
+    def __init__(self, period=14):
+        super().__init__(period)
+        self.period = period
+
+    def inputs(self):
+        return [wilderKey(self.period, GAIN), wilderKey(self.period, LOSS)]
+
+    def lookback(self):
+        return self.period + 1
+
+    def step(self, state, inputs, close):
+        average_gain, average_loss = inputs
+        if average_gain is None or average_loss is None:
+            return state, None
+        if average_loss == 0:
+            return state, 100.0
+        return state, 100.0 - 100.0 / (1.0 + average_gain / average_loss)
+
+
+@IndicatorRegistry.register('macd')
+class MacdNode(IndicatorNode):
+    """MACD 라인 = EMA(fast) - EMA(slow)"""
+
+    def __init__(self, fast_period=12, slow_period=26):
+        super().__init__(fast_period, slow_period)
+        self.fast_period = fast_period
+        self.slow_period = slow_period
+
+    def inputs(self):
+        return [emaKey(self.fast_period), emaKey(self.slow_period)]
+
+    def lookback(self):
+        return max(self.fast_period, self.slow_period)
+
+    def step(self, state, inputs, close):
+        fast, slow = inputs
+        if fast is None or slow is None:
+            return state, None
+        return state, fast - slow
+
+
+@IndicatorRegistry.register('macd_hist')
+class MacdHistogramNode(IndicatorNode):
+    """MACD 히스토그램 = MACD - Signal"""
+
+    def __init__(self, fast_period=12, slow_period=26, signal_period=9):
+        super().__init__(fast_period, slow_period, signal_period)
+        self.macd_key = macdKey(fast_period, slow_period)
+        self.signal_key = macdSignalKey(fast_period, slow_period, signal_period)
+        self.required_bars = max(fast_period, slow_period) + signal_period
+
+    def inputs(self):
+        return [self.macd_key, self.signal_key]
+
+    def lookback(self):
+        return self.required_bars
+
+    def step(self, state, inputs, close):
+        macd_value, signal_value = inputs
+        if macd_value is None or signal_value is None:
+            return state, None
+        return state, macd_value - signal_value
+
+
+@IndicatorRegistry.register('macd_cross')
+class MacdCrossNode(IndicatorNode):
+    """MACD 골든크로스/데드크로스 감지
+
+    값: 'golden_cross' / 'death_cross' / None
+    상태: (이전 MACD, 이전 Signal, 골든크로스 이후 봉 수, 데드크로스 이후 봉 수)
+    경과 봉 수는 0이면 해당 봉에서 발생, None이면 발생 이력 없음을 의미합니다.
+    """
+
+    def __init__(self, fast_period=12, slow_period=26, signal_period=9):
+        super().__init__(fast_period, slow_period, signal_period)
+        self.macd_key = macdKey(fast_period, slow_period)
+        self.signal_key = macdSignalKey(fast_period, slow_period, signal_period)
+        self.required_bars = max(fast_period, slow_period) + signal_period
+
+    def inputs(self):
+        return [self.macd_key, self.signal_key]
+
+    def lookback(self):
+        return self.required_bars
+
+    def initialState(self):
+        return (None, None, None, None)
+
+    def step(self, state, inputs, close):
+        prev_macd, prev_signal, bars_since_golden, bars_since_death = state
+        macd_value, signal_value = inputs
+
+        if bars_since_golden is not None:
+            bars_since_golden += 1
+        if bars_since_death is not None:
+            bars_since_death += 1
+
+        cross = None
+        if (macd_value is not None and signal_value is not None
+                and prev_macd is not None and prev_signal is not None):
+            if macd_value > signal_value and prev_macd <= prev_signal:
+                cross = 'golden_cross'
+                bars_since_golden = 0
+            elif macd_value < signal_value and prev_macd >= prev_signal:
+                cross = 'death_cross'
+                bars_since_death = 0
+
+        return (macd_value, signal_value, bars_since_golden, bars_since_death), cross
+
+
+class IndicatorGraph:
+    """(종목, 인터벌)별 지표 계산 DAG
+
+    require()로 등록된 지표와 그 입력 노드들을 위상 정렬 순서로 보관하며,
+    봉이 하나 마감될 때마다 공유 노드(EMA 등)를 포함한 모든 노드를 정확히 한 번씩 계산합니다.
+    """
+
+    def __init__(self, ticker, market, interval):
+        self.ticker = ticker
+        self.market = market
+        self.interval = interval
+
+        self.nodes = {}      # {key: IndicatorNode}
+        self.order = []      # 위상 정렬된 노드 키 목록
+        self.states = {}     # {key: 노드 상태}
+        self.values = {}     # {key: 마지막 마감 봉 기준 값}
+        self.listeners = {}  # {key: [callback(ts, value)]}
+        self._ancestors = {}
+
+        self.bar_count = 0
+        self.last_ts = None
+        self.last_close = None
+
+        # 마감 봉 시각/종가 링 버퍼 (가장 긴 지표 lookback 크기로 미리 할당)
+        self.ts_buffer = RingBuffer(1, dtype='datetime64[s]')
+        self.close_buffer = RingBuffer(1, dtype=np.float64)
+
+        # 아직 형성 중인 최신 봉의 가격 (미리보기 계산용, 실시간 현재가로 갱신 가능)
+        self.partial_close = None
+
+        # 일봉 그래프의 마감 봉 적재 기준 세션일 (미국 현지 YYYYMMDD)
+        self.session_date = None
+
+    def require(self, key):
+        """지표 노드 등록 (입력 노드 자동 등록)"""
+        if key in self.nodes:
+            return key
+
+        node = IndicatorRegistry.create(key)
+        for input_key in node.inputs():
+            self.require(input_key)
+
+        self.nodes[key] = node
+        self.order.append(key)
+        self.states[key] = node.initialState()
+        self.values[key] = None
+        self._ancestors.clear()
+
+        capacity = max(self.nodes[node_key].lookback() for node_key in self.order)
+        if capacity > self.close_buffer.capacity:
+            self.ts_buffer.resize(capacity)
+            self.close_buffer.resize(capacity)
+        return key
+
+    def addListener(self, key, callback: Callable):
+        """마감 봉에서 노드 값이 None이 아닐 때 호출할 콜백 등록"""
+        self.require(key)
+        self.listeners.setdefault(key, []).append(callback)
+
+    def _getAncestors(self, keys):
+        """지정 노드 계산에 필요한 노드만 위상 정렬 순서로 반환"""
+        cache_key = tuple(keys)
+        if cache_key not in self._ancestors:
+            needed = set()
+            stack = list(keys)
+            while stack:
+                key = stack.pop()
+                if key in needed:
+                    continue
+                needed.add(key)
+                stack.extend(self.nodes[key].inputs())
+            self._ancestors[cache_key] = [key for key in self.order if key in needed]
+        return self._ancestors[cache_key]
+
+    def _compute(self, close, order):
+        states = {}
+        values = {}
+        for key in order:
+            node = self.nodes[key]
+            inputs = [values[input_key] for input_key in node.inputs()]
+            states[key], values[key] = node.step(self.states[key], inputs, close)
+        return states, values
+
+    def appendBar(self, ts, close):
+        """마감된 봉 1개 반영 (모든 노드를 1회씩 계산 후 상태 확정)"""
+        states, values = self._compute(close, self.order)
+        self.states = states
+        self.values = values
+        self.bar_count += 1
+        self.last_ts = ts
+        self.last_close = close
+        self.ts_buffer.append(ts)
+        self.close_buffer.append(close)
+
+        for key, callbacks in self.listeners.items():
+            value = values.get(key)
+            if value is None:
+                continue
+            for callback in callbacks:
+                callback(ts, value)
+
+    def previewBar(self, close, keys=None):
+        """확정 상태를 바꾸지 않고 미완성 봉을 가정한 지표 값 계산
+        Args:
+            close (float): 가정할 가격
+            keys (list): 필요한 노드 키 목록 (None이면 전체)
+        Returns:
+            dict: {key: 값}
+        """
+        order = self.order if keys is None else self._getAncestors(keys)
+        _, values = self._compute(close, order)
+        return values
+
+    def closeView(self, count=None):
+        """최근 마감 봉 종가 연속 뷰 (시간순, 복사 없음)"""
+        return self.close_buffer.view(count)
+
+    def tsView(self, count=None):
+        """최근 마감 봉 시각 연속 뷰 (시간순, 복사 없음)"""
+        return self.ts_buffer.view(count)
+
+    def reset(self):
+        """마감 봉 상태 초기화 (노드 등록은 유지)"""
+        self.states = {key: self.nodes[key].initialState() for key in self.order}
+        self.values = {key: None for key in self.order}
+        self.bar_count = 0
+        self.last_ts = None
+        self.last_close = None
+        self.ts_buffer.clear()
+        self.close_buffer.clear()
+        self.session_date = None
+
+    def exportState(self):
+        """체크포인트용 상태 사본 (노드 정의/리스너 제외)"""
+        return copy.deepcopy({
+            'keys': list(self.order),
+            'states': self.states,
+            'values': self.values,
+            'bar_count': self.bar_count,
+            'last_ts': self.last_ts,
+            'last_close': self.last_close,
+            'ts_buffer': self.ts_buffer,
+            'close_buffer': self.close_buffer,
+            'partial_close': self.partial_close,
+            'session_date': self.session_date
+        })
+
+    def restoreState(self, state):
+        """체크포인트 상태 복원 (등록된 노드 구성이 같을 때만)
+        Returns:
+            bool: 복원 여부
+        """
+        if set(state['keys']) != set(self.order):
+            return False
+
+        self.states = dict(state['states'])
+        self.values = dict(state['values'])
+        self.bar_count = state['bar_count']
+        self.last_ts = state['last_ts']
+        self.last_close = state['last_close']
+        self.partial_close = state['partial_close']
+        self.session_date = state['session_date']
+        self.ts_buffer = state['ts_buffer']
+        self.close_buffer = state['close_buffer']
+
+        capacity = max(self.nodes[key].lookback() for key in self.order)
+        if capacity > self.close_buffer.capacity:
+            self.ts_buffer.resize(capacity)
+            self.close_buffer.resize(capacity)
+        return True
+
+    def value(self, key):
+        """마지막 마감 봉 기준 노드 값"""
+        return self.values.get(key)
+
+    def state(self, key):
+        """노드의 현재 확정 상태"""
+        return self.states.get(key)
+
+
+class IndicatorEngine:
+    """지표 계산 엔진
+
+    (종목, 인터벌)별 IndicatorGraph를 관리하고, 사이클마다 차트를 한 번만 조회해
+    마감된 신규 봉을 그래프에 반영합니다. 같은 인터벌을 쓰는 지표들은
+    차트 조회와 공유 노드 계산을 함께 사용하므로 지표를 추가해도 I/O가 늘지 않습니다.
+    """
+
+    def __init__(self, kis_price: Optional[KisPrice] = None):
+        self.logger = LoggerUtil().get_logger()
+        self.kis_price = kis_price if kis_price is not None else KisPrice()
+
+        self.graphs = {}       # {(ticker, interval): IndicatorGraph}
+        self.cycle = 0
+        self.refreshed = {}    # {(ticker, interval): 마지막 조회 사이클}
+        self.live_prices = {}  # {ticker: (반영 사이클, 실시간 현재가)}
+        self.archive = None    # 조회한 마감 봉 기록 대상 (BarArchive, 미설정 시 기록 안 함)
+        self.latency_tracer = None  # 차트 조회/지표 계산 구간 지연 추적 (LatencyTracer, 미설정 시 기록 안 함)
+
+    def setArchive(self, archive):
+        """차트 조회 시 마감 봉을 기록할 아카이브 설정"""
+        self.archive = archive
+
+    def setLatencyTracer(self, latency_tracer):
+        """차트 조회/지표 계산 구간 지연 추적기 설정"""
+        self.latency_tracer = latency_tracer
+
+    def _span(self, stage, key):
+        """구간 측정 컨텍스트 (추적기가 없으면 아무것도 하지 않음)"""
+        return self.latency_tracer.span(stage, key) if self.latency_tracer is not None else nullcontext()
+
+    def getGraph(self, ticker, market, interval):
+        """(종목, 인터벌) 그래프 조회 (없으면 생성)"""
+        graph_key = (ticker, interval)
+        if graph_key not in self.graphs:
+            self.graphs[graph_key] = IndicatorGraph(ticker, market, interval)
+        return self.graphs[graph_key]
+
+    def beginCycle(self):
+        """새 매매 사이클 시작 (그래프별 차트 조회는 사이클당 1회)"""
+        self.cycle += 1
+
+    def updateLivePrice(self, ticker, price):
+        """실시간 현재가를 종목 그래프들의 미완성 봉 가격으로 반영"""
+        if price is None or price <= 0:
+            return
+        self.live_prices[ticker] = (self.cycle, price)
+        for (graph_ticker, _), graph in self.graphs.items():
+            if graph_ticker == ticker:
+                graph.partial_close = price
+
+    def refreshTicker(self, ticker):
+        """종목에 등록된 모든 인터벌 그래프 갱신"""
+        for graph_ticker, interval in list(self.graphs.keys()):
+            if graph_ticker == ticker:
+                self.refresh(ticker, interval)
+
+    def refresh(self, ticker, interval, force=False):
+        """차트를 조회해 마감된 신규 봉을 그래프에 반영
+        Returns:
+            int: 새로 반영된 봉 개수
+        """
+        graph_key = (ticker, interval)
+        graph = self.graphs.get(graph_key)
+        if graph is None:
+            return 0
+
+        if not force and self.refreshed.get(graph_key) == self.cycle:
+            return 0
+
+        # 마감된 일봉은 장중에 바뀌지 않으므로 세션당 1회만 조회
+        # (당일 봉은 실시간 현재가를 미완성 봉으로 합성해 계산)
+        if not force and graph.interval == "day" and graph.session_date == DateTimeUtil.get_us_date_str():
+            return 0
+
+        try:
+            with self._span("chart_fetch", ticker):
+                chart_data = self._getChartData(graph)
+            if not chart_data:
+                self.logger.warning(f"{ticker} {interval} 차트 데이터 조회 실패")
+                return 0
+
+            self.refreshed[graph_key] = self.cycle
+            with self._span("indicator", ticker):
+                return self.feedChart(graph, chart_data)
+
+        except Exception as e:
+            self.logger.error(f"{ticker} {interval} 지표 갱신 중 오류: {e}")
+            return 0
+
+    def exportState(self):
+        """체크포인트용 그래프별 상태 {(ticker, interval): 상태}"""
+        return {graph_key: graph.exportState() for graph_key, graph in self.graphs.items()}
+
+    def restoreState(self, states):
+        """체크포인트 그래프 상태 복원
+        Returns:
+            int: 복원된 그래프 수
+        """
+        restored = 0
+        for graph_key, state in states.items():
+            graph = self.graphs.get(graph_key)
+            if graph is not None and graph.restoreState(state):
+                restored += 1
+        return restored
+
+    def seedChart(self, ticker, interval, chart_data):
+        """다른 경로(시작 시 데이터 연결 확인 등)에서 이미 조회한 차트로 그래프 초기화
+        Returns:
+            int: 새로 반영된 봉 개수 (해당 그래프가 없으면 0)
+        """
+        graph = self.graphs.get((ticker, interval))
+        if graph is None or not chart_data:
+            return 0
+        return self.feedChart(graph, chart_data)
+
+    def feedChart(self, graph, chart_data):
+        """차트 응답(최신순)을 그래프에 반영 (최신 봉은 미완성 봉으로 취급)"""
+        chart = ChartUtil.parse_chart(chart_data, ChartUtil.get_tr_id(graph.interval))
+        if len(chart.close) == 0:
+            return 0
+
+        if graph.interval == "day":
+            # 당일(미국 현지) 일봉은 형성 중이므로 전일까지만 마감 봉으로 반영
+            session_date = DateTimeUtil.get_us_date_str()
+            session_start = np.datetime64(f"{session_date[:4]}-{session_date[4:6]}-{session_date[6:]}", 's')
+            closed_count = int(np.searchsorted(chart.ts, session_start, side='left'))
+            graph.session_date = session_date
+        else:
+            # 가장 최근 봉은 아직 형성 중이므로 마감 봉에서 제외
+            closed_count = len(chart.close) - 1
+
+        # 조회한 마감 봉 기록 요청 (파일 기록은 아카이브 기록 스레드에서 처리)
+        if self.archive is not None and closed_count > 0:
+            try:
+                self.archive.write(graph.ticker, graph.interval, chart, closed_count)
+            except Exception as e:
+                self.logger.error(f"{graph.ticker} {graph.interval} 봉 아카이브 기록 실패: {e}")
+
+        # 이번 사이클에 반영된 실시간 현재가가 있으면 차트 값보다 우선
+        live_cycle, live_price = self.live_prices.get(graph.ticker, (None, None))
+        if live_cycle == self.cycle:
+            graph.partial_close = live_price
+        elif closed_count < len(chart.close):
+            graph.partial_close = float(chart.close[-1])
+
+        # 마지막 반영 봉과 차트 사이에 빠진 봉이 있으면(재시작 공백 등) 차트로 다시 구성
+        if graph.last_ts is not None and closed_count > 0 and chart.ts[0] > np.datetime64(graph.last_ts, 's'):
+            self.logger.info(f"{graph.ticker} {graph.interval} 마감 봉 공백 감지 - 차트로 지표 상태 재구성")
+            graph.reset()
+            if graph.interval == "day":
+                graph.session_date = session_date
+
+        # 이미 반영된 봉 이후의 마감 봉만 추가
+        start = 0
+        if graph.last_ts is not None:
+            start = int(np.searchsorted(chart.ts[:closed_count], np.datetime64(graph.last_ts, 's'), side='right'))
+
+        new_ts = chart.ts[start:closed_count].tolist()
+        new_close = chart.close[start:closed_count].tolist()
+        for ts, price in zip(new_ts, new_close):
+            graph.appendBar(ts, price)
+
+        return len(new_close)
+
+    def _getChartData(self, graph):
+        """인터벌에 따라 일봉/분봉 차트 조회"""
+        if graph.interval == "day":
+            return self.kis_price.getDailyPrice(
+                market=graph.market,
+                ticker=graph.ticker,
+                base_date=""
+            )
+        return self.kis_price.getMinuteChartPrice(
+            market=graph.market,
+            ticker=graph.ticker,
+            time_frame=graph.interval,
+            include_prev_day="1"
+        )
@@ -0,0 +1,195 @@
+"""
+종목별 작업 스케줄러 모듈 (주기/우선순위/마감시한)
+"""
+
+import heapq
+import itertools
+import time as time_module
+from datetime import timedelta
+from typing import Callable
+from bar_scheduler import BarScheduler
+from utils.datetime_util import DateTimeUtil
+from utils.logger_util import LoggerUtil
+
+
+class ScheduledJob:
+    """(종목, 작업 종류)별 예약 작업"""
+
+    def __init__(self, ticker, job_type, callback: Callable, period_seconds, priority, deadline_seconds):
+        self.ticker = ticker
+        self.job_type = job_type
+        self.callback = callback
+        self.period_seconds = period_seconds
+        self.priority = priority
+        self.deadline = timedelta(seconds=deadline_seconds)
+
+        self.boundary = None  # 다음 실행 봉 경계
+        self.avg_duration = 0.0  # 실행 시간 지수이동평균 (초), 부하 차단 판단에 사용
+        self.runs = 0
+        self.sheds = 0
+        self.consecutive_sheds = 0  # 연속 차단 횟수 (같은 우선순위 내에서 먼저 실행해 기아 방지)
+        self.deadline_misses = 0
+
+    @property
+    def key(self):
+        return (self.ticker, self.job_type)
+
+    def recordDuration(self, duration):
+        """실행 시간 기록"""
+        self.avg_duration = duration if self.runs == 0 else self.avg_duration * 0.8 + duration * 0.2
+        self.runs += 1
+
+
+class JobScheduler:
+    """우선순위 큐 기반 작업 스케줄러
+
+    각 작업은 자신의 주기로 봉 경계(장 시작 기준, 마감 대기 포함)에 맞춰 예약되며,
+    같은 시각에 예약된 작업은 우선순위 순으로 실행됩니다. 낮은 우선순위 작업은
+    실행 시 다음 고우선순위 작업 예정 시각(또는 사이클 예산)을 넘길 것으로 예상되면
+    이번 회차를 건너뛰고(shed) 다음 주기로 미뤄집니다. 고우선순위 작업은 차단하지 않습니다.
+    """
+
+    PRIORITY_HIGH = 0
+    PRIORITY_NORMAL = 1
+    PRIORITY_LOW = 2
+
+    def __init__(self, bar_scheduler: BarScheduler, cycle_budget_seconds=None):
+        """
+        Args:
+            bar_scheduler (BarScheduler): 봉 경계 계산 및 스케줄 지연 기록에 사용
+            cycle_budget_seconds (float): 한 회차 최대 실행 시간 (초, None이면 다음 고우선순위 작업까지)
+        """
+        self.logger = LoggerUtil().get_logger()
+        self.bar_scheduler = bar_scheduler
+        self.cycle_budget_seconds = cycle_budget_seconds
+
+        self.jobs = {}  # {(ticker, job_type): ScheduledJob}
+        self.queue = []  # [(깨어날 시각, 우선순위, 순번, 작업)]
+        self.sequence = itertools.count()
+
+    def addJob(self, ticker, job_type, callback: Callable, period_seconds, priority, deadline_seconds):
+        """작업 등록
+        Args:
+            ticker (str): 종목 코드 (계좌 단위 작업은 None)
+            job_type (str): 작업 종류
+            callback (Callable): callback(job, boundary) 형태의 실행 함수
+            period_seconds (int): 실행 주기 (초)
+            priority (int): 우선순위 (작을수록 먼저 실행)
+            deadline_seconds (float): 예정 시각 이후 완료되어야 하는 시한 (초)
+        """
+        job = ScheduledJob(ticker, job_type, callback, period_seconds, priority, deadline_seconds)
+        self.jobs[job.key] = job
+        return job
+
+    def start(self, now=None):
+        """등록된 모든 작업을 현재 시각 이후 첫 경계로 예약"""
+        now = now or DateTimeUtil.get_us_now()
+        self.queue = []
+        for job in self.jobs.values():
+            job.boundary = None
+            self._schedule(job, now)
+
+    def _schedule(self, job, now):
+        """작업을 now 이후 첫 봉 경계로 예약 (같은 경계 재실행 방지)"""
+        boundary = self.bar_scheduler.nextBoundary(job.period_seconds, now)
+        if job.boundary is not None and boundary <= job.boundary:
+            boundary = job.boundary + timedelta(seconds=job.period_seconds)
+        job.boundary = boundary
+        heapq.heappush(self.queue, (boundary + self.bar_scheduler.settle, job.priority, next(self.sequence), job))
+
+    def getNextWakeup(self):
+        """가장 이른 작업 예정 시각 (등록 작업이 없으면 None)"""
+        return self.queue[0][0] if self.queue else None
+
+    def _nextHighPriorityWakeup(self):
+        """대기 중인 고우선순위 작업 중 가장 이른 예정 시각"""
+        wakeups = [wakeup for wakeup, priority, _, _ in self.queue if priority == self.PRIORITY_HIGH]
+        return min(wakeups) if wakeups else None
+
+    def popDueJobs(self, now):
+        """now까지 예정된 작업을 (우선순위, 연속 차단 많은 순, 예정 시각) 순으로 꺼냄"""
+        due = []
+        while self.queue and self.queue[0][0] <= now:
+            due.append(heapq.heappop(self.queue))
+        due.sort(key=lambda item: (item[1], -item[3].consecutive_sheds, item[0], item[2]))
+        return due
+
+    def runDue(self, now=None, stop_event=None):
+        """예정된 작업 실행 (고우선순위 우선, 초과 예상 시 저우선순위 작업 차단)
+
+        Returns:
+            dict: 회차 요약 (실행/차단/시한 초과 작업 수, 스케줄 지연)
+        """
+        now = now or DateTimeUtil.get_us_now()
+        due = self.popDueJobs(now)
+        summary = {"ran": 0, "shed": 0, "deadline_misses": 0, "lag": 0.0}
+        if not due:
+            return summary
+
+        # 스케줄 지연 기록 (가장 이른 예정 시각 기준)
+        first_wakeup = min(item[0] for item in due)
+        boundary = first_wakeup - self.bar_scheduler.settle
+        summary["lag"] = self.bar_scheduler.recordRun(
+            first_wakeup, self.bar_scheduler.getDueTokens(boundary), boundary, started_at=now
+        )
+
+        # 이번 회차 실행 예산: 다음 고우선순위 작업 예정 시각 (없으면 사이클 예산)
+        started = time_module.monotonic()
+        budget_end = None
+        next_high = self._nextHighPriorityWakeup()
+        if next_high is not None:
+            budget_end = started + max(0.0, (next_high - now).total_seconds())
+        if self.cycle_budget_seconds is not None:
+            budget_limit = started + self.cycle_budget_seconds
+            budget_end = budget_limit if budget_end is None else min(budget_end, budget_limit)
+
+        for wakeup, priority, _, job in due:
+            if stop_event is not None and stop_event.is_set():
+                # 종료 요청 시 남은 작업은 다시 예약만 해 둠
+                self._schedule(job, now)
+                continue
+
+            if priority != self.PRIORITY_HIGH and budget_end is not None:
+                if time_module.monotonic() + job.avg_duration > budget_end:
+                    job.sheds += 1
+                    job.consecutive_sheds += 1
+                    summary["shed"] += 1
+                    self.logger.warning(
+                        f"{job.ticker or '계좌'} {job.job_type} 작업 건너뜀: 예상 {job.avg_duration:.2f}초가 회차 예산 초과"
+                    )
+                    self._schedule(job, DateTimeUtil.get_us_now())
+                    continue
+
+            job.consecutive_sheds = 0
+            job_started = time_module.monotonic()
+            try:
+                job.callback(job, wakeup - self.bar_scheduler.settle)
+            except Exception as e:
+                self.logger.error(f"{job.ticker or '계좌'} {job.job_type} 작업 실행 중 오류: {e}")
+            finally:
+                job.recordDuration(time_module.monotonic() - job_started)
+                summary["ran"] += 1
+
+            finished_at = DateTimeUtil.get_us_now()
+            if finished_at > wakeup + job.deadline:
+                job.deadline_misses += 1
+                summary["deadline_misses"] += 1
+                self.logger.warning(
+                    f"{job.ticker or '계좌'} {job.job_type} 작업 시한 초과: "
+                    f"{(finished_at - wakeup).total_seconds():.2f}초 (시한 {job.deadline.total_seconds():.0f}초)"
+                )
+            self._schedule(job, finished_at)
+
+        return summary
+
+    def getJobStats(self):
+        """작업 종류별 실행/차단/시한 초과 통계"""
+        stats = {}
+        for job in self.jobs.values():
+            entry = stats.setdefault(job.job_type, {"jobs": 0, "runs": 0, "sheds": 0, "deadline_misses": 0, "avg_duration": 0.0})
+            entry["jobs"] += 1
+            entry["runs"] += job.runs
+            entry["sheds"] += job.sheds
+            entry["deadline_misses"] += job.deadline_misses
+            entry["avg_duration"] += (job.avg_duration - entry["avg_duration"]) / entry["jobs"]
+        return stats
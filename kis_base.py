@@ -1,12 +1,63 @@
 import os
 import requests
 import json
+import threading
+import time
 import traceback
-from utils.token_manager import getToken
+from requests.adapters import HTTPAdapter
+from utils.token_manager import getToken, refreshToken
+from utils.rate_limiter import RateLimiter
 from utils.logger_util import LoggerUtil
 
 class KisBase:
-    """한국투자증권 API 기본 클래스 - 공통 인증 및 요청 처리"""
+    """한국투자증권 API 기본 클래스 - 공통 인증 및 요청 처리
+    
+    모든 API 객체는 토큰(메모리 캐시), HTTP 세션(연결 재사용), 요청 간격 제한기를 공유합니다.
+    """
+    
+    _session = None
+    _session_lock = threading.Lock()
+    _rate_limiter = RateLimiter(float(os.getenv("API_REQUEST_INTERVAL_SECONDS", "0.5")))
+    _capture_log = None  # REST 응답/WebSocket 프레임 캡처 (CaptureLog, 미설정 시 기록 안 함)
+    _latency_tracer = None  # TR ID별 요청 지연 추적 (LatencyTracer, 미설정 시 기록 안 함)
+    
+    @classmethod
+    def getSession(cls):
+        """공유 HTTP 세션 (동시 요청 수만큼 연결 풀 유지)"""
+        if cls._session is None:
+            with cls._session_lock:
+                if cls._session is None:
+                    session = requests.Session()
+                    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16)
+                    session.mount("https://", adapter)
+                    session.mount("http://", adapter)
+                    cls._session = session
+        return cls._session
+    
+    @classmethod
+    def getRateLimiter(cls):
+        """공유 요청 간격 제한기"""
+        return cls._rate_limiter
+    
+    @classmethod
+    def setCaptureLog(cls, capture_log):
+        """모든 API 객체가 공유하는 캡처 로그 설정 (None이면 기록 중지)"""
+        KisBase._capture_log = capture_log
+    
+    @classmethod
+    def getCaptureLog(cls):
+        """공유 캡처 로그 (없으면 None)"""
+        return KisBase._capture_log
+    
+    @classmethod
+    def setLatencyTracer(cls, latency_tracer):
+        """모든 API 객체가 공유하는 지연 추적기 설정 (None이면 기록 중지)"""
+        KisBase._latency_tracer = latency_tracer
+    
+    @classmethod
+    def getLatencyTracer(cls):
+        """공유 지연 추적기 (없으면 None)"""
+        return KisBase._latency_tracer
     
     def __init__(self):
         # 로거 초기화
@@ -25,8 +76,13 @@ class KisBase:
         self.cano = self.account_no[:8]
         self.acnt_prdt_cd = self.account_no[8:]
         
-        # 토큰 발급
-        self.access_token = getToken()
+        # 토큰 발급 (프로세스 내 공유 캐시)
+        getToken()
+    
+    @property
+    def access_token(self):
+        """공유 토큰 (다른 객체가 재발급한 토큰도 바로 반영)"""
+        return getToken()
     
     def getHeaders(self, tr_id, tr_cont=""):
         """공통 헤더 생성"""
@@ -50,32 +106,39 @@ class KisBase:
     
     def sendRequest(self, method, path, tr_id, params=None, body=None, retry_count=0, tr_cont=""):
         """API 요청 전송 공통 메서드"""
-        import time
-        
-        # API 요청 빈도 제한 (0.1초 대기)
-        time.sleep(0.5)
+        # API 요청 빈도 제한 (모든 객체/스레드 공통 간격, 직전 요청 후 충분히 지났으면 대기 없음)
+        rate_wait = self.getRateLimiter().acquire()
         
         url = f"{self.api_base}/{path}"
         headers = self.getHeaders(tr_id, tr_cont)
+        session = self.getSession()
+        latency_tracer = KisBase._latency_tracer
+        started = time.perf_counter()
+        retried = False
         
         try:
             if method.upper() == "GET":
-                response = requests.get(url, headers=headers, params=params)
+                response = session.get(url, headers=headers, params=params)
             elif method.upper() == "POST":
-                response = requests.post(url, headers=headers, data=json.dumps(body))
+                response = session.post(url, headers=headers, data=json.dumps(body))
             else:
                 raise ValueError(f"지원하지 않는 HTTP 메서드: {method}")
             
+            capture_log = KisBase._capture_log
+            if capture_log is not None:
+                capture_log.append_rest(method, path, tr_id, params, body, response.status_code, response.content)
+            
             res_data = response.json()
             
             # 토큰 만료 에러 체크 (응답 코드와 상관없이 먼저 확인)
             if res_data.get('msg_cd') == 'EGW00123' and retry_count == 0:
                 self.logger.info("토큰이 만료되어 자동 갱신을 시도합니다.")
                 try:
-                    # 토큰 재발급
-                    self.access_token = getToken()
+                    # 토큰 재발급 (다른 스레드가 이미 재발급했으면 그 토큰 사용)
+                    refreshToken(headers["authorization"].split(" ", 1)[1])
                     self.logger.info("토큰 갱신 완료, API 요청을 다시 시도합니다.")
                     # 갱신된 토큰으로 재시도 (1회만)
+                    retried = True
                     return self.sendRequest(method, path, tr_id, params, body, retry_count + 1, tr_cont)
                 except Exception as token_error:
                     self.logger.error(f"토큰 갱신 실패: {token_error}")
@@ -98,6 +161,15 @@ class KisBase:
             self.logger.error(f"API 요청 중 오류 발생: {e}")
             self.logger.error(traceback.format_exc())
             raise e 
+        
+        finally:
+            # 간격 제한 대기와 요청/응답 처리 시간을 나눠 기록
+            # (토큰 갱신 후 재시도했으면 재시도 요청이 기록하므로 바깥 요청은 토큰 갱신/재시도 시간이 섞이지 않도록 기록하지 않음)
+            if latency_tracer is not None:
+                if not retried:
+                    latency_tracer.record(f"api:{tr_id}", time.perf_counter() - started)
+                if rate_wait > 0:
+                    latency_tracer.record("rate_wait", rate_wait)
     
     def changeMarketCode(self, market, length=3):
         """ 거래소 코드 포맷 변경 
@@ -124,4 +196,17 @@ class KisBase:
         elif length == 4:
             return market_map_4.get(market, market)
         else:
-            return market
\ No newline at end of file
+            return market
+
+    @staticmethod
+    def normalizeOrderNo(order_no):
+        """ 주문번호 정규화 (주문 응답/주문체결내역/체결통보마다 다른 앞자리 0 패딩 제거)
+        Args:
+            order_no (str): 주문번호
+        Returns:
+            str: 정규화한 주문번호 (없으면 빈 문자열)
+        """
+        order_no = str(order_no or '').strip()
+        if order_no.isdigit():
+            return str(int(order_no))
+        return order_no
@@ -1,37 +1,181 @@
 import asyncio
 import json
 import os
+import random
 import requests
-import websockets
+import time
+from collections import Counter, namedtuple
 from typing import Dict, List, Optional, Callable
-from Crypto.Cipher import AES
-from Crypto.Util.Padding import unpad
 from base64 import b64decode
 from kis_base import KisBase
 from utils.logger_util import LoggerUtil
 
 
+# 해외주식 체결통보 레코드 필드 (수신 순서)
+EXECUTION_FIELDS = (
+    'customer_id', 'account_no', 'order_no', 'original_order_no', 'buy_sell_gb',
+    'correction_gb', 'order_type', 'ticker', 'execution_qty', 'execution_price',
+    'execution_time', 'reject_yn', 'execution_yn', 'accept_yn', 'branch_no',
+    'order_qty', 'account_name', 'stock_name', 'overseas_gb', 'collateral_type',
+    'collateral_date'
+)
+EXECUTION_DEFAULTS = tuple('0' if name in ('execution_qty', 'execution_price', 'order_qty') else ''
+                           for name in EXECUTION_FIELDS)
+
+
+class ExecutionRecord(namedtuple('ExecutionRecordBase', EXECUTION_FIELDS + ('qty', 'price', 'order_quantity'))):
+    """체결통보 레코드 (원문 문자열 필드 + 숫자 변환 필드 qty/price/order_quantity)
+
+    price는 체결단가(소수점 4자리 포함 정수 문자열)를 달러로 변환한 값입니다.
+    """
+
+    __slots__ = ()
+
+    @classmethod
+    def from_fields(cls, fields):
+        """'^' 분리 필드 목록으로 레코드 생성 (부족한 필드는 기본값)"""
+        count = len(EXECUTION_FIELDS)
+        values = tuple(fields[:count]) + EXECUTION_DEFAULTS[len(fields):]
+        return tuple.__new__(cls, values + (
+            cls._toInt(values[8]),
+            cls._toInt(values[9]) / 10000,
+            cls._toInt(values[15])
+        ))
+
+    @staticmethod
+    def _toInt(value):
+        try:
+            return int(value)
+        except ValueError:
+            try:
+                return int(float(value))
+            except ValueError:
+                return 0
+
+    def get(self, name, default=None):
+        """dict 형태 체결통보를 사용하던 호출부 호환용 조회"""
+        return getattr(self, name, default)
+
+
+class SubscriptionRegistry:
+    """실시간 구독 (tr_id, tr_key)을 세션당 등록 한도에 맞춰 여러 WebSocket 세션에 배정하는 레지스트리
+
+    필요한 세션 수는 ceil(구독 수 / 세션당 한도)이며, 새 구독은 앞 번호 세션의 빈자리부터 채웁니다.
+    구독이 줄어 세션 수가 줄면 뒤 세션의 구독을 앞 세션 빈자리로 옮기고,
+    변경 결과는 (세션 번호, tr_id, tr_key, tr_type) 등록('1')/해제('2') 작업 목록으로 돌려줍니다.
+    """
+
+    def __init__(self, max_per_session):
+        """
+        Args:
+            max_per_session (int): 세션당 최대 실시간 등록 수
+        """
+        self.max_per_session = max_per_session
+        self.assignments = {}  # {(tr_id, tr_key): 세션 번호}
+
+    def reset(self):
+        """배정 초기화 (모든 세션을 새로 연결할 때)"""
+        self.assignments = {}
+
+    def get_session_keys(self, session):
+        """세션에 배정된 구독 목록"""
+        return [key for key, assigned in self.assignments.items() if assigned == session]
+
+    def get_sessions(self):
+        """구독이 배정된 세션 번호 목록"""
+        return sorted(set(self.assignments.values()))
+
+    def get_load(self):
+        """세션별 구독 수"""
+        return dict(Counter(self.assignments.values()))
+
+    def rebalance(self, desired):
+        """원하는 구독 목록 기준으로 배정 갱신
+        Args:
+            desired (list): [(tr_id, tr_key), ...] (앞쪽일수록 앞 세션에 배정)
+        Returns:
+            list: [(세션 번호, tr_id, tr_key, tr_type)] - 해제('2') 작업이 등록('1') 작업보다 먼저 옴
+        """
+        desired = list(dict.fromkeys(desired))
+        wanted = set(desired)
+        needed = -(-len(desired) // self.max_per_session)
+        removes, adds = [], []
+
+        # 더 이상 원하지 않는 구독과 줄어든 세션 수를 넘는 세션의 구독 해제
+        for key, session in list(self.assignments.items()):
+            if key not in wanted or session >= needed:
+                del self.assignments[key]
+                removes.append((session, key[0], key[1], "2"))
+
+        # 미배정 구독(신규 + 이동)을 앞 세션 빈자리부터 배정
+        load = Counter(self.assignments.values())
+        for key in desired:
+            if key in self.assignments:
+                continue
+            session = next(i for i in range(needed) if load[i] < self.max_per_session)
+            self.assignments[key] = session
+            load[session] += 1
+            adds.append((session, key[0], key[1], "1"))
+
+        return removes + adds
+
+
 class KisWebSocket(KisBase):
     """한국투자증권 WebSocket 연결 관리 클래스"""
     
+    # 해외주식 실시간지연체결가 (레코드당 필드 수, 현재가(LAST) 필드 위치)
+    PRICE_TR_ID = "HDFSCNT0"
+    PRICE_FIELD_COUNT = 26
+    PRICE_SYMBOL_INDEX = 1
+    PRICE_LAST_INDEX = 11
+    
+    # 체결통보 큐가 가득 찼을 때 정책 (drop_newest: 새 통보 버림, drop_oldest: 가장 오래된 통보 버림)
+    OVERFLOW_POLICIES = ("drop_newest", "drop_oldest")
+    
     def __init__(self):
         super().__init__()
         self.logger = LoggerUtil().get_logger()
         
         # WebSocket 연결 정보
         self.ws_url = os.getenv("WS_URL_BASE")
-        self.websocket = None
         self.is_connected = False
+        self.approval_key = None  # 재연결 시 재사용 (연결 실패 시 재발급), 모든 세션 공용
+        
+        # 세션별 연결 (세션당 실시간 등록 한도를 넘는 구독은 추가 세션으로 분산, 수신은 하나의 처리 경로로 합침)
+        self.max_subscriptions_per_session = max(1, int(os.getenv("WS_MAX_SUBSCRIPTIONS_PER_SESSION", "41")))
+        self.registry = SubscriptionRegistry(self.max_subscriptions_per_session)
+        self.connections = {}  # {세션 번호: WebSocket 연결}
+        self.receive_tasks = {}  # {세션 번호: 수신 태스크}
+        self.session_last_message = {}  # {세션 번호: 마지막 수신 시각 (PINGPONG 포함, time.monotonic)}
+        self.session_lost = None  # 세션 하나라도 끊기면 설정되는 이벤트
         
         # 체결통보용 AES 키
         self.aes_key = None
         self.aes_iv = None
+        self._cipher = None  # (키, ECB 복호화기) - 키가 바뀔 때만 다시 생성
         
         # 콜백 함수들
         self.execution_callback = None
+        self.price_callback = None
+        self.market_data_bus = None  # 실시간 체결가 발행 대상 (MarketDataBus, "price" 피드)
+        
+        # 체결통보 처리 큐 (수신 루프는 큐에 넣기만 하고, 콜백은 소비자 태스크에서 실행)
+        # 주문번호별로 같은 소비자 큐에 배정해 같은 주문의 체결통보 순서를 보장
+        self.execution_queue_size = max(1, int(os.getenv("EXECUTION_QUEUE_SIZE", "256")))
+        self.execution_workers = max(1, int(os.getenv("EXECUTION_WORKERS", "2")))
+        self.execution_overflow = os.getenv("EXECUTION_QUEUE_OVERFLOW", "drop_newest")
+        if self.execution_overflow not in self.OVERFLOW_POLICIES:
+            self.logger.warning(f"알 수 없는 EXECUTION_QUEUE_OVERFLOW 값({self.execution_overflow}) - drop_newest 사용")
+            self.execution_overflow = "drop_newest"
+        self.execution_queues = []
+        self.execution_tasks = []
+        self.execution_stats = {
+            'received': 0, 'processed': 0, 'dropped': 0, 'errors': 0,
+            'max_depth': 0, 'max_wait_seconds': 0.0
+        }
         
-        # 구독 중인 종목들
-        self.subscribed_tickers = set()
+        # 실시간 체결가 구독 키 (D + 거래소코드 + 종목코드)
+        self.price_tr_keys = []
         
     def getApprovalKey(self):
         """WebSocket 접속 승인키 발급"""
@@ -57,158 +201,368 @@ class KisWebSocket(KisBase):
             raise e
     
     def aes_cbc_base64_dec(self, key: str, iv: str, cipher_text: str) -> str:
-        """AES256 복호화"""
+        """AES256(CBC) 복호화
+
+        CBC 복호화기는 IV 체인 상태를 가지므로 메시지마다 새로 만들어야 하지만,
+        상태가 없는 ECB 복호화기는 키당 한 번만 만들어 재사용하고 CBC 체인(이전 암호 블록 XOR)은 직접 계산합니다.
+        """
         try:
-            cipher = AES.new(key.encode('utf-8'), AES.MODE_CBC, iv.encode('utf-8'))
-            return bytes.decode(unpad(cipher.decrypt(b64decode(cipher_text)), AES.block_size))
+            cached = self._cipher
+            if cached is None or cached[0] != key:
+                # 암호화 라이브러리는 첫 체결통보 복호화 시점에 로드 (프로세스 시작 시간 단축)
+                from Crypto.Cipher import AES
+                cached = (key, AES.new(key.encode('utf-8'), AES.MODE_ECB))
+                self._cipher = cached
+
+            data = b64decode(cipher_text)
+            if not data or len(data) % 16:
+                raise ValueError(f"암호문 길이가 블록 크기의 배수가 아닙니다: {len(data)}")
+
+            # P_i = D(C_i) XOR C_(i-1), C_0 = IV (블록 전체를 정수 XOR 한 번으로 처리)
+            decrypted = cached[1].decrypt(data)
+            chain = iv.encode('utf-8') + data[:-16]
+            plain = (int.from_bytes(decrypted, 'big') ^ int.from_bytes(chain, 'big')).to_bytes(len(data), 'big')
+
+            # PKCS#7 패딩 제거
+            pad = plain[-1]
+            if pad < 1 or pad > 16 or plain[-pad:] != bytes([pad]) * pad:
+                raise ValueError("패딩이 올바르지 않습니다")
+            return plain[:-pad].decode('utf-8')
         except Exception as e:
             self.logger.error(f"AES 복호화 오류: {e}")
             raise e
     
     async def connect(self):
-        """WebSocket 연결"""
+        """WebSocket 연결 후 연결이 끊길 때까지 메시지 처리"""
+        await self.establish()
+        
+        # 메시지 처리 시작
+        await self.process_messages()
+    
+    async def establish(self):
+        """등록된 구독 전체를 세션별로 배정해 연결 및 구독 전송 (세션별 수신은 연결 직후 시작)"""
         try:
             self.logger.info(f"WebSocket 연결 시도: {self.ws_url}")
-            approval_key = self.getApprovalKey()
+            if not self.approval_key:
+                self.approval_key = self.getApprovalKey()
             
-            self.websocket = await websockets.connect(self.ws_url, ping_interval=None)
+            self.session_lost = asyncio.Event()
             self.is_connected = True
+            self.start_execution_workers()
             
-            # 체결통보 구독 설정
-            await self.subscribe_execution_notifications(approval_key)
-            
-            # 메시지 처리 시작
-            await self.process_messages()
+            self.registry.reset()
+            await self.apply_subscription_ops(self.registry.rebalance(self.get_desired_subscriptions()))
+            self.logger.info(f"실시간 구독 {len(self.registry.assignments)}건을 세션 {len(self.connections)}개로 연결 "
+                             f"(세션당 최대 {self.max_subscriptions_per_session}건)")
             
         except Exception as e:
             self.logger.error(f"WebSocket 연결 오류: {e}")
-            self.is_connected = False
+            await self.close_connection()
             raise e
     
-    async def subscribe_execution_notifications(self, approval_key: str):
-        """해외주식 체결통보 구독"""
+    def get_desired_subscriptions(self):
+        """등록할 전체 구독 목록 (체결통보가 항상 첫 세션에 배정되도록 맨 앞)"""
+        # 모의투자/실투자에 따른 TR ID 선택, HTS ID는 환경변수에서 가져오거나 기본값 사용
+        execution_tr_id = "H0GSCNI9" if self.is_virtual else "H0GSCNI0"
+        subscriptions = [(execution_tr_id, os.getenv("HTS_ID", "CLAUDE_BOT"))]
+        subscriptions += [(self.PRICE_TR_ID, tr_key) for tr_key in self.price_tr_keys]
+        return subscriptions
+    
+    async def open_session(self, session: int):
+        """세션 연결 및 수신 태스크 시작"""
+        # WebSocket 라이브러리는 연결 시점에 로드 (프로세스 시작 시간 단축)
+        import websockets
+        
+        websocket = await websockets.connect(self.ws_url, ping_interval=None)
+        self.connections[session] = websocket
+        self.session_last_message[session] = time.monotonic()
+        self.receive_tasks[session] = asyncio.create_task(self.receive_loop(session, websocket))
+        self.logger.info(f"WebSocket 세션 {session} 연결 완료")
+    
+    async def close_session(self, session: int):
+        """구독이 모두 빠진 세션 종료 (끊김으로 보지 않음)"""
+        websocket = self.connections.pop(session, None)
+        self.session_last_message.pop(session, None)
+        task = self.receive_tasks.pop(session, None)
+        if task:
+            task.cancel()
+        if websocket:
+            await websocket.close()
+            self.logger.info(f"WebSocket 세션 {session} 종료 (배정된 구독 없음)")
+    
+    async def apply_subscription_ops(self, ops: List):
+        """레지스트리 작업 목록 전송 (필요한 세션은 새로 연결, 비게 된 추가 세션은 종료)"""
+        for session, tr_id, tr_key, tr_type in ops:
+            if session not in self.connections:
+                if tr_type == "2":
+                    continue
+                await self.open_session(session)
+            await self.send_subscription(self.connections[session], tr_id, tr_key, tr_type)
+        
+        active_sessions = set(self.registry.get_sessions())
+        for session in list(self.connections):
+            if session and session not in active_sessions:
+                await self.close_session(session)
+    
+    async def send_subscription(self, websocket, tr_id: str, tr_key: str, tr_type: str = "1"):
+        """실시간 등록('1')/해제('2') 요청 전송"""
         try:
-            # 모의투자/실투자에 따른 TR ID 선택
-            tr_id = "H0GSCNI9" if self.is_virtual else "H0GSCNI0"
-            
-            # HTS ID는 환경변수에서 가져오거나 기본값 사용
-            hts_id = os.getenv("HTS_ID", "CLAUDE_BOT")
-            
             subscribe_data = {
                 "header": {
-                    "approval_key": approval_key,
+                    "approval_key": self.approval_key,
                     "custtype": "P",  # 개인
-                    "tr_type": "1",   # 등록
+                    "tr_type": tr_type,
                     "content-type": "utf-8"
                 },
                 "body": {
                     "input": {
                         "tr_id": tr_id,
-                        "tr_key": hts_id
+                        "tr_key": tr_key
                     }
                 }
             }
             
-            await self.websocket.send(json.dumps(subscribe_data))
+            await websocket.send(json.dumps(subscribe_data))
             
         except Exception as e:
-            self.logger.error(f"체결통보 구독 오류: {e}")
+            action = "구독" if tr_type == "1" else "구독 해제"
+            self.logger.error(f"실시간 {action} 오류 ({tr_id}, {tr_key}): {e}")
             raise e
     
+    async def update_price_subscriptions(self, symbols: List):
+        """연결 중 실시간 체결가 구독 종목 변경 (추가/해제분만 전송하고 세션 배정을 다시 맞춤)
+        Args:
+            symbols (list): [(거래소코드 3자리(NAS/NYS/AMS), 종목코드), ...]
+        """
+        self.set_price_subscriptions(symbols)
+        if not self.is_connected:
+            return  # 다음 연결 시 전체 구독
+        
+        ops = self.registry.rebalance(self.get_desired_subscriptions())
+        await self.apply_subscription_ops(ops)
+        if ops:
+            self.logger.info(f"실시간 구독 변경: 등록 {sum(op[3] == '1' for op in ops)}건, "
+                             f"해제 {sum(op[3] == '2' for op in ops)}건, 세션별 구독 수 {self.registry.get_load()}")
+    
     async def process_messages(self):
-        """WebSocket 메시지 처리"""
+        """WebSocket 메시지 처리 (세션 하나라도 끊기면 모든 세션을 닫고 반환)"""
+        if self.session_lost is None:
+            return
+        await self.session_lost.wait()
+        await self.close_connection()
+    
+    async def receive_loop(self, session: int, websocket):
+        """세션별 수신 루프 (모든 세션의 메시지는 같은 handle_message로 처리)"""
+        import websockets
+        
         try:
             while self.is_connected:
-                message = await self.websocket.recv()
-                await self.handle_message(message)
+                message = await websocket.recv()
+                self.session_last_message[session] = time.monotonic()
+                capture_log = KisBase._capture_log
+                if capture_log is not None:
+                    capture_log.append(capture_log.KIND_WS_FRAME, message)
+                await self.handle_message(message, websocket)
                 
         except websockets.exceptions.ConnectionClosed:
-            self.logger.warning("WebSocket 연결이 종료되었습니다")
-            self.is_connected = False
+            if self.is_connected:
+                self.logger.warning(f"WebSocket 세션 {session} 연결이 종료되었습니다")
         except Exception as e:
-            self.logger.error(f"메시지 처리 중 오류: {e}")
-            self.is_connected = False
+            self.logger.error(f"세션 {session} 메시지 처리 중 오류: {e}")
+        finally:
+            # 구독 변경으로 닫은 세션은 끊김으로 보지 않음
+            if self.connections.get(session) is websocket and self.session_lost is not None:
+                self.session_lost.set()
     
-    async def handle_message(self, message: str):
-        """개별 메시지 처리"""
+    async def handle_message(self, message: str, websocket=None):
+        """개별 메시지 처리 (websocket: 수신한 세션 연결, PINGPONG 응답용)"""
         try:
-            if message[0] == '1':  # 체결통보 데이터
-                await self.handle_execution_notification(message)
+            if message[0] == '1':  # 체결통보 데이터 (큐에 넣기만 하고 대기하지 않음)
+                self.handle_execution_notification(message)
+            elif message[0] == '0':  # 실시간 시세 데이터 (암호화 없음)
+                self.handle_price_message(message)
             else:
                 # JSON 응답 처리
                 json_data = json.loads(message)
                 tr_id = json_data.get("header", {}).get("tr_id")
                 
                 if tr_id == "PINGPONG":
-                    await self.handle_pingpong(message)
-                elif tr_id in ["H0GSCNI0", "H0GSCNI9"] or tr_id == "(null)":
+                    await self.handle_pingpong(message, websocket)
+                elif tr_id in ["H0GSCNI0", "H0GSCNI9", self.PRICE_TR_ID] or tr_id == "(null)":
                     await self.handle_subscription_response(json_data)
                 else:
-                    self.logger.debug(f"기타 메시지 수신: {message[:100]}...")
+                    self.logger.debug("기타 메시지 수신: %.100s...", message)
                     
         except Exception as e:
             self.logger.error(f"메시지 처리 오류: {e}")
             self.logger.error(f"원본 메시지: {message}")
     
-    async def handle_execution_notification(self, message: str):
-        """체결통보 데이터 처리"""
+    def handle_execution_notification(self, message: str):
+        """체결통보 데이터 처리 (한 메시지에 여러 건이 올 수 있음, 건별로 처리 큐에 적재)"""
         try:
-            parts = message.split('|')
-            if len(parts) < 4:
-                return
+            for execution_info in self.parse_execution_frame(message):
+                # 수신 루프 경로이므로 지연 포맷 (DEBUG 미만 레벨이면 포맷하지 않음, 체결 내용은 봇의 execution_notice 이벤트로 기록)
+                self.logger.debug("체결통보 수신: %s", execution_info)
                 
-            tr_id = parts[1]
-            encrypted_data = parts[3]
-            
-            if tr_id in ["H0GSCNI0", "H0GSCNI9"] and self.aes_key and self.aes_iv:
-                # AES 복호화
-                decrypted_data = self.aes_cbc_base64_dec(self.aes_key, self.aes_iv, encrypted_data)
-                execution_info = self.parse_execution_data(decrypted_data)
-                
-                self.logger.info(f"체결통보 수신: {execution_info}")
-                
-                # 콜백 함수 호출
                 if self.execution_callback:
-                    await self.execution_callback(execution_info)
+                    self.enqueue_execution(execution_info)
                     
         except Exception as e:
             self.logger.error(f"체결통보 처리 오류: {e}")
     
-    def parse_execution_data(self, data: str):
-        """체결통보 데이터 파싱"""
+    def enqueue_execution(self, record):
+        """체결통보를 주문번호별 소비자 큐에 적재 (대기하지 않음, 가득 차면 초과 정책 적용)"""
+        if not self.execution_tasks:
+            self.start_execution_workers()
+        
+        stats = self.execution_stats
+        stats['received'] += 1
+        queue = self.execution_queues[hash(record.order_no) % len(self.execution_queues)]
+        
+        if queue.full():
+            stats['dropped'] += 1
+            if self.execution_overflow == "drop_oldest":
+                dropped, _ = queue.get_nowait()
+                queue.task_done()
+            else:
+                dropped = record
+            self.logger.warning(f"체결통보 큐 가득 참 ({self.execution_overflow}): "
+                                f"주문번호 {dropped.order_no} {dropped.ticker} 체결통보 누락 "
+                                f"(누적 {stats['dropped']}건, 미체결 동기화에서 보정)")
+            if dropped is record:
+                return
+        
+        queue.put_nowait((record, time.monotonic()))
+        stats['max_depth'] = max(stats['max_depth'], queue.qsize())
+    
+    def start_execution_workers(self):
+        """체결통보 소비자 태스크 시작 (이벤트 루프 안에서 호출, 이미 실행 중이면 무시)"""
+        if self.execution_tasks:
+            return
+        if not self.execution_queues:
+            self.execution_queues = [asyncio.Queue(maxsize=self.execution_queue_size)
+                                     for _ in range(self.execution_workers)]
+        self.execution_tasks = [asyncio.create_task(self.execution_worker(queue))
+                                for queue in self.execution_queues]
+    
+    async def execution_worker(self, queue: asyncio.Queue):
+        """체결통보 소비자 (큐 순서대로 콜백 실행, 콜백 오류는 기록 후 계속)"""
+        stats = self.execution_stats
+        while True:
+            record, enqueued_at = await queue.get()
+            try:
+                stats['max_wait_seconds'] = max(stats['max_wait_seconds'], time.monotonic() - enqueued_at)
+                if self.execution_callback:
+                    await self.execution_callback(record)
+                stats['processed'] += 1
+            except Exception as e:
+                stats['errors'] += 1
+                self.logger.error(f"체결통보 콜백 오류 (주문번호 {record.order_no}): {e}")
+            finally:
+                queue.task_done()
+    
+    async def drain_execution_queue(self, timeout: float = 5.0):
+        """적재된 체결통보가 모두 처리될 때까지 최대 timeout 초 대기
+        Returns:
+            bool: 모두 처리되었는지 여부
+        """
+        if not self.execution_tasks:
+            return True
+        
         try:
-            fields = data.split('^')
-            
-            # 해외주식 체결통보 필드 매핑
-            execution_info = {
-                'customer_id': fields[0] if len(fields) > 0 else '',
-                'account_no': fields[1] if len(fields) > 1 else '',
-                'order_no': fields[2] if len(fields) > 2 else '',
-                'original_order_no': fields[3] if len(fields) > 3 else '',
-                'buy_sell_gb': fields[4] if len(fields) > 4 else '',
-                'correction_gb': fields[5] if len(fields) > 5 else '',
-                'order_type': fields[6] if len(fields) > 6 else '',
-                'ticker': fields[7] if len(fields) > 7 else '',
-                'execution_qty': fields[8] if len(fields) > 8 else '0',
-                'execution_price': fields[9] if len(fields) > 9 else '0',
-                'execution_time': fields[10] if len(fields) > 10 else '',
-                'reject_yn': fields[11] if len(fields) > 11 else '',
-                'execution_yn': fields[12] if len(fields) > 12 else '',
-                'accept_yn': fields[13] if len(fields) > 13 else '',
-                'branch_no': fields[14] if len(fields) > 14 else '',
-                'order_qty': fields[15] if len(fields) > 15 else '0',
-                'account_name': fields[16] if len(fields) > 16 else '',
-                'stock_name': fields[17] if len(fields) > 17 else '',
-                'overseas_gb': fields[18] if len(fields) > 18 else '',
-                'collateral_type': fields[19] if len(fields) > 19 else '',
-                'collateral_date': fields[20] if len(fields) > 20 else ''
-            }
-            
-            return execution_info
+            await asyncio.wait_for(asyncio.gather(*(queue.join() for queue in self.execution_queues)), timeout=timeout)
+            return True
+        except asyncio.TimeoutError:
+            remaining = sum(queue.qsize() for queue in self.execution_queues)
+            self.logger.warning(f"체결통보 큐 처리 대기 시간 초과 - 미처리 {remaining}건")
+            return False
+    
+    async def stop_execution_workers(self, timeout: float = 5.0):
+        """남은 체결통보를 timeout 초 동안 처리한 뒤 소비자 태스크 종료"""
+        if not self.execution_tasks:
+            return
+        
+        await self.drain_execution_queue(timeout)
+        
+        for task in self.execution_tasks:
+            task.cancel()
+        await asyncio.gather(*self.execution_tasks, return_exceptions=True)
+        self.execution_tasks = []
+        
+        stats = self.get_execution_queue_stats()
+        self.logger.info(f"체결통보 큐 통계: 수신 {stats['received']}건, 처리 {stats['processed']}건, "
+                         f"누락 {stats['dropped']}건, 오류 {stats['errors']}건, 최대 적재 {stats['max_depth']}건, "
+                         f"최대 대기 {stats['max_wait_seconds'] * 1000:.1f}ms")
+    
+    def get_execution_queue_stats(self):
+        """체결통보 큐 지표 (수신/처리/누락/오류 건수, 현재/최대 적재량, 최대 대기 시간)"""
+        return {
+            **self.execution_stats,
+            'depth': sum(queue.qsize() for queue in self.execution_queues),
+            'workers': self.execution_workers,
+            'capacity': self.execution_queue_size,
+            'overflow_policy': self.execution_overflow
+        }
+    
+    def parse_execution_frame(self, message: str):
+        """체결통보 메시지(암호화 여부|TR ID|건수|데이터) 파싱
+        Returns:
+            list: ExecutionRecord 목록 (체결통보가 아니거나 키가 없으면 빈 목록)
+        """
+        parts = message.split('|', 3)
+        if len(parts) < 4:
+            return []
+        
+        tr_id = parts[1]
+        if tr_id not in ("H0GSCNI0", "H0GSCNI9") or not (self.aes_key and self.aes_iv):
+            return []
+        
+        # AES 복호화 (여러 건이어도 데이터는 하나의 암호문)
+        decrypted_data = self.aes_cbc_base64_dec(self.aes_key, self.aes_iv, parts[3])
+        capture_log = KisBase._capture_log
+        if capture_log is not None:
+            capture_log.append(capture_log.KIND_FILL, f"{tr_id}|{parts[2]}|{decrypted_data}")
+        try:
+            count = int(parts[2])
+        except ValueError:
+            count = 1
+        return self.parse_execution_records(decrypted_data, count)
+    
+    def parse_execution_records(self, data: str, count: int = 1):
+        """복호화된 체결통보 데이터를 건수만큼 레코드로 분리
+        
+        레코드는 '^'로 이어 붙어 오므로 전체 필드 수가 건수로 나누어떨어질 때 레코드 길이로 나누고,
+        그렇지 않으면 한 건으로 처리합니다.
+        """
+        fields = data.split('^')
+        if count <= 1 or len(fields) % count:
+            return [ExecutionRecord.from_fields(fields)]
+        
+        size = len(fields) // count
+        return [ExecutionRecord.from_fields(fields[i:i + size]) for i in range(0, len(fields), size)]
+    
+    def handle_price_message(self, message: str):
+        """실시간 체결가 데이터 처리 (한 메시지에 여러 건이 올 수 있음)"""
+        try:
+            parts = message.split('|')
+            if len(parts) < 4 or parts[1] != self.PRICE_TR_ID or not (self.price_callback or self.market_data_bus):
+                return
             
+            count = int(parts[2])
+            fields = parts[3].split('^')
+            for i in range(count):
+                offset = i * self.PRICE_FIELD_COUNT
+                if offset + self.PRICE_LAST_INDEX >= len(fields):
+                    break
+                ticker = fields[offset + self.PRICE_SYMBOL_INDEX]
+                price = float(fields[offset + self.PRICE_LAST_INDEX])
+                if self.market_data_bus is not None:
+                    self.market_data_bus.publish("price", ticker, price)
+                if self.price_callback:
+                    self.price_callback(ticker, price)
+                
         except Exception as e:
-            self.logger.error(f"체결통보 데이터 파싱 오류: {e}")
-            return {}
+            self.logger.error(f"실시간 체결가 처리 오류: {e}")
     
     async def handle_subscription_response(self, json_data: Dict):
         """구독 응답 처리"""
@@ -219,9 +573,9 @@ class KisWebSocket(KisBase):
             tr_id = json_data.get("header", {}).get("tr_id")
                         
             if rt_cd == '0':  # 성공
-                # AES 키, IV 저장
+                # AES 키, IV 저장 (체결통보 복호화용 - 시세 구독 응답의 키로 덮어쓰지 않음)
                 output = json_data.get("body", {}).get("output", {})
-                if "key" in output and "iv" in output:
+                if tr_id != self.PRICE_TR_ID and "key" in output and "iv" in output:
                     self.aes_key = output["key"]
                     self.aes_iv = output["iv"]
                     
@@ -242,10 +596,16 @@ class KisWebSocket(KisBase):
             self.logger.error(f"구독 응답 처리 오류: {e}")
             self.logger.error(f"응답 데이터: {json_data}")
     
-    async def handle_pingpong(self, message: str):
-        """PING-PONG 처리"""
+    def get_idle_seconds(self):
+        """세션 중 가장 오래 수신이 없는 세션의 마지막 메시지(PINGPONG 포함) 수신 후 경과 시간 (초, 연결 전이면 None)"""
+        if not self.session_last_message:
+            return None
+        return time.monotonic() - min(self.session_last_message.values())
+    
+    async def handle_pingpong(self, message: str, websocket=None):
+        """PING-PONG 처리 (받은 세션으로 응답)"""
         try:
-            await self.websocket.pong(message)
+            await (websocket or self.connections[0]).pong(message)
         except Exception as e:
             self.logger.error(f"PING-PONG 처리 오류: {e}")
     
@@ -253,26 +613,69 @@ class KisWebSocket(KisBase):
         """체결통보 콜백 함수 설정"""
         self.execution_callback = callback
     
+    def set_price_callback(self, callback: Callable):
+        """실시간 체결가 콜백 함수 설정 (callback(ticker, price), 이벤트 루프에서 동기 호출)"""
+        self.price_callback = callback
+    
+    def set_market_data_bus(self, bus):
+        """실시간 체결가를 발행할 시세 버스 설정 (토픽: ("price", 종목코드))"""
+        self.market_data_bus = bus
+    
+    def set_price_subscriptions(self, symbols: List):
+        """실시간 체결가 구독 종목 설정 (연결 시 구독)
+        Args:
+            symbols (list): [(거래소코드 3자리(NAS/NYS/AMS), 종목코드), ...]
+        """
+        self.price_tr_keys = [f"D{market}{ticker}" for market, ticker in symbols]
+    
+    async def close_connection(self):
+        """모든 세션 연결 종료 (수신 중인 process_messages도 종료됨, 소비자 태스크는 유지)"""
+        self.is_connected = False
+        if self.session_lost is not None:
+            self.session_lost.set()
+        
+        connections, tasks = self.connections, self.receive_tasks
+        self.connections, self.receive_tasks, self.session_last_message = {}, {}, {}
+        for task in tasks.values():
+            if task is not asyncio.current_task():
+                task.cancel()
+        
+        for session, websocket in connections.items():
+            try:
+                await websocket.close()
+            except Exception as e:
+                self.logger.error(f"WebSocket 세션 {session} 연결 해제 오류: {e}")
+        if connections:
+            self.logger.info("WebSocket 연결 해제 완료")
+    
     async def disconnect(self):
-        """WebSocket 연결 해제"""
-        try:
-            if self.websocket and self.is_connected:
-                await self.websocket.close()
-                self.is_connected = False
-                self.logger.info("WebSocket 연결 해제 완료")
-        except Exception as e:
-            self.logger.error(f"WebSocket 연결 해제 오류: {e}")
+        """WebSocket 연결 해제 (남은 체결통보 처리 후 소비자 태스크 종료)"""
+        await self.close_connection()
+        await self.stop_execution_workers()
     
-    async def reconnect(self, max_retries: int = 5):
-        """WebSocket 재연결"""
-        for attempt in range(max_retries):
+    async def reconnect(self, max_retries: Optional[int] = 5, base_delay: float = 1.0, max_delay: float = 60.0):
+        """WebSocket 재연결 (지터 포함 지수 백오프, 성공 시 등록된 구독 재전송)
+        
+        첫 시도는 바로 하고, 이후 시도 전에는 min(max_delay, base_delay * 2^(n-1))의 50~100% 사이에서 무작위로 대기해
+        여러 연결이 동시에 재접속하지 않도록 합니다. 연결에 실패하면 다음 시도에서 승인키를 재발급합니다.
+        Args:
+            max_retries (int): 최대 시도 횟수 (None이면 성공하거나 취소될 때까지)
+        Returns:
+            bool: 재연결 성공 여부
+        """
+        attempt = 0
+        while max_retries is None or attempt < max_retries:
+            if attempt:
+                delay = min(max_delay, base_delay * 2 ** (attempt - 1))
+                await asyncio.sleep(random.uniform(delay / 2, delay))
+            attempt += 1
             try:
-                self.logger.info(f"재연결 시도 {attempt + 1}/{max_retries}")
-                await asyncio.sleep(2 ** attempt)  # 지수 백오프
-                await self.connect()
+                self.logger.info(f"재연결 시도 {attempt}" + (f"/{max_retries}" if max_retries else ""))
+                await self.establish()
                 return True
             except Exception as e:
-                self.logger.error(f"재연결 실패 {attempt + 1}: {e}")
+                self.logger.error(f"재연결 실패 {attempt}: {e}")
+                self.approval_key = None
                 
         self.logger.error("최대 재연결 시도 횟수 초과")
-        return False
\ No newline at end of file
+        return False
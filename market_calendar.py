@@ -0,0 +1,188 @@
+"""
+NYSE 거래일/장 운영시간 캘린더 모듈
+"""
+
+import numpy as np
+from datetime import date, datetime, time, timedelta
+from utils.datetime_util import DateTimeUtil
+
+
+class MarketCalendar:
+    """NYSE 휴장일/조기폐장 규칙으로 여러 해의 장 운영시간을 미리 계산해 둔 캘린더
+
+    날짜별 개장/폐장 시각(자정 기준 분, 휴장일은 0)과 다음 거래일 위치를
+    날짜 순 고정 크기 배열로 보관하므로 거래일 여부, 장 운영시간, 다음 거래일 조회가 모두 O(1)입니다.
+    연방 공휴일 중 NYSE가 개장하는 날(콜럼버스 데이, 재향군인의 날)은 거래일이며,
+    성금요일은 휴장, 독립기념일 전일/추수감사절 다음 날/크리스마스 이브는 13시 조기폐장입니다.
+    범위를 벗어난 날짜를 조회하면 해당 연도까지 배열을 확장합니다.
+    """
+
+    REGULAR_OPEN = time(9, 30)
+    REGULAR_CLOSE = time(16, 0)
+    EARLY_CLOSE = time(13, 0)
+
+    def __init__(self, start_year=None, end_year=None, extra_closures=()):
+        """
+        Args:
+            start_year (int): 계산 시작 연도 (기본: 작년)
+            end_year (int): 계산 종료 연도 (기본: 5년 후)
+            extra_closures (iterable): 규칙 외 임시 휴장일 목록 (date, 예: 국가 애도일)
+        """
+        current_year = DateTimeUtil.get_us_now().year
+        self.extra_closures = set(extra_closures)
+        self._build(start_year or current_year - 1, end_year or current_year + 5)
+
+    @staticmethod
+    def _easter(year):
+        """부활절 날짜 (그레고리력, Anonymous Gregorian algorithm)"""
+        a = year % 19
+        b, c = divmod(year, 100)
+        d, e = divmod(b, 4)
+        f = (b + 8) // 25
+        g = (b - f + 1) // 3
+        h = (19 * a + b - d - g + 15) % 30
+        i, k = divmod(c, 4)
+        l = (32 + 2 * e + 2 * i - h - k) % 7
+        m = (a + 11 * h + 22 * l) // 451
+        month, day = divmod(h + l - 7 * m + 114, 31)
+        return date(year, month, day + 1)
+
+    @staticmethod
+    def _nthWeekday(year, month, weekday, n):
+        """해당 월의 n번째 요일 (n=-1이면 마지막 요일, weekday: 월=0)"""
+        if n > 0:
+            first = date(year, month, 1)
+            return first + timedelta(days=(weekday - first.weekday()) % 7 + (n - 1) * 7)
+        last = date(year + (month == 12), month % 12 + 1, 1) - timedelta(days=1)
+        return last - timedelta(days=(last.weekday() - weekday) % 7)
+
+    @staticmethod
+    def _observed(holiday):
+        """토요일 휴일은 전날(금), 일요일 휴일은 다음 날(월)에 휴장"""
+        if holiday.weekday() == 5:
+            return holiday - timedelta(days=1)
+        if holiday.weekday() == 6:
+            return holiday + timedelta(days=1)
+        return holiday
+
+    @classmethod
+    def _yearRules(cls, year):
+        """연도별 NYSE 휴장일 {date: 이름}과 조기폐장일 집합"""
+        holidays = {}
+
+        # 신정: 토요일이면 전년도 12/31에 휴장하지 않음
+        new_year = date(year, 1, 1)
+        if new_year.weekday() != 5:
+            holidays[cls._observed(new_year)] = "New Year's Day"
+        holidays[cls._nthWeekday(year, 1, 0, 3)] = "Martin Luther King Jr. Day"
+        holidays[cls._nthWeekday(year, 2, 0, 3)] = "Washington's Birthday"
+        holidays[cls._easter(year) - timedelta(days=2)] = "Good Friday"
+        holidays[cls._nthWeekday(year, 5, 0, -1)] = "Memorial Day"
+        if year >= 2022:
+            holidays[cls._observed(date(year, 6, 19))] = "Juneteenth National Independence Day"
+        holidays[cls._observed(date(year, 7, 4))] = "Independence Day"
+        holidays[cls._nthWeekday(year, 9, 0, 1)] = "Labor Day"
+        thanksgiving = cls._nthWeekday(year, 11, 3, 4)
+        holidays[thanksgiving] = "Thanksgiving Day"
+        holidays[cls._observed(date(year, 12, 25))] = "Christmas Day"
+
+        # 조기폐장: 독립기념일 전일/크리스마스 이브(월~목), 추수감사절 다음 날
+        early_closes = {thanksgiving + timedelta(days=1)}
+        for candidate in (date(year, 7, 3), date(year, 12, 24)):
+            if candidate.weekday() <= 3 and candidate not in holidays:
+                early_closes.add(candidate)
+
+        return holidays, early_closes
+
+    def _build(self, start_year, end_year):
+        """start_year ~ end_year 날짜별 장 운영시간 배열 생성"""
+        holidays = {}
+        early_closes = set()
+        for year in range(start_year, end_year + 1):
+            year_holidays, year_early_closes = self._yearRules(year)
+            holidays.update(year_holidays)
+            early_closes |= year_early_closes
+
+        first = date(start_year, 1, 1)
+        days = (date(end_year, 12, 31) - first).days + 1
+        dates = np.arange(np.datetime64(first, 'D'), np.datetime64(first, 'D') + days)
+        weekdays = (dates.astype(np.int64) + 3) % 7  # 1970-01-01은 목요일 (월=0)
+
+        closed = weekdays >= 5
+        for closed_date in list(holidays.keys()) + list(self.extra_closures):
+            i = (closed_date - first).days
+            if 0 <= i < days:
+                closed[i] = True
+
+        open_minutes = np.full(days, self.REGULAR_OPEN.hour * 60 + self.REGULAR_OPEN.minute, dtype=np.int16)
+        close_minutes = np.full(days, self.REGULAR_CLOSE.hour * 60 + self.REGULAR_CLOSE.minute, dtype=np.int16)
+        for early_date in early_closes:
+            close_minutes[(early_date - first).days] = self.EARLY_CLOSE.hour * 60 + self.EARLY_CLOSE.minute
+        open_minutes[closed] = 0
+        close_minutes[closed] = 0
+
+        # 날짜별 (당일 포함) 다음 거래일 위치 (범위 내 다음 거래일이 없으면 -1)
+        trading_positions = np.flatnonzero(~closed)
+        next_position = np.searchsorted(trading_positions, np.arange(days))
+        next_trading = np.full(days, -1, dtype=np.int32)
+        in_range = next_position < len(trading_positions)
+        next_trading[in_range] = trading_positions[next_position[in_range]]
+
+        self.start_year = start_year
+        self.end_year = end_year
+        self.first_ordinal = first.toordinal()
+        self.open_minutes = open_minutes
+        self.close_minutes = close_minutes
+        self.next_trading = next_trading
+        self.holiday_names = holidays
+
+    def _index(self, day):
+        """날짜의 배열 위치 (범위를 벗어나면 확장)"""
+        if day.year < self.start_year or day.year > self.end_year:
+            self._build(min(self.start_year, day.year), max(self.end_year, day.year + 1))
+        return day.toordinal() - self.first_ordinal
+
+    def isTradingDay(self, day):
+        """거래일 여부"""
+        i = self._index(day)  # 범위 확장 시 배열이 교체되므로 위치를 먼저 계산
+        return bool(self.close_minutes[i])
+
+    def isEarlyClose(self, day):
+        """조기폐장일 여부"""
+        i = self._index(day)
+        close = int(self.close_minutes[i])
+        return 0 < close < self.REGULAR_CLOSE.hour * 60 + self.REGULAR_CLOSE.minute
+
+    def getClosureName(self, day):
+        """휴장 사유 (거래일이면 None)"""
+        if self.isTradingDay(day):
+            return None
+        if day in self.holiday_names:
+            return self.holiday_names[day]
+        if day in self.extra_closures:
+            return "임시 휴장"
+        return "주말"
+
+    def getSession(self, day):
+        """정규장 개장/폐장 시각 (미국 동부시간, 휴장일이면 None)"""
+        i = self._index(day)
+        close = int(self.close_minutes[i])
+        if not close:
+            return None
+        open_ = int(self.open_minutes[i])
+        return (
+            DateTimeUtil.US_TIMEZONE.localize(datetime.combine(day, time(open_ // 60, open_ % 60))),
+            DateTimeUtil.US_TIMEZONE.localize(datetime.combine(day, time(close // 60, close % 60)))
+        )
+
+    def nextTradingDay(self, day, include_today=True):
+        """day 이후 (include_today면 당일 포함) 첫 거래일"""
+        if not include_today:
+            day = day + timedelta(days=1)
+        i = self._index(day)
+        position = int(self.next_trading[i])
+        if position < 0:
+            # 범위 끝까지 거래일이 없으면 다음 해까지 확장 후 재조회
+            self._build(self.start_year, self.end_year + 1)
+            return self.nextTradingDay(day)
+        return date.fromordinal(self.first_ordinal + position)
@@ -0,0 +1,164 @@
+"""
+프로세스 내 실시간 시세 발행/구독 버스 모듈
+"""
+
+import threading
+import time
+from collections import deque, namedtuple
+from typing import Callable
+from utils.logger_util import LoggerUtil
+
+
+# 시세 이벤트 (불변 튜플 - 모든 구독자가 같은 객체를 복사 없이 공유)
+MarketEvent = namedtuple('MarketEvent', ['feed', 'ticker', 'price', 'timestamp'])
+
+
+class BusSubscription:
+    """구독자별 수신 버퍼
+
+    전달 방식은 세 가지입니다.
+    - callback: 발행 스레드에서 즉시 호출 (손절 점검처럼 O(1) 처리만 하는 소비자용)
+    - 링 버퍼: 최근 capacity개 이벤트 보관 (가득 차면 가장 오래된 이벤트를 덮어씀)
+    - conflate: 토픽(종목)별 최신 이벤트 하나만 보관 (느린 소비자용)
+    발행자는 어떤 방식이든 대기하지 않습니다.
+    """
+
+    def __init__(self, name, feed, ticker=None, capacity=256, conflate=False, callback: Callable = None):
+        """
+        Args:
+            name (str): 구독자 이름 (통계 표시용)
+            feed (str): 피드 이름 (예: "price")
+            ticker (str): 종목 코드 (None이면 피드의 모든 종목)
+            capacity (int): 링 버퍼 크기
+            conflate (bool): 종목별 최신 이벤트만 보관할지 여부
+            callback (Callable): callback(event) 즉시 호출 함수 (지정 시 버퍼에 보관하지 않음)
+        """
+        self.name = name
+        self.feed = feed
+        self.ticker = ticker
+        self.conflate = conflate
+        self.callback = callback
+        self.buffer = deque(maxlen=capacity)
+        self.latest = {}  # conflate: {ticker: MarketEvent}
+        self.lock = threading.Lock()
+        self.stats = {'delivered': 0, 'overwritten': 0, 'errors': 0}
+
+    def deliver(self, event):
+        """이벤트 전달 (발행 스레드에서 호출)"""
+        self.stats['delivered'] += 1
+        if self.callback is not None:
+            try:
+                self.callback(event)
+            except Exception as e:
+                self.stats['errors'] += 1
+                LoggerUtil().get_logger().error(f"시세 구독자 {self.name} 처리 오류: {e}")
+        elif self.conflate:
+            with self.lock:
+                if event.ticker in self.latest:
+                    self.stats['overwritten'] += 1
+                self.latest[event.ticker] = event
+        else:
+            if len(self.buffer) == self.buffer.maxlen:
+                self.stats['overwritten'] += 1
+            self.buffer.append(event)
+
+    def drain(self):
+        """쌓인 이벤트를 모두 꺼냄 (conflate면 종목별 최신 이벤트)
+        Returns:
+            list: MarketEvent 목록 (시간순)
+        """
+        if self.conflate:
+            with self.lock:
+                events, self.latest = self.latest, {}
+            return sorted(events.values(), key=lambda event: event.timestamp)
+
+        events = []
+        while True:
+            try:
+                events.append(self.buffer.popleft())
+            except IndexError:
+                return events
+
+    def getLatest(self, ticker, max_age=None):
+        """conflate 구독의 종목 최신 이벤트 (꺼내지 않음, max_age 초보다 오래되면 None)"""
+        event = self.latest.get(ticker)
+        if event is None or (max_age is not None and time.monotonic() - event.timestamp > max_age):
+            return None
+        return event
+
+
+class MarketDataBus:
+    """(피드, 종목) 토픽 기반 프로세스 내 시세 버스
+
+    KisWebSocket이 수신한 시세를 한 번 발행하면 구독자마다 자기 버퍼로 전달됩니다.
+    토픽별 전달 대상 목록은 구독 변경 시에만 다시 만들어 두므로 발행은 대상 수만큼의 O(1) 전달만 합니다.
+    토픽별 최신 이벤트도 보관해 상태 조회 등에서 바로 읽을 수 있습니다.
+    """
+
+    def __init__(self, default_capacity=256):
+        """
+        Args:
+            default_capacity (int): 구독 시 크기를 지정하지 않았을 때의 링 버퍼 크기
+        """
+        self.logger = LoggerUtil().get_logger()
+        self.default_capacity = default_capacity
+        self.subscriptions = []
+        self.targets = {}  # {(feed, ticker): (BusSubscription, ...)} 전달 대상 캐시
+        self.latest = {}  # {(feed, ticker): MarketEvent}
+        self.published = 0
+        self.lock = threading.Lock()
+
+    def subscribe(self, name, feed, ticker=None, capacity=None, conflate=False, callback: Callable = None):
+        """구독 등록
+        Returns:
+            BusSubscription: 구독 버퍼 (drain/getLatest로 조회)
+        """
+        subscription = BusSubscription(name, feed, ticker, capacity or self.default_capacity, conflate, callback)
+        with self.lock:
+            self.subscriptions.append(subscription)
+            self.targets = {}
+        return subscription
+
+    def unsubscribe(self, subscription):
+        """구독 해제"""
+        with self.lock:
+            if subscription in self.subscriptions:
+                self.subscriptions.remove(subscription)
+            self.targets = {}
+
+    def _getTargets(self, feed, ticker):
+        """토픽 전달 대상 (캐시가 없으면 구독 목록에서 생성)"""
+        targets = self.targets.get((feed, ticker))
+        if targets is None:
+            with self.lock:
+                targets = tuple(subscription for subscription in self.subscriptions
+                                if subscription.feed == feed and subscription.ticker in (None, ticker))
+                self.targets[(feed, ticker)] = targets
+        return targets
+
+    def publish(self, feed, ticker, price, timestamp=None):
+        """시세 발행 (구독자 버퍼에 전달만 하고 대기하지 않음)
+        Returns:
+            MarketEvent: 발행된 이벤트
+        """
+        event = MarketEvent(feed, ticker, price, time.monotonic() if timestamp is None else timestamp)
+        self.latest[(feed, ticker)] = event
+        self.published += 1
+        for subscription in self._getTargets(feed, ticker):
+            subscription.deliver(event)
+        return event
+
+    def getLatest(self, feed, ticker, max_age=None):
+        """토픽 최신 이벤트 (없거나 max_age 초보다 오래되면 None)"""
+        event = self.latest.get((feed, ticker))
+        if event is None or (max_age is not None and time.monotonic() - event.timestamp > max_age):
+            return None
+        return event
+
+    def getStats(self):
+        """발행 건수 및 구독자별 전달/덮어씀/오류 건수"""
+        return {
+            'published': self.published,
+            'topics': len(self.latest),
+            'subscribers': {subscription.name: dict(subscription.stats) for subscription in list(self.subscriptions)}
+        }
@@ -1,10 +1,7 @@
 import os
-import pandas as pd
-import numpy as np
-from ta.momentum import RSIIndicator
 from datetime import datetime, timedelta
 from typing import List, Dict, Optional
-from kis_price import KisPrice
+from indicator_engine import IndicatorEngine, rsiKey
 from utils.logger_util import LoggerUtil
 
 
@@ -18,7 +15,8 @@ class RSIStrategy:
                  rsi_oversold: float = 30.0,
                  rsi_overbought: float = 70.0,
                  buy_rate: float = 0.05,
-                 sell_rate: float = 0.05):
+                 sell_rate: float = 0.05,
+                 indicator_engine: Optional[IndicatorEngine] = None):
         
         # 로거 초기화
         self.logger = LoggerUtil().get_logger()
@@ -34,8 +32,14 @@ class RSIStrategy:
         # 환경변수에서 시간 간격 설정 로드
         self.interval = os.getenv("RSI_INTERVAL")
         
-        # KIS 가격 조회 객체
-        self.kis_price = KisPrice()
+        # 지표 엔진 (공유 엔진이 없으면 전략 단독 엔진 생성)
+        self.owns_engine = indicator_engine is None
+        self.indicator_engine = indicator_engine if indicator_engine is not None else IndicatorEngine()
+        self.kis_price = self.indicator_engine.kis_price
+        
+        # (종목, 인터벌) 계산 그래프에 RSI 노드 등록
+        self.graph = self.indicator_engine.getGraph(ticker, market, self.interval)
+        self.rsi_key = self.graph.require(rsiKey(rsi_period))
 
         # 최근 계산된 RSI 값 (인터벌 내 재사용)
         self.last_rsi: Optional[float] = None
@@ -54,6 +58,9 @@ class RSIStrategy:
                 self.logger.warning(f"{self.market}:{self.ticker} 일봉 데이터 조회 실패 - API 연결 상태를 확인하세요")
                 return False
             
+            # 조회한 일봉으로 일봉 지표 그래프 초기화 (일봉 인터벌 사용 시 첫 판단에서 재조회 없음)
+            self.indicator_engine.seedChart(self.ticker, "day", chart_data)
+            
             if len(chart_data) < self.rsi_period + 1:
                 self.logger.warning(f"{self.market}:{self.ticker} 일봉 데이터 부족 (현재: {len(chart_data)}개, 필요: {self.rsi_period + 1}개)")
                 return False
@@ -70,94 +77,29 @@ class RSIStrategy:
         if not force_refresh and self.last_rsi is not None:
             return self.last_rsi
 
-        if self.interval == "day":
-            rsi = self._getRsiFromDaily()
-        else:
-            rsi = self._getRsiFromMinute(self.interval)
+        try:
+            if self.owns_engine:
+                self.indicator_engine.beginCycle()
+            self.indicator_engine.refresh(self.ticker, self.interval)
+
+            # 마감 봉 기준 와일더 상태(일봉은 전일 종가 기준으로 고정)에
+            # 현재 형성 중인 봉(실시간 현재가)을 합성해 RSI 계산
+            if self.graph.partial_close is not None:
+                rsi = self.graph.previewBar(self.graph.partial_close, keys=[self.rsi_key])[self.rsi_key]
+            else:
+                rsi = self.graph.value(self.rsi_key)
+
+            if rsi is None:
+                data_source = "일봉" if self.interval == "day" else f"{self.interval}분봉"
+                self.logger.warning(f"{self.ticker} {data_source} 데이터 부족: {self.graph.bar_count}개")
+
+        except Exception as e:
+            self.logger.error(f"RSI 계산 중 오류: {e}")
+            rsi = None
 
         self.last_rsi = rsi
         return rsi
     
-    def _getRsiFromDaily(self):
-        """일봉 데이터로 RSI 계산"""
-        try:
-            required_periods = self.rsi_period + 5
-            
-            chart_data = self.kis_price.getDailyPrice(
-                market=self.market,
-                ticker=self.ticker,
-                base_date=""
-            )
-            
-            if not chart_data or len(chart_data) < required_periods:
-                self.logger.warning(f"{self.ticker} 일봉 데이터 부족: {len(chart_data) if chart_data else 0}개")
-                return None
-            
-            # 가격 데이터 추출
-            prices = []
-            for data in reversed(chart_data):
-                try:
-                    price = float(data['clos']) if 'clos' in data and data['clos'] else None
-                    if price and price > 0:
-                        prices.append(price)
-                except (ValueError, KeyError):
-                    continue
-            
-            if len(prices) < required_periods:
-                return None
-            
-            return self._calculateRsi(prices)
-            
-        except Exception as e:
-            self.logger.error(f"일봉 RSI 계산 중 오류: {e}")
-            return None
-    
-    def _getRsiFromMinute(self, minute_frame):
-        """분봉 데이터로 RSI 계산"""
-        try:
-            required_periods = self.rsi_period + 5
-            
-            chart_data = self.kis_price.getMinuteChartPrice(
-                market=self.market,
-                ticker=self.ticker,
-                time_frame=minute_frame,
-                include_prev_day="1"
-            )
-            
-            if not chart_data or len(chart_data) < required_periods:
-                self.logger.warning(f"{self.ticker} {minute_frame}분봉 데이터 부족: {len(chart_data) if chart_data else 0}개")
-                return None
-            
-            # 가격 데이터 추출
-            prices = []
-            for data in reversed(chart_data):
-                try:
-                    price = float(data['last']) if 'last' in data and data['last'] else None
-                    if price and price > 0:
-                        prices.append(price)
-                except (ValueError, KeyError):
-                    continue
-            
-            if len(prices) < required_periods:
-                return None
-            
-            return self._calculateRsi(prices)
-            
-        except Exception as e:
-            self.logger.error(f"{minute_frame}분봉 RSI 계산 중 오류: {e}")
-            return None
-    
-    def _calculateRsi(self, prices):
-        """가격 리스트로 RSI 계산"""
-        try:
-            price_series = pd.Series(prices)
-            rsi_indicator = RSIIndicator(close=price_series, window=self.rsi_period)
-            rsi_values = rsi_indicator.rsi()
-            return rsi_values.iloc[-1]
-        except Exception as e:
-            self.logger.error(f"RSI 계산 오류: {e}")
-            return None
-    
     def getBuySignal(self):
         """순수 RSI 기반 매수 신호 판단"""
         rsi = self.getCurrentRsi()
@@ -175,33 +117,10 @@ class RSIStrategy:
         return rsi >= self.rsi_overbought
     
     def getCurrentPrice(self):
-        """현재 가격 조회 (설정된 간격에 따라)"""
-        try:
-            if self.interval == "day":
-                chart_data = self.kis_price.getDailyPrice(
-                    market=self.market,
-                    ticker=self.ticker,
-                    base_date=""
-                )
-                if chart_data:
-                    latest_data = chart_data[0]
-                    return float(latest_data['clos']) if 'clos' in latest_data and latest_data['clos'] else None
-            else:
-                chart_data = self.kis_price.getMinuteChartPrice(
-                    market=self.market,
-                    ticker=self.ticker,
-                    time_frame=self.interval,
-                    include_prev_day="1"
-                )
-                if chart_data:
-                    latest_data = chart_data[0]
-                    return float(latest_data['last']) if 'last' in latest_data and latest_data['last'] else None
-            
-            return None
-            
-        except Exception as e:
-            self.logger.error(f"현재 가격 조회 오류: {e}")
-            return None
+        """현재 가격 조회 (설정된 간격의 최근 차트 기준, 추가 조회 없음)"""
+        if self.graph.partial_close is not None:
+            return self.graph.partial_close
+        return self.graph.last_close
     
     def getStrategyStatus(self):
         """전략 현재 상태 반환"""
@@ -0,0 +1,191 @@
+"""
+손절가 사전 계산 기반 손절 엔진 모듈
+"""
+
+import math
+import threading
+from typing import Callable
+from utils.logger_util import LoggerUtil
+
+
+class StopLossEngine:
+    """보유 종목별 손절가를 미리 계산해 두고 가격 갱신마다 O(1)로 점검하는 손절 엔진
+
+    손절가 = 매입평균가 * (1 + STOP_LOSS_RATE / 100)
+    스트리밍(WebSocket 실시간 체결가) 또는 폴링(현재가 조회)으로 들어온 가격이
+    손절가 이하이면 종목당 한 번만 on_trigger(ticker, price, position)를 호출합니다.
+    가격 점검 경로에서는 잔고 조회를 하지 않습니다.
+    """
+
+    def __init__(self, stop_loss_rate, on_trigger: Callable):
+        """
+        Args:
+            stop_loss_rate (float): 손절 기준 수익률 (%, 예: -5)
+            on_trigger (Callable): on_trigger(ticker, price, position) 손절 발동 콜백
+        """
+        self.logger = LoggerUtil().get_logger()
+        self.stop_loss_rate = stop_loss_rate
+        self.on_trigger = on_trigger
+
+        # {ticker: {'quantity', 'avg_price', 'stop_price', 'triggered', 'stop_order_no'}}
+        self.positions = {}
+        self.lock = threading.Lock()
+
+    def calculateStopPrice(self, avg_price):
+        """매입평균가 기준 손절가 계산"""
+        return avg_price * (1 + self.stop_loss_rate / 100)
+
+    def updatePosition(self, ticker, quantity, avg_price, stop_price=None):
+        """포지션 갱신 (수량 0 이하, 평균가 미확인 또는 평균가/손절가가 유한한 값이 아니면 제거)
+
+        quantity는 주문가능수량(미체결 매도 주문 수량이 이미 빠진 수량)입니다.
+        평균가가 바뀌면(추가 매수) 발동 상태를 초기화하고, 같으면 유지해
+        이미 손절 주문이 나간 포지션이 잔고 갱신만으로 다시 발동하지 않도록 합니다.
+        단, 진행 중인 손절 주문 없이 주문가능수량이 늘었으면(다른 매도 주문 취소 등) 다시 발동할 수 있게 합니다.
+        """
+        if stop_price is None and math.isfinite(avg_price):
+            stop_price = self.calculateStopPrice(avg_price)
+
+        with self.lock:
+            if not (math.isfinite(avg_price) and math.isfinite(stop_price)):
+                # NaN 손절가는 모든 가격 비교가 거짓이 되어 첫 가격에 바로 발동하므로 포지션으로 받지 않음
+                self.positions.pop(ticker, None)
+                self.logger.warning(f"{ticker} 평균가/손절가가 유효하지 않아 손절 대상에서 제외: "
+                                    f"평균가 {avg_price}, 손절가 {stop_price}")
+                return
+
+            if quantity <= 0 or avg_price <= 0:
+                self.positions.pop(ticker, None)
+                return
+
+            previous = self.positions.get(ticker)
+            triggered = previous is not None and previous['triggered'] and abs(previous['avg_price'] - avg_price) < 1e-9
+            stop_order_no = previous.get('stop_order_no') if triggered else None
+            if triggered and stop_order_no is None and quantity > previous['quantity']:
+                triggered = False
+            self.positions[ticker] = {
+                'quantity': quantity,
+                'avg_price': avg_price,
+                'stop_price': stop_price,
+                'triggered': triggered,
+                'stop_order_no': stop_order_no
+            }
+
+    def loadTable(self, table, tickers):
+        """포트폴리오 테이블(PortfolioTable)로 대상 종목 포지션 일괄 갱신 (손절가는 벡터 연산으로 계산)"""
+        stop_prices = table.stop_prices(self.stop_loss_rate)
+        for ticker in tickers:
+            i = table.index.get(str(ticker).upper())
+            if i is None or not math.isfinite(table.orderable_qty[i]):
+                self.updatePosition(ticker, 0, 0)
+                continue
+            self.updatePosition(ticker, int(table.orderable_qty[i]), float(table.avg_price[i]), float(stop_prices[i]))
+
+    def applyFill(self, ticker, order_type, quantity, price):
+        """체결 반영 (매수: 수량/평균가 재계산, 매도: 변경 없음)"""
+        if quantity <= 0:
+            return
+
+        with self.lock:
+            position = self.positions.get(ticker)
+            if order_type == '매수':
+                if position is None:
+                    new_quantity, new_avg = quantity, price
+                else:
+                    new_quantity = position['quantity'] + quantity
+                    new_avg = (position['quantity'] * position['avg_price'] + quantity * price) / new_quantity
+                triggered = False
+                stop_order_no = None
+            else:
+                # 매도 체결: 주문가능수량은 매도 주문 제출 시(applySellOrder) 이미 차감했으므로 다시 빼지 않음
+                return
+
+            if new_quantity <= 0 or new_avg <= 0:
+                self.positions.pop(ticker, None)
+                return
+
+            self.positions[ticker] = {
+                'quantity': new_quantity,
+                'avg_price': new_avg,
+                'stop_price': self.calculateStopPrice(new_avg),
+                'triggered': triggered,
+                'stop_order_no': stop_order_no
+            }
+
+    def applySellOrder(self, ticker, quantity):
+        """매도 주문 제출 반영 (주문가능수량에서 주문 수량 차감, 남은 수량이 없으면 제거)"""
+        with self.lock:
+            position = self.positions.get(ticker)
+            if position is None or quantity <= 0:
+                return
+            position['quantity'] -= quantity
+            if position['quantity'] <= 0 and position.get('stop_order_no') is None:
+                self.positions.pop(ticker, None)
+
+    def resetTrigger(self, ticker):
+        """손절 주문 실패 시 다음 가격 갱신에서 다시 발동할 수 있도록 초기화"""
+        with self.lock:
+            position = self.positions.get(ticker)
+            if position is not None:
+                position['triggered'] = False
+                position['stop_order_no'] = None
+
+    def setStopOrder(self, ticker, order_no):
+        """제출된 손절 주문번호 기록 (주문이 체결되지 않고 끝나면 releaseStopOrder로 다시 발동 가능)"""
+        with self.lock:
+            position = self.positions.get(ticker)
+            if position is not None and position['triggered']:
+                position['stop_order_no'] = order_no
+
+    def releaseStopOrder(self, order_no):
+        """손절 주문이 전량 체결되지 않고 추적에서 빠졌을 때(거부/취소/누락) 발동 상태 초기화
+        Returns:
+            str: 초기화된 종목 코드 (해당 주문이 손절 주문이 아니면 None)
+        """
+        with self.lock:
+            for ticker, position in self.positions.items():
+                if position.get('stop_order_no') == order_no:
+                    position['triggered'] = False
+                    position['stop_order_no'] = None
+                    return ticker
+        return None
+
+    def onPrice(self, ticker, price):
+        """가격 갱신 시 손절 조건 점검 (O(1))
+        Returns:
+            bool: 손절 발동 여부
+        """
+        position = self.positions.get(ticker)
+        if position is None or position['triggered'] or price <= 0 or price > position['stop_price']:
+            return False
+
+        return self.trigger(ticker, price)
+
+    def trigger(self, ticker, price):
+        """손절 발동 (포지션당 한 번, 잔고 평가수익률 기준 판정 등 외부 판정에도 사용)
+        Returns:
+            bool: 발동 여부
+        """
+        with self.lock:
+            # 스트리밍/폴링 가격이 동시에 들어와도 한 번만 발동
+            position = self.positions.get(ticker)
+            if position is None or position['triggered']:
+                return False
+            position['triggered'] = True
+            snapshot = dict(position)
+
+        self.logger.warning(
+            f"{ticker} 손절 조건 충족: 현재가 ${price:.2f} (손절가 ${snapshot['stop_price']:.2f})"
+        )
+        self.on_trigger(ticker, price, snapshot)
+        return True
+
+    def restorePositions(self, positions):
+        """체크포인트 포지션 복원 (이후 잔고 갱신 시 평균가가 같으면 발동 상태 유지)"""
+        with self.lock:
+            self.positions = {ticker: {'stop_order_no': None, **position} for ticker, position in positions.items()}
+
+    def getPositions(self):
+        """포지션 사본"""
+        with self.lock:
+            return {ticker: dict(position) for ticker, position in self.positions.items()}
@@ -1,18 +1,34 @@
 import asyncio
+import logging
 import os
 import pytz
+import threading
+import time as time_module
 import traceback
-from datetime import datetime, time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, time, timedelta
 from kis_order import KisOrder
 from kis_account import KisAccount
 from kis_base import KisBase
+from kis_price import KisPrice
 from kis_websocket import KisWebSocket
+from indicator_engine import IndicatorEngine
+from bar_scheduler import BarScheduler
+from market_calendar import MarketCalendar
+from job_scheduler import JobScheduler
+from stop_loss_engine import StopLossEngine
+from market_data_bus import MarketDataBus
+from bar_archive import BarArchive
+from utils.portfolio_table import PortfolioTable
+from utils.checkpoint_store import CheckpointStore
+from utils.capture_log import CaptureLog
+from utils.latency_tracer import LatencyTracer
 from rsi_strategy import RSIStrategy
 from macd_strategy import MACDStrategy
-from utils.telegram_util import TelegramUtil
+from utils.telegram_util import TelegramUtil, TelegramNotifier
 from utils.logger_util import LoggerUtil
 from utils.datetime_util import DateTimeUtil
-import holidays
 
 
 class TradingBot:
@@ -20,8 +36,14 @@ class TradingBot:
     
     def __init__(self, trading_tickers):
         
+        # 시작 소요 시간 측정 기준 (첫 매매 판단까지의 시간 보고용)
+        self.init_started = time_module.monotonic()
+        self.startup_seconds = None
+        self.first_decision_seconds = None
+        
         # 로거 초기화
         self.logger = LoggerUtil().get_logger()
+        self.log_util = LoggerUtil()  # 구조화 이벤트 기록 (매매 판단/체결 처리 경로용)
         
         # 거래 종목 설정 (ticker: market 형태)
         self.trading_tickers = trading_tickers
@@ -37,15 +59,39 @@ class TradingBot:
         if self.stop_loss_rate is not None:
             self.logger.info(f"손절매 기준 수익률 설정: {self.stop_loss_rate:.2f}%")
         
-        # KIS API 객체들
+        # 손절 엔진 (보유 종목별 손절가를 미리 계산해 두고 실시간/폴링 가격마다 점검)
+        self.stop_loss_engine = None
+        self.stop_loss_executor = None
+        if self.stop_loss_rate is not None:
+            self.stop_loss_engine = StopLossEngine(self.stop_loss_rate, self.onStopLossTriggered)
+            # 손절 주문은 매매 사이클/이벤트 루프와 별개 스레드에서 즉시 실행
+            self.stop_loss_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stop-loss")
+        
+        # KIS API 객체들 (토큰/HTTP 세션/요청 간격 제한기는 모든 객체가 공유)
         self.kis_order = KisOrder()
         self.kis_account = KisAccount()
         self.kis_base = KisBase()
         
         # WebSocket 객체 (체결통보용)
         self.kis_websocket = KisWebSocket()
+        
+        # 실시간 시세 버스 (WebSocket 체결가를 한 번 받아 손절 점검/매매 신호/상태 조회가 나눠 씀)
+        # 매매 신호는 종목별 최신 체결가만 보관하는 구독으로 읽고, STREAM_PRICE_MAX_AGE_SECONDS보다 오래되면 현재가 API 조회
+        self.market_data_bus = MarketDataBus()
+        self.kis_websocket.set_market_data_bus(self.market_data_bus)
+        self.stream_price_max_age = float(os.getenv("STREAM_PRICE_MAX_AGE_SECONDS", "10"))
+        self.signal_prices = self.market_data_bus.subscribe("signal", "price", conflate=True)
+        if self.stop_loss_engine is not None:
+            self.market_data_bus.subscribe("stop_loss", "price", callback=self.onStreamPrice)
         self.websocket_task = None
         
+        # WebSocket 연결 감시 (끊김 또는 WS_STALE_SECONDS 동안 PINGPONG 포함 수신이 없으면 재연결)
+        self.ws_stale_seconds = float(os.getenv("WS_STALE_SECONDS", "90"))
+        self.ws_reconnect_base_seconds = float(os.getenv("WS_RECONNECT_BASE_SECONDS", "1"))
+        self.ws_reconnect_max_seconds = float(os.getenv("WS_RECONNECT_MAX_SECONDS", "60"))
+        self.ws_check_seconds = 5
+        self.ws_reconnects = 0
+        
         # 매수/매도 거래 비중 가져오기
         buy_rate = float(os.getenv("BUY_RATE"))
         sell_rate = float(os.getenv("SELL_RATE"))
@@ -58,6 +104,21 @@ class TradingBot:
         self.rsi_interval = os.getenv("RSI_INTERVAL")
         self.macd_interval = os.getenv("MACD_INTERVAL")
         
+        # 지표 엔진 (종목/인터벌별 차트 조회와 공유 지표 계산을 전략들이 함께 사용)
+        self.kis_price = KisPrice()
+        self.indicator_engine = IndicatorEngine(self.kis_price)
+        
+        # 조회한 마감 봉을 종목/인터벌/기간별로 쌓아 두는 아카이브 (백테스트/분석용, BAR_ARCHIVE_DIR을 비우면 기록 안 함)
+        archive_dir = os.getenv("BAR_ARCHIVE_DIR", "archive")
+        self.bar_archive = BarArchive(archive_dir) if archive_dir else None
+        self.indicator_engine.setArchive(self.bar_archive)
+        
+        # 매매 판단 구간별 지연 추적 (종목별 가격/차트 조회, 지표 계산, 계좌 조회, 주문 제출, TR ID별 API 요청)
+        self.latency_tracer = LatencyTracer(int(os.getenv("LATENCY_TRACE_WINDOW", "2048")))
+        self.latency_tracer.add_exporter(self.exportCycleLatency)
+        KisBase.setLatencyTracer(self.latency_tracer)
+        self.indicator_engine.setLatencyTracer(self.latency_tracer)
+        
         # 각 종목별 RSI 및 MACD 전략 생성
         self.rsi_strategies = {}
         self.macd_strategies = {}
@@ -69,25 +130,53 @@ class TradingBot:
                 rsi_oversold=rsi_oversold, 
                 rsi_overbought=rsi_overbought,
                 buy_rate=buy_rate,
-                sell_rate=sell_rate
+                sell_rate=sell_rate,
+                indicator_engine=self.indicator_engine
             )
             self.macd_strategies[ticker] = MACDStrategy(
                 ticker=ticker,
                 market=parse_market,
                 buy_rate=buy_rate,
-                sell_rate=sell_rate
+                sell_rate=sell_rate,
+                indicator_engine=self.indicator_engine
             )
         
-        # 텔레그램 유틸
-        self.telegram = TelegramUtil()
+        # 텔레그램 알림 (백그라운드 스레드에서 묶음 전송 - 주문/체결 처리 경로는 전송을 기다리지 않음)
+        self.telegram = TelegramNotifier(
+            TelegramUtil(),
+            coalesce_seconds=float(os.getenv("TELEGRAM_COALESCE_SECONDS", "1.0")),
+            min_interval=float(os.getenv("TELEGRAM_MIN_INTERVAL_SECONDS", "1.0"))
+        )
         
         # 봇 상태
         self.is_running = False
         self.total_trades = 0
         self.start_time = None
         
-        # 주문 추적 시스템
+        # 주문 추적 시스템 (매매 사이클 스레드와 체결통보 이벤트 루프가 함께 접근하므로 잠금 사용)
         self.active_orders = {}  # {order_no: {ticker, order_type, total_qty, executed_qty, remaining_qty, price, market}}
+        self.orders_lock = threading.RLock()
+        
+        # 매매 판단용 메모리 인덱스 (네트워크 조회 없이 먼저 걸러내기 위함)
+        self.last_order_times = {}  # {(ticker, order_type): 마지막 주문 시각(한국시간)}, 시작 시 주문내역으로 초기화
+        self.holdings = {}  # {ticker: 주문가능수량}, 잔고 조회/체결통보로 갱신 (미확인 종목은 키 없음)
+        self.account_cache = {}  # 회차 내 계좌 조회 결과 (주문 제출 시 초기화)
+        self.decision_skips = Counter()  # {"매수:사유" 또는 "매도:사유": 횟수}
+        self.portfolio_table = None  # 마지막 체결기준현재잔고 테이블
+        
+        # 매매 사이클 전용 실행기 (블로킹 REST 호출이 이벤트 루프를 막지 않도록 별도 스레드에서 실행)
+        self.cycle_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="trading-cycle")
+        self.cycle_future = None
+        self.cycle_stop_event = threading.Event()
+        self.cycle_shutdown_timeout = 30  # 종료 시 진행 중인 사이클 대기 시간(초)
+        
+        # WebSocket 프레임/REST 응답 캡처 (오프라인 재생 및 지연 분석용, CAPTURE_DIR을 비우면 기록 안 함)
+        capture_dir = os.getenv("CAPTURE_DIR", "captures")
+        self.capture_log = CaptureLog(capture_dir) if capture_dir else None
+        KisBase.setCaptureLog(self.capture_log)
+        
+        # 시작 준비(데이터 연결 확인, 미체결 동기화 등) 동시 실행 수
+        self.startup_workers = int(os.getenv("STARTUP_WORKERS", "4"))
         
         # 환경변수에서 시간 설정 가져오기
         market_start = os.getenv("MARKET_START_TIME")
@@ -105,26 +194,88 @@ class TradingBot:
         
         # 자동 종료 시간 (미국 현지시간 기준)  
         self.auto_shutdown_time = time(shutdown_hour, shutdown_min)
+        
+        # NYSE 거래일/조기폐장 캘린더 (MARKET_CLOSED_DATES: 규칙 외 임시 휴장일, YYYYMMDD 쉼표 구분)
+        extra_closures = [
+            datetime.strptime(value.strip(), "%Y%m%d").date()
+            for value in os.getenv("MARKET_CLOSED_DATES", "").split(",") if value.strip()
+        ]
+        self.market_calendar = MarketCalendar(extra_closures=extra_closures)
+        
+        # 봉 마감 정렬 스케줄러 (분봉 지표는 봉 마감 직후, 일봉/손절은 체크 간격마다 평가)
+        bar_settle_seconds = float(os.getenv("BAR_SETTLE_SECONDS", "3"))
+        self.scheduler = BarScheduler(
+            intervals=[self.rsi_interval, self.macd_interval],
+            live_interval_minutes=self.check_interval_minutes,
+            anchor_time=self.market_start_time,
+            settle_seconds=bar_settle_seconds
+        )
+        
+        # (종목, 작업 종류)별 주기/우선순위/시한을 갖는 작업 스케줄러
+        cycle_budget = os.getenv("CYCLE_BUDGET_SECONDS")
+        self.reconcile_interval_minutes = int(os.getenv("RECONCILE_INTERVAL_MINUTES", "5"))
+        self.job_scheduler = JobScheduler(
+            self.scheduler,
+            cycle_budget_seconds=float(cycle_budget) if cycle_budget else None
+        )
+        self.reconcile_misses = {}  # {order_no: 미체결 목록에서 연속으로 빠진 횟수}
+        
+        # 런타임 상태 체크포인트 (같은 세션 내 재시작 시 주문/대기시간/지표 상태를 이어받음)
+        self.checkpoint_store = CheckpointStore(os.getenv("CHECKPOINT_FILE", "checkpoint.pkl"))
+        self.checkpoint_interval_minutes = int(os.getenv("CHECKPOINT_INTERVAL_MINUTES", "5"))
+        self.indicator_checkpoint = {}  # 마지막으로 저장한 지표 상태 (주문 시 저장에서 재사용)
+        self.restored_from_checkpoint = False
+        self.registerJobs()
     
+    def getSessionWindow(self, us_date):
+        """설정된 장시간을 해당 날짜 NYSE 정규장에 맞춘 (시작, 종료, 자동 종료) 시각 (휴장일이면 None)
+
+        조기폐장일에는 종료 시각을 폐장 시각으로 당기고, 자동 종료 시각도 같은 간격만큼 당깁니다.
+        """
+        session = self.market_calendar.getSession(us_date)
+        if session is None:
+            return None
+
+        localize = DateTimeUtil.US_TIMEZONE.localize
+        start = localize(datetime.combine(us_date, self.market_start_time))
+        end = localize(datetime.combine(us_date, self.market_end_time))
+        shutdown = localize(datetime.combine(us_date, self.auto_shutdown_time))
+
+        _, session_close = session
+        if self.market_calendar.isEarlyClose(us_date) and end > session_close:
+            shutdown = session_close + max(shutdown - end, timedelta(0))
+            end = session_close
+        return start, end, shutdown
+
     def isMarketHours(self):
-        """현재 시간이 미국 장시간인지 확인 (미국 현지시간 기준)"""
-        us_now = DateTimeUtil.get_us_now().time()
+        """현재 시간이 미국 장시간인지 확인 (미국 현지시간 기준, 휴장일/조기폐장 반영)"""
+        us_now = DateTimeUtil.get_us_now()
         
         # 미국 시간 기준으로 장시간 체크
         if self.market_start_time <= self.market_end_time:
             # 같은 날 (예: 09:30 ~ 16:00)
-            return self.market_start_time <= us_now <= self.market_end_time
+            window = self.getSessionWindow(us_now.date())
+            return window is not None and window[0] <= us_now <= window[1]
         else:
             # 자정을 넘나드는 경우 (예: 23:00 ~ 04:00)  
-            return us_now >= self.market_start_time or us_now <= self.market_end_time
+            us_time = us_now.time()
+            if us_time >= self.market_start_time:
+                return self.market_calendar.isTradingDay(us_now.date())
+            if us_time <= self.market_end_time:
+                return self.market_calendar.isTradingDay(us_now.date() - timedelta(days=1))
+            return False
     
     def shouldShutdown(self):
-        """자동 종료 시간인지 확인 (미국 현지시간 기준)"""
+        """자동 종료 시간인지 확인 (미국 현지시간 기준, 조기폐장일에는 폐장 시각 기준으로 당김)"""
         us_now = DateTimeUtil.get_us_now()
         us_current_time = us_now.time()
         
         # 미국 시간 기준으로 자동 종료 시간 체크
-        if us_current_time >= self.auto_shutdown_time:
+        window = self.getSessionWindow(us_now.date()) if self.market_start_time <= self.market_end_time else None
+        if window is not None:
+            if us_now >= window[2]:
+                return True
+        elif us_current_time >= self.auto_shutdown_time:
             return True
         
         # 추가적으로 시작 시간 기준 최대 실행 시간 체크 (8시간)
@@ -143,18 +294,37 @@ class TradingBot:
             return elapsed_hours >= 8
         
         return False
+
+    def getNextMarketOpen(self, now=None):
+        """now 이후 가장 가까운 장 시작 시각 (미국 동부시간, 거래일 기준)"""
+        now = now or DateTimeUtil.get_us_now()
+        day = self.market_calendar.nextTradingDay(now.date())
+        while True:
+            start = DateTimeUtil.US_TIMEZONE.localize(datetime.combine(day, self.market_start_time))
+            if start > now:
+                return start
+            day = self.market_calendar.nextTradingDay(day, include_today=False)
+
+    def getMarketWaitSeconds(self, now=None):
+        """장외 시간 대기 시간 (다음 장 시작 또는 오늘 자동 종료 시각 중 이른 쪽까지, 초)"""
+        now = now or DateTimeUtil.get_us_now()
+        wakeup = self.getNextMarketOpen(now)
+
+        shutdown = DateTimeUtil.US_TIMEZONE.localize(datetime.combine(now.date(), self.auto_shutdown_time))
+        window = self.getSessionWindow(now.date()) if self.market_start_time <= self.market_end_time else None
+        if window is not None:
+            shutdown = window[2]
+        if now < shutdown < wakeup:
+            wakeup = shutdown
+        return max(1.0, (wakeup - now).total_seconds())
     
     def isUSMarketHoliday(self):
-        """미국 주식 시장 휴장일인지 확인 (미국 현지시간 기준)"""
-        us_now = DateTimeUtil.get_us_now()
-        us_date = us_now.date()
-        
-        # 미국 주식시장 휴장일 체크
-        us_holidays = holidays.US()
+        """미국 주식 시장 휴장일인지 확인 (미국 현지시간 기준, NYSE 휴장일/주말)"""
+        us_date = DateTimeUtil.get_us_now().date()
         
-        # NYSE/NASDAQ 휴장일인지 확인
-        if us_date in us_holidays:
-            holiday_name = us_holidays[us_date]
+        # NYSE 휴장일 체크 (성금요일 휴장, 콜럼버스 데이/재향군인의 날 개장)
+        holiday_name = self.market_calendar.getClosureName(us_date)
+        if holiday_name:
             self.logger.info(f"오늘은 미국 주식시장 휴장일입니다: {holiday_name}")
             return True, holiday_name
         
@@ -179,36 +349,59 @@ class TradingBot:
             return 0.0
     
     def getStockBalance(self, ticker, market):
-        """현재 주식 보유량 조회"""
+        """현재 주식 보유량 조회 (회차 내 재조회 없이 캐시 사용)"""
+        cache_key = ('stock', ticker)
+        with self.orders_lock:
+            cached = self.account_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            balance_info = self.kis_account.getBalance(market=market)
+            with self.latency_tracer.span("balance", ticker):
+                balance_info = self.kis_account.getBalance(market=market)
             stocks = balance_info.get('stocks', [])
             
+            stock_balance = {'quantity': 0, 'avg_price': 0, 'current_price': 0, 'profit_loss': 0}
             for stock in stocks:
                 if stock.get('ovrs_pdno') == ticker:
-                    return {
+                    stock_balance = {
                         'quantity': int(stock.get('ord_psbl_qty', '0')),  # 주문가능수량
                         'avg_price': float(stock.get('pchs_avg_pric', '0')),  # 매입평균가
                         'current_price': float(stock.get('now_pric2', '0')),  # 현재가
                         'profit_loss': float(stock.get('frcr_evlu_pfls_amt', '0'))  # 평가손익금액
                     }
+                    break
             
-            return {'quantity': 0, 'avg_price': 0, 'current_price': 0, 'profit_loss': 0}
+            with self.orders_lock:
+                self.account_cache[cache_key] = stock_balance
+                self.holdings[ticker] = stock_balance['quantity']
+            if self.stop_loss_engine is not None:
+                self.stop_loss_engine.updatePosition(ticker, stock_balance['quantity'], stock_balance['avg_price'])
+            return stock_balance
             
         except Exception as e:
             self.logger.error(f"주식 잔고 조회 중 오류 발생: {e}")
             return {'quantity': 0, 'avg_price': 0, 'current_price': 0, 'profit_loss': 0}
     def getPurchaseAmount(self, ticker, market, price="0"):
-        """특정 종목 기준 매수 가능 금액 조회"""
+        """특정 종목 기준 매수 가능 금액 조회 (회차 내 재조회 없이 캐시 사용)"""
+        cache_key = ('purchase', ticker)
+        with self.orders_lock:
+            cached = self.account_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
             # getOverseasPurchaseAmount로 매수가능한 외화금액 조회
             parse_market = self.kis_base.changeMarketCode(market, length=4)
-            balance_info = self.kis_account.getOverseasPurchaseAmount(market=parse_market, price=price, ticker=ticker)
+            with self.latency_tracer.span("balance", ticker):
+                balance_info = self.kis_account.getOverseasPurchaseAmount(market=parse_market, price=price, ticker=ticker)
             
             # 매수가능현금 (USD)
             cash_balance = float(balance_info.get('ord_psbl_frcr_amt', '0'))
             
             self.logger.debug(f"{ticker} 매수가능현금: ${cash_balance:.2f}")
+            with self.orders_lock:
+                self.account_cache[cache_key] = cash_balance
             return cash_balance
             
         except Exception as e:
@@ -307,65 +500,128 @@ class TradingBot:
             
         return None
     
+    def recordSkip(self, order_type, reason):
+        """매매 판단 단계별 제외 사유 집계"""
+        self.decision_skips[f"{order_type}:{reason}"] += 1
+
+    def getLastOrderDatetime(self, ticker, order_type):
+        """마지막 주문 시각 (한국시간, 메모리 인덱스 - 최초 1회만 주문내역 조회)"""
+        key = (ticker, order_type)
+        with self.orders_lock:
+            if key in self.last_order_times:
+                return self.last_order_times[key]
+        
+        # 주문내역 조회(네트워크)는 잠금 밖에서 수행
+        if order_type == '매수':
+            order_time_str = self.getLastBuyOrderTime(ticker)
+        else:
+            order_time_str = self.getLastSellOrderTime(ticker)
+        
+        last_order_datetime = None
+        if order_time_str:
+            # 오늘 날짜로 datetime 객체 생성 (한국시간)
+            today_kr = DateTimeUtil.get_kr_date_str()  # YYYYMMDD
+            last_order_datetime = DateTimeUtil.parse_kr_datetime(today_kr, order_time_str)
+        
+        # 조회 중 다른 스레드가 주문을 제출했으면 그 시각을 유지
+        with self.orders_lock:
+            return self.last_order_times.setdefault(key, last_order_datetime)
+
+    def markOrderSubmitted(self, ticker, order_type):
+        """주문 제출 시 마지막 주문 시각 갱신 및 계좌 조회 캐시 초기화 (손절 스레드에서도 호출)"""
+        with self.orders_lock:
+            self.last_order_times[(ticker, order_type)] = datetime.now(DateTimeUtil.KR_TIMEZONE)
+            self.account_cache.clear()
+
+    def isInCooldown(self, ticker, order_type):
+        """매수/매도 대기시간 중인지 확인 (한국시간 기준, 메모리 조회)"""
+        last_order_datetime = self.getLastOrderDatetime(ticker, order_type)
+        if last_order_datetime is None:
+            return False
+        
+        delay_minutes = self.buy_delay_minutes if order_type == '매수' else self.sell_delay_minutes
+        time_diff = DateTimeUtil.get_time_diff_minutes_kr(last_order_datetime)
+        if time_diff < delay_minutes:
+            remaining_minutes = delay_minutes - time_diff
+            self.logger.debug(f"{ticker} {order_type} 대기 중: {remaining_minutes:.1f}분 후 가능")
+            return True
+        
+        return False
+
+    def hasActiveOrders(self, ticker):
+        """추적 중인 미체결 주문 존재 여부 (메모리 조회, 미체결 동기화 작업으로 최신화)"""
+        with self.orders_lock:
+            return any(order['ticker'] == ticker and order['remaining_qty'] > 0
+                       for order in self.active_orders.values())
+
+    def getBuySkipReason(self, ticker):
+        """1단계(메모리) 매수 제외 사유: 매수 대기시간, 미체결 주문"""
+        if self.isInCooldown(ticker, '매수'):
+            return "대기시간"
+        if self.hasActiveOrders(ticker):
+            return "미체결주문"
+        return None
+
+    def getSellSkipReason(self, ticker):
+        """1단계(메모리) 매도 제외 사유: 매도 대기시간, 미체결 주문, 보유 수량 없음"""
+        if self.isInCooldown(ticker, '매도'):
+            return "대기시간"
+        if self.hasActiveOrders(ticker):
+            return "미체결주문"
+        with self.orders_lock:
+            if self.holdings.get(ticker) == 0:
+                return "보유없음"
+        return None
+
     def shouldBuy(self, ticker, market, current_price):
-        """매수 신호 종합 판단 (RSI + 대기시간 + 계좌 조건)"""
+        """매수 신호 종합 판단 (비용이 낮은 단계부터: 메모리 조건 → 지표 → 계좌 조회)"""
         rsi_strategy = self.rsi_strategies[ticker]
         
-        # RSI 신호 확인
-        if not rsi_strategy.getBuySignal():
+        # 1단계: 대기시간/미체결 주문 (메모리)
+        skip_reason = self.getBuySkipReason(ticker)
+        if skip_reason:
+            self.recordSkip('매수', skip_reason)
             return False
         
-        # 매수 대기시간 체크 (한국시간 기준)
-        last_buy_time_str = self.getLastBuyOrderTime(ticker)
-        if last_buy_time_str:
-            # 오늘 날짜로 datetime 객체 생성 (한국시간)
-            today_kr = DateTimeUtil.get_kr_date_str()  # YYYYMMDD
-            last_buy_datetime = DateTimeUtil.parse_kr_datetime(today_kr, last_buy_time_str)
-            
-            time_diff = DateTimeUtil.get_time_diff_minutes_kr(last_buy_datetime)
-            if time_diff < self.buy_delay_minutes:
-                remaining_minutes = self.buy_delay_minutes - time_diff
-                self.logger.info(f"{ticker} 매수 대기 중: {remaining_minutes:.1f}분 후 가능")
-                return False
+        # 2단계: RSI 신호 (이번 회차에 계산된 지표)
+        if not rsi_strategy.getBuySignal():
+            self.recordSkip('매수', "RSI")
+            return False
         
-        # 계좌 잔고 확인
+        # 3단계: 계좌 잔고 확인 (네트워크)
         cash_balance = self.getPurchaseAmount(ticker, market, current_price)
         if cash_balance < current_price:
             self.logger.debug(f"{ticker} 매수 불가: 현금 부족 (${cash_balance:.2f})")
+            self.recordSkip('매수', "현금부족")
             return False
         
         return True
     
     def shouldSell(self, ticker, market):
-        """매도 신호 종합 판단 (RSI + MACD 골든크로스 + 대기시간 + 보유 주식 조건)"""
+        """매도 신호 종합 판단 (비용이 낮은 단계부터: 메모리 조건 → 지표 → 계좌 조회)"""
         rsi_strategy = self.rsi_strategies[ticker]
         macd_strategy = self.macd_strategies[ticker]
         
-        # RSI 신호 확인
+        # 1단계: 대기시간/미체결 주문/보유 수량 (메모리)
+        skip_reason = self.getSellSkipReason(ticker)
+        if skip_reason:
+            self.recordSkip('매도', skip_reason)
+            return False
+        
+        # 2단계: RSI 신호, MACD 최근 N봉 골든크로스 (이번 회차에 계산된 지표, O(1) 조회)
         if not rsi_strategy.getSellSignal():
+            self.recordSkip('매도', "RSI")
             return False
         
-        # MACD 최근 N봉 골든크로스 신호 확인
         if not macd_strategy.hasRecentGoldenCross(5):
+            self.recordSkip('매도', "MACD")
             return False
         
-        # 매도 대기시간 체크 (한국시간 기준)
-        last_sell_time_str = self.getLastSellOrderTime(ticker)
-        if last_sell_time_str:
-            # 오늘 날짜로 datetime 객체 생성 (한국시간)
-            today_kr = DateTimeUtil.get_kr_date_str()  # YYYYMMDD
-            last_sell_datetime = DateTimeUtil.parse_kr_datetime(today_kr, last_sell_time_str)
-            
-            time_diff = DateTimeUtil.get_time_diff_minutes_kr(last_sell_datetime)
-            if time_diff < self.sell_delay_minutes:
-                remaining_minutes = self.sell_delay_minutes - time_diff
-                self.logger.info(f"{ticker} 매도 대기 중: {remaining_minutes:.1f}분 후 가능")
-                return False
-        
-        # 보유 주식 확인
+        # 3단계: 보유 주식 확인 (네트워크)
         stock_balance = self.getStockBalance(ticker, market)
         if stock_balance['quantity'] == 0:
             self.logger.debug(f"{ticker} 매도 불가: 보유 주식 없음")
+            self.recordSkip('매도', "보유없음")
             return False
         
         return True
@@ -373,8 +629,8 @@ class TradingBot:
     def executeBuyOrder(self, ticker, market, current_price):
         """매수 주문 실행"""
         try:
-            # 미체결 주문 확인
-            if self.hasUnfilledOrders(ticker, market):
+            # 미체결 주문 확인 (추적 중인 주문 기준)
+            if self.hasActiveOrders(ticker):
                 self.logger.info(f"{ticker} 미체결 주문이 있어 새로운 매수 주문을 취소합니다")
                 return False
                 
@@ -384,19 +640,21 @@ class TradingBot:
             parse_market = self.kis_base.changeMarketCode(market, length=4)
             
             # 매수 주문 실행
-            result = self.kis_order.buyOrder(
-                ticker=ticker,
-                quantity=quantity,
-                price=current_price,
-                market=parse_market,
-                ord_dvsn="00"  # 지정가 주문
-            )
+            with self.latency_tracer.span("order", ticker):
+                result = self.kis_order.buyOrder(
+                    ticker=ticker,
+                    quantity=quantity,
+                    price=current_price,
+                    market=parse_market,
+                    ord_dvsn="00"  # 지정가 주문
+                )
             
             if result:
                 self.total_trades += 1
+                self.markOrderSubmitted(ticker, '매수')
                 
                 # 주문번호 추출 및 추적 시스템에 추가
-                order_no = str(int(result.get('ODNO', '')))
+                order_no = self.kis_base.normalizeOrderNo(result.get('ODNO'))
                 if order_no:
                     self.addOrderToTracker(order_no, ticker, '매수', quantity, current_price, market)
                 
@@ -425,8 +683,8 @@ RSI: {rsi:.1f}
     def executeSellOrder(self, ticker, market, current_price):
         """매도 주문 실행"""
         try:
-            # 미체결 주문 확인
-            if self.hasUnfilledOrders(ticker, market):
+            # 미체결 주문 확인 (추적 중인 주문 기준)
+            if self.hasActiveOrders(ticker):
                 self.logger.info(f"{ticker} 미체결 주문이 있어 새로운 매도 주문을 취소합니다")
                 return False
                 
@@ -441,19 +699,24 @@ RSI: {rsi:.1f}
             parse_market = self.kis_base.changeMarketCode(market, length=4)
             
             # 매도 주문 실행
-            result = self.kis_order.sellOrder(
-                ticker=ticker,
-                quantity=quantity,
-                price=current_price,
-                market=parse_market,
-                ord_dvsn="00"  # 지정가 주문
-            )
+            with self.latency_tracer.span("order", ticker):
+                result = self.kis_order.sellOrder(
+                    ticker=ticker,
+                    quantity=quantity,
+                    price=current_price,
+                    market=parse_market,
+                    ord_dvsn="00"  # 지정가 주문
+                )
             
             if result:
                 self.total_trades += 1
+                self.markOrderSubmitted(ticker, '매도')
+                if self.stop_loss_engine is not None:
+                    # 손절 엔진의 주문가능수량에서 주문 수량 차감 (이후 손절 시 과다 매도 방지)
+                    self.stop_loss_engine.applySellOrder(ticker, quantity)
                 
                 # 주문번호 추출 및 추적 시스템에 추가
-                order_no = str(int(result.get('ODNO', '')))
+                order_no = self.kis_base.normalizeOrderNo(result.get('ODNO'))
                 if order_no:
                     self.addOrderToTracker(order_no, ticker, '매도', quantity, current_price, market)
                 
@@ -487,59 +750,36 @@ RSI: {rsi:.1f}{macd_info}
 
         return False
 
-    def checkStopLoss(self, ticker, market, present_balance_stocks):
-        """현재잔고 평가수익률을 기반으로 손절 조건을 점검"""
-        stock_balance = self.getStockBalance(ticker, market)
-        quantity = stock_balance.get('quantity', 0)
-        if quantity is None or quantity <= 0:
-            return False
+    def onStreamPrice(self, event):
+        """시세 버스 실시간 체결가 수신 시 손절 점검 (이벤트 루프에서 호출, O(1))"""
+        self.stop_loss_engine.onPrice(event.ticker, event.price)
 
-        ticker_code = str(ticker).strip().upper()
-        balance_stock = None
-        for stock in present_balance_stocks or []:
-            if not isinstance(stock, dict):
-                continue
-            code = stock.get('ovrs_pdno') or stock.get('pdno')
-            if code and str(code).strip().upper() == ticker_code:
-                balance_stock = stock
-                break
+    def onStopLossTriggered(self, ticker, price, position):
+        """손절 엔진 발동 시 손절 주문을 전용 스레드에 즉시 제출"""
+        self.stop_loss_executor.submit(self.executeStopLoss, ticker, price, position)
 
-        if balance_stock is None:
-            self.logger.debug(f"{ticker} 현재잔고 데이터가 없어 손절 확인을 건너뜁니다.")
-            return False
-
-        raw_rate = balance_stock.get('evlu_pfls_rt1')
-        if raw_rate is None:
-            self.logger.debug(f"{ticker} 평가수익률(evlu_pfls_rt1) 데이터가 없습니다.")
-            return False
-
-        try:
-            if isinstance(raw_rate, str):
-                cleaned = raw_rate.replace(',', '').replace('%', '').strip()
-                profit_rate = float(cleaned) if cleaned else None
-            else:
-                profit_rate = float(raw_rate)
-        except (ValueError, TypeError):
-            profit_rate = None
-
-        if profit_rate is None:
-            self.logger.debug(f"{ticker} 평가수익률(evlu_pfls_rt1) 값을 해석할 수 없습니다.")
-            return False
-
-        if self.stop_loss_rate is None:
-            return False
+    def executeStopLoss(self, ticker, price, position):
+        """손절가 도달 종목 시장가 매도 (잔고 재조회 없이 엔진의 포지션 사용)"""
+        market = self.trading_tickers[ticker]
+        avg_price = position['avg_price']
 
-        if profit_rate < self.stop_loss_rate:
-            self.logger.info(f"{ticker} 손절 조건 충족: 평가수익률 {profit_rate:.2f}% < 기준 {self.stop_loss_rate:.2f}%")
-            return self.executeStopLossSell(
-                ticker=ticker,
-                market=market,
-                quantity=int(quantity),
-                profit_rate=profit_rate,
-                stock_balance=stock_balance
-            )
+        # 포지션 수량은 주문가능수량 (미체결 매도 주문 수량은 증권사가 이미 제외)
+        quantity = int(position['quantity'])
+        if quantity <= 0:
+            # 발동 상태를 유지해 매 가격 갱신마다 다시 제출하지 않음 (주문가능수량이 늘면 잔고 갱신 시 다시 발동 가능)
+            self.logger.warning(f"{ticker} 손절 조건 충족했으나 주문가능수량이 없어 손절 주문을 내지 않습니다.")
+            return
 
-        return False
+        profit_rate = (price / avg_price - 1) * 100
+        stock_balance = {
+            'quantity': position['quantity'],
+            'avg_price': avg_price,
+            'current_price': price,
+            'profit_loss': (price - avg_price) * position['quantity']
+        }
+        if not self.executeStopLossSell(ticker, market, quantity, profit_rate, stock_balance):
+            # 주문 실패 시 다음 가격 갱신에서 다시 시도
+            self.stop_loss_engine.resetTrigger(ticker)
 
     def executeStopLossSell(self, ticker, market, quantity, profit_rate, stock_balance):
         """손절 조건 충족 시 시장가 매도 주문 실행"""
@@ -548,25 +788,24 @@ RSI: {rsi:.1f}{macd_info}
 
         try:
             parse_market = self.kis_base.changeMarketCode(market, length=4)
-            result = self.kis_order.sellOrder(
-                ticker=ticker,
-                quantity=quantity,
-                price=0,
-                market=parse_market,
-                ord_dvsn="01"  # 시장가 주문
-            )
+            with self.latency_tracer.span("stop_loss_order", ticker):
+                result = self.kis_order.sellOrder(
+                    ticker=ticker,
+                    quantity=quantity,
+                    price=0,
+                    market=parse_market,
+                    ord_dvsn="01"  # 시장가 주문
+                )
 
             if result:
                 self.total_trades += 1
+                self.markOrderSubmitted(ticker, '매도')
 
-                order_no_raw = result.get('ODNO', '')
-                order_no = str(order_no_raw).strip()
+                order_no = self.kis_base.normalizeOrderNo(result.get('ODNO'))
                 if order_no:
-                    try:
-                        order_no = str(int(order_no))
-                    except (ValueError, TypeError):
-                        pass
                     self.addOrderToTracker(order_no, ticker, '매도', quantity, 0.0, market)
+                    # 이 주문이 전량 체결되지 않고 추적에서 빠지면 손절을 다시 발동할 수 있도록 기록
+                    self.stop_loss_engine.setStopOrder(ticker, order_no)
 
                 profit_loss = stock_balance.get('profit_loss', 0.0)
                 avg_price = stock_balance.get('avg_price', 0.0)
@@ -595,61 +834,273 @@ RSI: {rsi:.1f}{macd_info}
 
         return False
 
-    def processTradingSignal(self):
-        """모든 종목에 대한 매매 신호 처리"""
-        present_balance_stocks = None
+    def registerJobs(self):
+        """종목별 작업 등록
 
-        for ticker, market in self.trading_tickers.items():
-            try:
-                rsi_strategy = self.rsi_strategies[ticker]
-                macd_strategy = self.macd_strategies[ticker]
-
-                if self.stop_loss_rate is not None:
-                    if present_balance_stocks is None:
-                        try:
-                            balance_data = self.kis_account.getOverseasPresentBalance()
-                            stocks = balance_data.get('stocks', [])
-                            if isinstance(stocks, list):
-                                present_balance_stocks = stocks
-                            else:
-                                present_balance_stocks = []
-                        except Exception as balance_error:
-                            self.logger.error(f"현재잔고 조회 중 오류: {balance_error}")
-                            present_balance_stocks = []
+        - portfolio: 잔고 갱신 및 손절 일괄 점검 (계좌 단위, 고우선순위, CHECK_INTERVAL_MINUTES 주기)
+        - reconcile: 미체결/체결 동기화 (고우선순위, RECONCILE_INTERVAL_MINUTES 주기)
+        - signal: 지표 갱신 및 매수/매도 신호 평가 (저우선순위, 가장 짧은 지표 인터벌 주기)
+        - checkpoint: 런타임 상태 저장 (계좌 단위, CHECKPOINT_INTERVAL_MINUTES 주기, 0이면 등록 안 함)
+        """
+        live_seconds = self.check_interval_minutes * 60
+        reconcile_seconds = self.reconcile_interval_minutes * 60
+        signal_seconds = min(
+            self.scheduler.periods[self.scheduler.intervalToken(interval)]
+            for interval in (self.rsi_interval, self.macd_interval)
+        )
 
-                    try:
-                        if self.checkStopLoss(ticker, market, present_balance_stocks):
-                            continue
-                    except Exception as stop_loss_error:
-                        self.logger.error(f"{ticker} 손절 점검 중 오류: {stop_loss_error}")
+        self.job_scheduler.addJob(None, "portfolio", self.runPortfolioJob, live_seconds,
+                                  JobScheduler.PRIORITY_HIGH, deadline_seconds=15)
+        for ticker in self.trading_tickers.keys():
+            self.job_scheduler.addJob(ticker, "reconcile", self.runReconcileJob, reconcile_seconds,
+                                      JobScheduler.PRIORITY_HIGH, deadline_seconds=30)
+            self.job_scheduler.addJob(ticker, "signal", self.runSignalJob, signal_seconds,
+                                      JobScheduler.PRIORITY_LOW, deadline_seconds=signal_seconds)
+        if self.checkpoint_interval_minutes > 0:
+            self.job_scheduler.addJob(None, "checkpoint", self.runCheckpointJob, self.checkpoint_interval_minutes * 60,
+                                      JobScheduler.PRIORITY_NORMAL, deadline_seconds=10)
 
-                # 현재가 조회
-                parse_market = self.kis_base.changeMarketCode(market)
-                price_info = rsi_strategy.kis_price.getPrice(parse_market, ticker)
-                current_price = float(price_info.get('last', 0))
-                
-                if current_price <= 0:
-                    self.logger.warning(f"{ticker} 유효한 가격 정보를 가져올 수 없습니다.")
-                    continue
+    def refreshPortfolio(self):
+        """체결기준현재잔고를 한 번 조회해 포트폴리오 테이블로 변환하고 보유 수량/손절가 일괄 갱신
 
-                # 최신 RSI를 미리 계산해 신호 판단에서 재사용
-                rsi_strategy.getCurrentRsi(force_refresh=True)
+        Returns:
+            list: 평가수익률이 손절 기준 미만인 종목 목록
+        """
+        balance_data = self.kis_account.getOverseasPresentBalance()
+        table = PortfolioTable.from_present_balance(balance_data.get('stocks', []))
+        self.portfolio_table = table
 
-                self.logger.info(f"{ticker} 현재가: ${current_price:.2f} RSI: {rsi_strategy.getCurrentRsi():.1f}")
+        tickers = list(self.trading_tickers.keys())
+        with self.orders_lock:
+            for ticker in tickers:
+                row = table.get_row(ticker)
+                self.holdings[ticker] = int(row['orderable_qty']) if row else 0
 
-                # 매수 신호 확인
-                if self.shouldBuy(ticker, market, current_price):
-                    self.logger.info(f"{ticker} 매수 신호 감지!")
-                    self.executeBuyOrder(ticker, market, current_price)
-                
-                # 매도 신호 확인
-                elif self.shouldSell(ticker, market):
-                    self.logger.info(f"{ticker} 매도 신호 감지!")
-                    self.executeSellOrder(ticker, market, current_price)
-                    
-            except Exception as e:
-                self.logger.error(f"{ticker} 매매 신호 처리 중 오류: {e}")
-                continue
+        exposure = table.total_exposure(tickers)
+        weights = table.weights(tickers)
+        if weights:
+            weight_summary = ", ".join(f"{ticker} {weight * 100:.1f}%" for ticker, weight in weights.items())
+            self.logger.debug(f"포트폴리오 평가금액 ${exposure:,.2f} ({weight_summary})")
+
+        if self.stop_loss_engine is None:
+            return []
+
+        self.stop_loss_engine.loadTable(table, tickers)
+        return table.evaluate_stop_loss(self.stop_loss_rate, tickers)
+
+    def runPortfolioJob(self, job, boundary):
+        """잔고 갱신 및 손절 일괄 점검 작업 (실시간 체결가가 끊긴 경우를 대비)"""
+        for ticker in self.refreshPortfolio():
+            row = self.portfolio_table.get_row(ticker)
+            self.logger.info(f"{ticker} 손절 조건 충족: 평가수익률 {row['pnl_rate']:.2f}% < 기준 {self.stop_loss_rate:.2f}%")
+            self.stop_loss_engine.trigger(ticker, row['current_price'])
+
+    def runReconcileJob(self, job, boundary):
+        """미체결/체결 동기화 작업 (체결통보 누락 대비)"""
+        self.reconcileOrders(job.ticker, self.trading_tickers[job.ticker])
+
+    def runSignalJob(self, job, boundary):
+        """지표 갱신 및 매매 신호 평가 작업"""
+        ticker = job.ticker
+        with self.latency_tracer.span("signal", ticker):
+            self.processTradingSignal(ticker, self.trading_tickers[ticker], self.scheduler.getDueTokens(boundary))
+
+        if self.first_decision_seconds is None:
+            self.first_decision_seconds = time_module.monotonic() - self.init_started
+            self.logger.info(
+                f"첫 매매 판단 완료: 봇 생성 후 {self.first_decision_seconds:.2f}초 "
+                f"(시작 준비 {self.startup_seconds or 0:.2f}초, 이후 첫 봉 경계 대기 포함)"
+            )
+
+    def runCheckpointJob(self, job, boundary):
+        """런타임 상태 저장 작업"""
+        self.saveCheckpoint()
+
+    def buildCheckpoint(self, include_indicators=True):
+        """체크포인트 상태 구성
+
+        지표 그래프는 매매 사이클 스레드에서만 갱신되므로, 다른 스레드(손절 주문 등)에서
+        저장할 때는 include_indicators=False로 마지막으로 저장한 지표 상태를 재사용합니다.
+        """
+        if include_indicators:
+            self.indicator_checkpoint = {
+                'graphs': self.indicator_engine.exportState(),
+                'macd_cross_events': {
+                    ticker: list(strategy.cross_events) for ticker, strategy in self.macd_strategies.items()
+                }
+            }
+
+        with self.orders_lock:
+            return {
+                'session_date': DateTimeUtil.get_us_date_str(),
+                'trading_tickers': dict(self.trading_tickers),
+                'intervals': (self.rsi_interval, self.macd_interval),
+                'active_orders': {order_no: dict(order) for order_no, order in self.active_orders.items()},
+                'reconcile_misses': dict(self.reconcile_misses),
+                'last_order_times': dict(self.last_order_times),
+                'total_trades': self.total_trades,
+                'decision_skips': dict(self.decision_skips),
+                'stop_loss_positions': self.stop_loss_engine.getPositions() if self.stop_loss_engine else {},
+                'indicators': self.indicator_checkpoint
+            }
+
+    def saveCheckpoint(self, include_indicators=True):
+        """런타임 상태를 체크포인트 파일에 저장 (실패해도 매매는 계속)"""
+        try:
+            size = self.checkpoint_store.save(self.buildCheckpoint(include_indicators))
+            self.logger.debug(f"체크포인트 저장: {size:,} bytes")
+        except Exception as e:
+            self.logger.error(f"체크포인트 저장 오류: {e}")
+
+    def restoreCheckpoint(self):
+        """같은 세션(미국 현지 날짜)·같은 종목/인터벌 설정의 체크포인트가 있으면 상태 복원
+        Returns:
+            bool: 복원 여부
+        """
+        state, saved_at = self.checkpoint_store.load()
+        if state is None:
+            return False
+
+        if state.get('session_date') != DateTimeUtil.get_us_date_str():
+            self.logger.info(f"이전 세션({state.get('session_date')}) 체크포인트는 사용하지 않습니다.")
+            return False
+        if state.get('trading_tickers') != self.trading_tickers or \
+                tuple(state.get('intervals', ())) != (self.rsi_interval, self.macd_interval):
+            self.logger.info("거래 종목/지표 인터벌 설정이 달라 체크포인트를 사용하지 않습니다.")
+            return False
+
+        with self.orders_lock:
+            # 이전 버전에서 저장한 패딩된 주문번호도 같은 키로 대조되도록 정규화
+            self.active_orders = {KisBase.normalizeOrderNo(order_no): order
+                                  for order_no, order in state['active_orders'].items()}
+            self.reconcile_misses = {KisBase.normalizeOrderNo(order_no): misses
+                                     for order_no, misses in state['reconcile_misses'].items()}
+            self.last_order_times = state['last_order_times']
+            self.total_trades = state['total_trades']
+            self.decision_skips = Counter(state['decision_skips'])
+
+        if self.stop_loss_engine is not None:
+            self.stop_loss_engine.restorePositions(state['stop_loss_positions'])
+
+        indicators = state.get('indicators') or {}
+        restored_graphs = self.indicator_engine.restoreState(indicators.get('graphs', {}))
+        for ticker, events in indicators.get('macd_cross_events', {}).items():
+            if ticker in self.macd_strategies:
+                self.macd_strategies[ticker].cross_events.extend(events)
+        self.indicator_checkpoint = indicators
+
+        self.restored_from_checkpoint = True
+        self.logger.info(
+            f"체크포인트 복원 ({saved_at:%H:%M:%S} 저장): 추적 주문 {len(self.active_orders)}건, "
+            f"지표 그래프 {restored_graphs}개, 총 거래횟수 {self.total_trades}"
+        )
+        return True
+
+    def processTradingSignal(self, ticker, market, due=None):
+        """종목 매매 신호 처리
+        Args:
+            ticker (str): 종목 코드
+            market (str): 거래소 코드
+            due (set): 이번에 마감된 인터벌 토큰 (None이면 모든 지표를 평가)
+        """
+        rsi_strategy = self.rsi_strategies[ticker]
+        macd_strategy = self.macd_strategies[ticker]
+        rsi_due = self.scheduler.isDue(self.rsi_interval, due)
+        macd_due = self.scheduler.isDue(self.macd_interval, due)
+
+        # 마감된 인터벌이 없으면 신호 평가 생략
+        if not (rsi_due or macd_due):
+            return
+
+        # 매수/매도 모두 메모리 조건(대기시간, 미체결 주문, 보유 수량)에서 걸리면 네트워크 조회 없이 종료
+        with self.latency_tracer.span("cooldown", ticker):
+            buy_skip_reason = self.getBuySkipReason(ticker)
+            sell_skip_reason = self.getSellSkipReason(ticker)
+        if buy_skip_reason and sell_skip_reason:
+            self.recordSkip('매수', buy_skip_reason)
+            self.recordSkip('매도', sell_skip_reason)
+            return
+
+        # 현재가 (최근 실시간 체결가가 있으면 사용, 없거나 오래되면 API 조회)
+        stream_event = self.signal_prices.getLatest(ticker, max_age=self.stream_price_max_age)
+        if stream_event is not None:
+            current_price = stream_event.price
+            price_source = "stream"
+        else:
+            price_source = "rest"
+            parse_market = self.kis_base.changeMarketCode(market)
+            with self.latency_tracer.span("price", ticker):
+                price_info = self.kis_price.getPrice(parse_market, ticker)
+            current_price = float(price_info.get('last', 0))
+        
+        if current_price <= 0:
+            self.logger.warning(f"{ticker} 유효한 가격 정보를 가져올 수 없습니다.")
+            self.recordSkip('가격', "조회실패")
+            return
+
+        # 조회한 현재가로도 손절 점검
+        if self.stop_loss_engine is not None and self.stop_loss_engine.onPrice(ticker, current_price):
+            return
+
+        # 현재가를 미완성 봉으로 반영하고 마감된 봉을 그래프에 반영
+        # (차트 조회/마감 봉 반영은 지표 엔진에서 chart_fetch/indicator 구간으로 기록되므로 live_indicator 구간 밖에서 실행,
+        #  RSI 그래프는 여기서 갱신해 두면 같은 사이클의 getCurrentRsi에서는 다시 조회하지 않음)
+        self.indicator_engine.updateLivePrice(ticker, current_price)
+        if rsi_due:
+            self.indicator_engine.refresh(ticker, rsi_strategy.interval)
+        if macd_due:
+            # 마감된 MACD 봉 반영 (골든크로스 여부는 이후 O(1) 조회)
+            macd_strategy.updateBars()
+
+        # 최신 RSI를 미리 계산해 신호 판단에서 재사용
+        with self.latency_tracer.span("live_indicator", ticker):
+            rsi_strategy.getCurrentRsi(force_refresh=rsi_due)
+
+        self.log_util.log_event("signal_eval", logging.DEBUG, ticker=ticker, price=current_price,
+                                price_source=price_source, rsi=rsi_strategy.getCurrentRsi())
+
+        # 매수 신호 확인
+        if self.shouldBuy(ticker, market, current_price):
+            self.logger.info(f"{ticker} 매수 신호 감지!")
+            self.executeBuyOrder(ticker, market, current_price)
+        
+        # 매도 신호 확인
+        elif self.shouldSell(ticker, market):
+            self.logger.info(f"{ticker} 매도 신호 감지!")
+            self.executeSellOrder(ticker, market, current_price)
+
+    def processScheduledJobs(self):
+        """예정 시각이 된 작업 실행 (고우선순위 작업 우선, 초과 예상 시 저우선순위 작업 차단)"""
+        # 회차 시작 (종목/인터벌별 차트와 현재잔고는 회차당 1회만 조회)
+        self.indicator_engine.beginCycle()
+        with self.orders_lock:
+            self.account_cache = {}
+
+        summary = self.job_scheduler.runDue(stop_event=self.cycle_stop_event)
+        if summary['ran'] or summary['shed']:
+            self.logger.info(
+                f"매매 사이클 완료: 실행 {summary['ran']}건, 건너뜀 {summary['shed']}건, "
+                f"시한 초과 {summary['deadline_misses']}건, 스케줄 지연 {summary['lag']:.3f}초"
+            )
+
+        # 회차 구간별 소요 시간 요약 (합계 상위 구간)
+        latency_summary = self.latency_tracer.end_cycle()
+        if latency_summary:
+            self.logger.info(f"사이클 구간 지연: {LatencyTracer.format_summary(latency_summary)}")
+        return summary
+
+    def exportCycleLatency(self, snapshot):
+        """회차 구간 지연 내보내기 (JSON Lines 이벤트 파일에 회차 요약과 구간별 p50/p95/p99 기록)"""
+        self.log_util.log_event("cycle_latency", cycle=snapshot['cycle'], percentiles=snapshot['percentiles'])
+    
+    async def runTradingCycle(self):
+        """매매 사이클을 전용 실행기 스레드에서 실행하고 완료까지 대기
+
+        사이클이 도는 동안에도 이벤트 루프는 WebSocket 체결통보 수신과 PINGPONG 응답을 계속 처리합니다.
+        """
+        loop = asyncio.get_running_loop()
+        self.cycle_future = loop.run_in_executor(self.cycle_executor, self.processScheduledJobs)
+        await self.cycle_future
     
     async def startTrading(self):
         """매매 봇 시작"""
@@ -661,65 +1112,73 @@ RSI: {rsi:.1f}{macd_info}
         self.logger.info(f"체크 간격: {self.check_interval_minutes}분")
         self.logger.info(f"장시간: {self.market_start_time} - {self.market_end_time}")
         
-        # 미국 주식시장 휴장일 체크
-        is_holiday, holiday_name = self.isUSMarketHoliday()
-        if is_holiday:
-            holiday_msg = f"[휴장] 오늘은 미국 주식시장 휴장일입니다.\n휴일: {holiday_name}"
-            self.logger.info(holiday_msg)
-            self.telegram.sendMessage(holiday_msg)
-            return
-        
-        # RSI 데이터 연결 상태 확인 (선택적)
-        for ticker in self.trading_tickers.keys():
-            rsi_strategy = self.rsi_strategies[ticker]
-            
-            # 데이터 연결 상태 확인 (실패해도 계속 진행)
-            if not rsi_strategy.validateDataConnection():
-                self.logger.warning(f"{ticker} RSI 데이터 연결 경고 - 계속 진행합니다.")
-    
-        # 시작 시점 미체결 주문 동기화 -> active_orders 초기화
+        # 휴장일/WebSocket 연결 실패로 일찍 끝나도 종료 처리(텔레그램 알림 전송, 아카이브/캡처 로그 정리)를 거치도록
+        # 시작 과정 전체를 try/finally 안에서 실행
         try:
-            self.syncActiveOrders()
-        except Exception as e:
-            self.logger.error(f"미체결 주문 동기화 오류: {e}")
-
-         # 장 시작시 봇 정보와 보유 종목 현황을 통합하여 한 번에 전송
-        self.sendPortfolioStatus()
+            # 미국 주식시장 휴장일 체크
+            is_holiday, holiday_name = self.isUSMarketHoliday()
+            if is_holiday:
+                holiday_msg = f"[휴장] 오늘은 미국 주식시장 휴장일입니다.\n휴일: {holiday_name}"
+                self.logger.info(holiday_msg)
+                self.telegram.sendMessage(holiday_msg)
+                return
         
-        # WebSocket 체결통보 연결 시작
-        try:
-            self.kis_websocket.set_execution_callback(self.handle_execution_notification)
-            self.websocket_task = asyncio.create_task(self.kis_websocket.connect())
-            await asyncio.sleep(2)  # 연결 안정화 대기
-        except Exception as e:
-            self.logger.error(f"WebSocket 연결 실패: {e}")
-            return
+            # 세션별 캡처 파일 시작 (시작 준비 단계의 REST 응답부터 기록)
+            if self.capture_log is not None:
+                self.capture_log.rotate(DateTimeUtil.get_us_date_str())
         
-        try:
+            # 데이터 연결 확인, 미체결 동기화, 마지막 주문 시각/잔고 초기화, 시작 알림을 동시에 실행
+            self.prepareTrading()
+        
+            # WebSocket 체결통보 및 거래 종목 실시간 체결가(시세 버스로 발행) 연결 시작
+            try:
+                self.kis_websocket.set_execution_callback(self.handle_execution_notification)
+                self.kis_websocket.set_price_subscriptions(
+                    [(self.kis_base.changeMarketCode(market), ticker) for ticker, market in self.trading_tickers.items()]
+                )
+                self.websocket_task = asyncio.create_task(self.superviseWebSocket())
+                await asyncio.sleep(2)  # 연결 안정화 대기
+            except Exception as e:
+                self.logger.error(f"WebSocket 연결 실패: {e}")
+                return
+        
+            jobs_started = False
             while self.is_running:
                 # 자동 종료 시간 체크
                 if self.shouldShutdown():
                     self.logger.info("자동 종료 시간에 도달했습니다. 프로그램을 종료합니다.")
                     break
                 
-                # 장시간 체크
+                # 장시간 체크 (다음 장 시작 또는 자동 종료 시각까지 한 번에 대기)
+                if not self.isMarketHours():
+                    wait_seconds = self.getMarketWaitSeconds()
+                    self.logger.info(f"장시간이 아닙니다. {wait_seconds / 60:.1f}분 대기 중...")
+                    jobs_started = False
+                    await asyncio.sleep(wait_seconds)
+                    continue
+                
+                # 장중 진입 시 작업 예약 시작
+                if not jobs_started:
+                    self.job_scheduler.start()
+                    jobs_started = True
+                
+                # 가장 이른 작업 예정 시각(봉 마감 + 마감 대기)까지 대기
+                wakeup = self.job_scheduler.getNextWakeup()
+                await asyncio.sleep(self.scheduler.getDelaySeconds(wakeup))
+                if not self.is_running:
+                    break
                 if not self.isMarketHours():
-                    self.logger.info("장시간이 아닙니다. 대기 중...")
-                    await asyncio.sleep(60)  # 1분 대기
                     continue
                 
                 try:
-                    # 모든 종목에 대한 매매 신호 처리
-                    self.processTradingSignal()
+                    # 예정된 작업 실행 (전용 스레드에서 실행)
+                    await self.runTradingCycle()
                 
                 except Exception as e:
                     error_msg = f"매매 처리 중 오류: {e}"
                     self.logger.error(error_msg)
                     self.logger.error(traceback.format_exc())
                 
-                # 다음 체크까지 대기
-                await asyncio.sleep(self.check_interval_minutes * 60)
-                
         except KeyboardInterrupt:
             self.logger.info("사용자에 의해 봇이 중단되었습니다.")
         except Exception as e:
@@ -733,11 +1192,46 @@ RSI: {rsi:.1f}{macd_info}
         """매매 봇 종료"""
         self.is_running = False
         
+        # 스케줄 지연 통계 기록
+        lag_stats = self.scheduler.getLagStats()
+        if lag_stats['count']:
+            self.logger.info(
+                f"스케줄 지연 통계: {lag_stats['count']}회, 평균 {lag_stats['avg']:.3f}초, "
+                f"최대 {lag_stats['max']:.3f}초, 건너뛴 봉 경계 {lag_stats['missed_boundaries']}개"
+            )
+        if self.decision_skips:
+            skip_summary = ", ".join(f"{reason} {count}회" for reason, count in self.decision_skips.most_common())
+            self.logger.info(f"매매 판단 제외 사유: {skip_summary}")
+        for job_type, job_stats in self.job_scheduler.getJobStats().items():
+            self.logger.info(
+                f"작업 통계 [{job_type}]: 실행 {job_stats['runs']}회, 건너뜀 {job_stats['sheds']}회, "
+                f"시한 초과 {job_stats['deadline_misses']}회, 평균 {job_stats['avg_duration']:.2f}초"
+            )
+        
+        # 진행 중인 매매 사이클 정리 (다음 종목 처리 전에 중단되도록 요청 후 대기)
+        self.cycle_stop_event.set()
+        try:
+            if self.cycle_future and not self.cycle_future.done():
+                self.logger.info("진행 중인 매매 사이클 종료 대기 중...")
+                await asyncio.wait_for(asyncio.shield(self.cycle_future), timeout=self.cycle_shutdown_timeout)
+        except asyncio.TimeoutError:
+            self.logger.warning(f"매매 사이클이 {self.cycle_shutdown_timeout}초 내에 종료되지 않았습니다.")
+        except Exception as e:
+            self.logger.error(f"매매 사이클 종료 중 오류: {e}")
+        finally:
+            self.cycle_executor.shutdown(wait=False, cancel_futures=True)
+            if self.stop_loss_executor is not None:
+                # 제출된 손절 주문은 끝까지 실행
+                self.stop_loss_executor.shutdown(wait=True)
+        
+        # 같은 세션 내 재시작에 대비해 최종 상태 저장
+        # (사이클이 시간 내 끝나지 않았으면 갱신 중인 지표 버퍼는 빼고 저장)
+        self.saveCheckpoint(include_indicators=self.cycle_future is None or self.cycle_future.done())
+        
         # WebSocket 연결 정리
         try:
-            if self.kis_websocket and self.kis_websocket.is_connected:
+            if self.kis_websocket:
                 await self.kis_websocket.disconnect()
-                self.logger.info("WebSocket 연결 해제 완료")
                 
             if self.websocket_task and not self.websocket_task.done():
                 self.websocket_task.cancel()
@@ -748,6 +1242,17 @@ RSI: {rsi:.1f}{macd_info}
         except Exception as e:
             self.logger.error(f"WebSocket 정리 중 오류: {e}")
         
+        # 남은 텔레그램 알림 전송
+        self.telegram.close()
+        
+        # 봉 아카이브 남은 기록 처리 및 인덱스 저장
+        if self.bar_archive is not None:
+            self.bar_archive.close()
+        
+        # 캡처 로그 남은 레코드 기록 후 파일 닫기
+        if self.capture_log is not None:
+            self.capture_log.close()
+        
         if self.start_time:
             runtime = DateTimeUtil.get_us_now() - self.start_time
             self.logger.info(f"봇 운영시간: {str(runtime).split('.')[0]}")
@@ -852,192 +1357,345 @@ RSI: {rsi:.1f}{macd_info}
     
     def addOrderToTracker(self, order_no, ticker, order_type, total_qty, price, market):
         """주문 추적 시스템에 새 주문 추가"""
-        self.active_orders[order_no] = {
-            'ticker': ticker,
-            'order_type': order_type,
-            'total_qty': total_qty,
-            'executed_qty': 0,
-            'remaining_qty': total_qty,
-            'price': price,
-            'market': market
-        }
+        with self.orders_lock:
+            self.active_orders[order_no] = {
+                'ticker': ticker,
+                'order_type': order_type,
+                'total_qty': total_qty,
+                'executed_qty': 0,
+                'remaining_qty': total_qty,
+                'price': price,
+                'market': market
+            }
         self.logger.info(f"주문 추적 추가: {order_no} - {ticker} {order_type} {total_qty}주")
+        
+        # 주문 직후 재시작해도 대기시간/추적 주문이 유지되도록 즉시 저장
+        self.saveCheckpoint(include_indicators=False)
     
     def updateOrderExecution(self, order_no, executed_qty):
         """주문 체결량 업데이트"""
-        if order_no in self.active_orders:
-            order = self.active_orders[order_no]
-            order['executed_qty'] += executed_qty
-            order['remaining_qty'] = order['total_qty'] - order['executed_qty']
-            
-            self.logger.info(f"체결량 업데이트: {order_no} - 체결: {executed_qty}주, 누적: {order['executed_qty']}주, 미체결: {order['remaining_qty']}주")
-            
-            # 모든 주문이 체결되면 추적에서 제거
-            if order['remaining_qty'] <= 0:
-                self.logger.info(f"주문 완전 체결: {order_no} - {order['ticker']} 추적 종료")
-                del self.active_orders[order_no]
-                return True  # 완전 체결
+        with self.orders_lock:
+            if order_no in self.active_orders:
+                order = self.active_orders[order_no]
+                order['executed_qty'] += executed_qty
+                order['remaining_qty'] = order['total_qty'] - order['executed_qty']
+                
+                self.logger.info(f"체결량 업데이트: {order_no} - 체결: {executed_qty}주, 누적: {order['executed_qty']}주, 미체결: {order['remaining_qty']}주")
+                
+                # 모든 주문이 체결되면 추적에서 제거
+                if order['remaining_qty'] <= 0:
+                    self.logger.info(f"주문 완전 체결: {order_no} - {order['ticker']} 추적 종료")
+                    del self.active_orders[order_no]
+                    return True  # 완전 체결
                 
         return False  # 미완결 또는 주문번호 없음
     
+    def applyExecution(self, order_no, executed_qty):
+        """체결통보를 주문 추적 정보에 원자적으로 반영
+        Returns:
+            tuple: (반영 전 주문 정보 사본 또는 None, 전량 체결 여부)
+        """
+        with self.orders_lock:
+            order_info = self.getOrderExecutionInfo(order_no)
+            is_fully_executed = self.updateOrderExecution(order_no, executed_qty)
+        return order_info, is_fully_executed
+    
+    def applyHoldingsExecution(self, ticker, order_type, executed_qty):
+        """체결통보를 보유 수량 인덱스에 반영 (매도는 주문 시 주문가능수량에서 이미 빠지므로 매수만 가산)"""
+        if order_type != '매수' or executed_qty <= 0:
+            return
+        with self.orders_lock:
+            if ticker in self.holdings:
+                self.holdings[ticker] += executed_qty
+    
     def getOrderExecutionInfo(self, order_no):
-        """주문 체결 정보 조회"""
-        return self.active_orders.get(order_no, None)
+        """주문 체결 정보 조회 (사본 반환)"""
+        with self.orders_lock:
+            order = self.active_orders.get(order_no, None)
+            return dict(order) if order is not None else None
     
     def clearCompletedOrders(self, ticker=None):
         """완료된 주문들 정리 (특정 종목 또는 전체)"""
-        to_remove = []
-        for order_no, order in self.active_orders.items():
-            if ticker is None or order['ticker'] == ticker:
-                if order['remaining_qty'] <= 0:
-                    to_remove.append(order_no)
-        
-        for order_no in to_remove:
-            del self.active_orders[order_no]
+        with self.orders_lock:
+            to_remove = []
+            for order_no, order in self.active_orders.items():
+                if ticker is None or order['ticker'] == ticker:
+                    if order['remaining_qty'] <= 0:
+                        to_remove.append(order_no)
+            
+            for order_no in to_remove:
+                del self.active_orders[order_no]
             
         if to_remove:
             self.logger.info(f"완료된 주문 정리: {len(to_remove)}개 주문 제거")
    
-    def hasUnfilledOrders(self, ticker, market="NASD"):
-        """특정 종목의 미체결 주문 존재 여부를 주문체결내역 API로 확인
+    def prepareTrading(self):
+        """시작 준비 작업을 동시에 실행 (작업별 실패는 기록만 하고 계속 진행)
 
-        주의: 모의계좌는 API 제약으로 settle_div가 강제(전체)될 수 있습니다.
+        - 종목별 데이터 연결 확인 (조회한 일봉으로 일봉 지표 그래프 초기화)
+        - 종목별 미체결 주문 동기화 -> active_orders 초기화
+        - 종목별 마지막 매수/매도 주문 시각 초기화 (이후 대기시간은 메모리로 판단)
+        - 보유 수량/손절가 초기화 및 장 시작 알림 전송
+        같은 세션의 체크포인트를 복원한 경우에는 미체결 주문 대조(변경분만 반영)와
+        잔고 갱신만 실행합니다.
+        요청 간격은 공유 제한기가 조절하므로 동시에 실행해도 API 호출 빈도 제한을 지킵니다.
         """
-        try:
-            parse_market = self.kis_base.changeMarketCode(market, length=4)
-            # 미체결만 조회 (실계좌에서는 정확히 필터됨). 페이징은 내부에서 처리(fetch_all=True).
-            orders = self.kis_account.getOverseasOrderHistory(
-                ticker=ticker,
-                settle_div="02",  # 02: 미체결
-                market=parse_market,
-                fetch_all=True
-            )
+        started = time_module.monotonic()
+        requests_before = KisBase.getRateLimiter().get_stats()['requests']
+        synced = 0
+        restored = self.restoreCheckpoint()
 
-            # 모의계좌에서는 settle_div 필터가 적용되지 않으므로
-            # 응답 데이터에서 nccs_qty(미체결수량) 기준으로 재필터링
-            unfilled = []
-            if isinstance(orders, list):
-                for o in orders:
-                    qty_str = str(o.get('nccs_qty', '0')).replace(',', '').strip()
-                    try:
-                        qty = int(float(qty_str)) if qty_str else 0
-                    except Exception:
-                        qty = 0
-                    if qty > 0:
-                        unfilled.append(o)
-
-            count = len(unfilled)
-            if count > 0:
-                self.logger.info(f"미체결 주문 발견: {ticker} - {count}건")
-                # 상세 로그는 과도한 출력 방지를 위해 상위 3건만 표시
-                for order in unfilled[:3]:
-                    self.logger.info(f"  주문번호: {order.get('odno', '')}, 미체결수량: {order.get('nccs_qty', '0')}")
-                return True
+        with ThreadPoolExecutor(max_workers=self.startup_workers, thread_name_prefix="startup") as executor:
+            futures = {}
+            for ticker, market in self.trading_tickers.items():
+                if restored:
+                    # 복원된 추적 주문은 이미 오래된 주문이므로 미체결 목록에 없으면 바로 정리
+                    futures[executor.submit(self.reconcileOrders, ticker, market, 1)] = ("미체결 동기화", ticker)
+                    continue
+                futures[executor.submit(self.rsi_strategies[ticker].validateDataConnection)] = ("데이터 연결 확인", ticker)
+                futures[executor.submit(self.reconcileOrders, ticker, market)] = ("미체결 동기화", ticker)
+                futures[executor.submit(self.getLastOrderDatetime, ticker, '매수')] = ("마지막 매수 시각 조회", ticker)
+                futures[executor.submit(self.getLastOrderDatetime, ticker, '매도')] = ("마지막 매도 시각 조회", ticker)
+            futures[executor.submit(self.refreshPortfolio)] = ("잔고 초기화", None)
+            futures[executor.submit(self.sendPortfolioStatus)] = ("장 시작 알림", None)
 
-            return False
+            for future in as_completed(futures):
+                task, ticker = futures[future]
+                try:
+                    result = future.result()
+                except Exception as e:
+                    self.logger.error(f"{ticker or '계좌'} {task} 오류: {e}")
+                    continue
 
-        except Exception as e:
-            self.logger.error(f"미체결 주문 조회 오류: {e}")
-            return False
+                if task == "데이터 연결 확인" and not result:
+                    self.logger.warning(f"{ticker} RSI 데이터 연결 경고 - 계속 진행합니다.")
+                elif task == "미체결 동기화":
+                    synced += result
 
-    def syncActiveOrders(self):
-        """계좌의 미체결 주문을 조회해 active_orders를 초기화"""
-        synced = 0
+        if synced:
+            self.logger.info(f"시작 시 미체결 주문 {synced}건 동기화 완료")
+
+        self.startup_seconds = time_module.monotonic() - self.init_started
+        request_count = KisBase.getRateLimiter().get_stats()['requests'] - requests_before
+        self.logger.info(
+            f"시작 준비 완료: {time_module.monotonic() - started:.2f}초 "
+            f"(API 요청 {request_count}건, 봇 생성 후 {self.startup_seconds:.2f}초)"
+        )
+
+    async def superviseWebSocket(self):
+        """WebSocket 연결 감시 태스크
+
+        연결이 끊기거나 WS_STALE_SECONDS 동안 아무 메시지(PINGPONG 포함)도 받지 못하면 연결을 닫고
+        지터 포함 백오프로 재연결합니다. 재연결 시 등록된 구독(체결통보, 실시간 체결가)을 다시 보내고,
+        끊겨 있던 동안 놓친 체결은 주문체결내역 조회로 보정합니다.
+        """
+        ws = self.kis_websocket
+        loop = asyncio.get_running_loop()
+        disconnected_at = None
+
+        while self.is_running:
+            if not await ws.reconnect(max_retries=None, base_delay=self.ws_reconnect_base_seconds,
+                                      max_delay=self.ws_reconnect_max_seconds):
+                break
+
+            if disconnected_at is not None:
+                gap_seconds = (datetime.now() - disconnected_at).total_seconds()
+                self.ws_reconnects += 1
+                self.logger.info(f"WebSocket 재연결 완료 (끊김 {gap_seconds:.1f}초, 누적 재연결 {self.ws_reconnects}회) - 누락 체결 보정 시작")
+                # 끊기기 전 수신분을 먼저 반영해야 체결량 차이를 이중으로 반영하지 않음
+                await ws.drain_execution_queue()
+                # 수신 태스크 시작 전에 보정을 마쳐 재연결 후 체결통보와 같은 체결을 동시에 반영하지 않음
+                # (매매 사이클 실행기 뒤에서 기다리지 않도록 기본 실행기 사용)
+                try:
+                    await loop.run_in_executor(None, self.reconcileFillsAfterGap)
+                except Exception as e:
+                    self.logger.error(f"누락 체결 보정 중 오류: {e}")
+
+            receive_task = asyncio.create_task(ws.process_messages())
+            while not receive_task.done():
+                await asyncio.wait({receive_task}, timeout=self.ws_check_seconds)
+                idle_seconds = ws.get_idle_seconds()
+                if not receive_task.done() and idle_seconds is not None and idle_seconds > self.ws_stale_seconds:
+                    self.logger.warning(f"WebSocket {idle_seconds:.0f}초 동안 수신 없음 (PINGPONG 중단) - 연결 재시작")
+                    await ws.close_connection()
+            await receive_task
+
+            if not self.is_running:
+                break
+            disconnected_at = datetime.now()
+            self.logger.warning("WebSocket 연결 끊김 감지 - 재연결 시도")
+
+    def reconcileFillsAfterGap(self):
+        """WebSocket 끊김 구간의 누락 체결 보정
+
+        추적 중인 주문의 주문체결내역 체결수량(ft_ccld_qty)이 추적 체결량보다 많으면 차이만큼
+        체결통보와 같은 경로(주문 추적, 보유 수량, 손절 엔진)로 반영하고, 이후 미체결 목록을 다시 대조합니다.
+        """
+        recovered = 0
         for ticker, market in self.trading_tickers.items():
             try:
-                parse_market = self.kis_base.changeMarketCode(market, length=4)
                 orders = self.kis_account.getOverseasOrderHistory(
                     ticker=ticker,
-                    settle_div="02",  # 미체결
-                    market=parse_market,
+                    settle_div="00",  # 전체
+                    market=self.kis_base.changeMarketCode(market, length=4),
                     fetch_all=True
                 )
-
-                # nccs_qty(미체결수량) 기준 필터링 (모의계좌 호환)
-                unfilled = []
-                if isinstance(orders, list):
-                    for o in orders:
-                        qty_str = str(o.get('nccs_qty', '0')).replace(',', '').strip()
-                        try:
-                            qty = int(float(qty_str)) if qty_str else 0
-                        except Exception:
-                            qty = 0
-                        if qty > 0:
-                            unfilled.append(o)
-
-                for o in unfilled:
-                    order_no = str(o.get('odno', '')).strip()
+                for o in orders if isinstance(orders, list) else []:
+                    order_no = self.kis_base.normalizeOrderNo(o.get('odno'))
                     if not order_no:
                         continue
-                    if order_no in self.active_orders:
+                    try:
+                        filled_qty = int(float(str(o.get('ft_ccld_qty', '0')).replace(',', '').strip() or 0))
+                        price = float(str(o.get('ft_ccld_unpr3', '0')).replace(',', '').strip() or 0)
+                    except ValueError:
                         continue
 
-                    # 주문 종류 매핑
-                    bs = o.get('sll_buy_dvsn_cd', '')
-                    order_type = '매수' if bs == '02' else ('매도' if bs == '01' else f"주문({bs})")
+                    # 체결량 비교와 반영 사이에 다른 경로의 체결 반영이 끼어들지 않도록 잠금 유지
+                    with self.orders_lock:
+                        order_info = self.getOrderExecutionInfo(order_no)
+                        if order_info is None:
+                            continue
+                        missed_qty = min(filled_qty - order_info['executed_qty'], order_info['remaining_qty'])
+                        if missed_qty <= 0:
+                            continue
+                        self.applyExecution(order_no, missed_qty)
+                        self.applyHoldingsExecution(order_info['ticker'], order_info['order_type'], missed_qty)
+                    if self.stop_loss_engine is not None:
+                        self.stop_loss_engine.applyFill(order_info['ticker'], order_info['order_type'], missed_qty, price)
+                    recovered += 1
+                    self.logger.info(f"누락 체결 보정: {order_info['ticker']} {order_info['order_type']} "
+                                     f"{missed_qty}주 @ ${price:.2f} (주문번호 {order_no})")
+
+                self.reconcileOrders(ticker, market)
+            except Exception as e:
+                self.logger.error(f"{ticker} 누락 체결 보정 실패: {e}")
+
+        self.logger.info(f"누락 체결 보정 완료: {recovered}건 반영")
+        return recovered
+
+    def reconcileOrders(self, ticker, market, miss_limit=2):
+        """종목의 미체결 주문 목록과 active_orders 대조
+
+        추적 중이 아닌 미체결 주문은 추가하고, 추적 중이지만 미체결 목록에서
+        연속 miss_limit회 빠진 주문은 체결통보 누락(체결/취소 완료)으로 보고 추적을 종료합니다.
+        Returns:
+            int: 새로 추적을 시작한 주문 수
+        """
+        synced = 0
+        parse_market = self.kis_base.changeMarketCode(market, length=4)
+        orders = self.kis_account.getOverseasOrderHistory(
+            ticker=ticker,
+            settle_div="02",  # 미체결
+            market=parse_market,
+            fetch_all=True
+        )
+
+        # nccs_qty(미체결수량) 기준 필터링 (모의계좌 호환)
+        unfilled = []
+        if isinstance(orders, list):
+            for o in orders:
+                qty_str = str(o.get('nccs_qty', '0')).replace(',', '').strip()
+                try:
+                    qty = int(float(qty_str)) if qty_str else 0
+                except Exception:
+                    qty = 0
+                if qty > 0:
+                    unfilled.append(o)
+
+        unfilled_order_nos = set()
+        for o in unfilled:
+            # 주문 추적 키와 같은 형식으로 정규화 (앞자리 0 패딩 차이로 추적 중인 주문을 놓치지 않도록)
+            order_no = self.kis_base.normalizeOrderNo(o.get('odno'))
+            if not order_no:
+                continue
+            unfilled_order_nos.add(order_no)
+            with self.orders_lock:
+                if order_no in self.active_orders:
+                    continue
+
+            # 주문 종류 매핑
+            bs = o.get('sll_buy_dvsn_cd', '')
+            order_type = '매수' if bs == '02' else ('매도' if bs == '01' else f"주문({bs})")
+
+            # 수량 계산
+            rem_qty_str = str(o.get('nccs_qty', '0')).replace(',', '').strip()
+            try:
+                remaining_qty = int(float(rem_qty_str)) if rem_qty_str else 0
+            except Exception:
+                remaining_qty = 0
 
-                    # 수량 계산
-                    rem_qty_str = str(o.get('nccs_qty', '0')).replace(',', '').strip()
+            total_qty = None
+            for key in ['tot_ord_qty', 'ord_qty']:
+                if key in o:
                     try:
-                        remaining_qty = int(float(rem_qty_str)) if rem_qty_str else 0
+                        total_qty = int(str(o.get(key, '0')).replace(',', '').strip())
+                        break
                     except Exception:
-                        remaining_qty = 0
-
-                    total_qty = None
-                    for key in ['tot_ord_qty', 'ord_qty']:
-                        if key in o:
-                            try:
-                                total_qty = int(str(o.get(key, '0')).replace(',', '').strip())
-                                break
-                            except Exception:
-                                total_qty = None
-                    if not total_qty or total_qty < remaining_qty:
-                        total_qty = remaining_qty
-
-                    executed_qty = max(total_qty - remaining_qty, 0)
-
-                    # 가격(가능한 경우만)
-                    price = 0.0
-                    for pkey in ['ovrs_ord_unpr', 'ord_unpr']:
-                        if pkey in o:
-                            try:
-                                price = float(str(o.get(pkey, '0')).replace(',', '').strip())
-                                break
-                            except Exception:
-                                price = 0.0
-
-                    # 추적 테이블에 반영
-                    self.active_orders[order_no] = {
-                        'ticker': ticker,
-                        'order_type': order_type,
-                        'total_qty': total_qty,
-                        'executed_qty': executed_qty,
-                        'remaining_qty': remaining_qty,
-                        'price': price,
-                        'market': market
-                    }
-                    synced += 1
-            except Exception as e:
-                self.logger.error(f"{ticker} 미체결 동기화 오류: {e}")
+                        total_qty = None
+            if not total_qty or total_qty < remaining_qty:
+                total_qty = remaining_qty
 
-        if synced:
-            self.logger.info(f"시작 시 미체결 주문 {synced}건 동기화 완료")
+            executed_qty = max(total_qty - remaining_qty, 0)
+
+            # 가격(가능한 경우만)
+            price = 0.0
+            for pkey in ['ovrs_ord_unpr', 'ord_unpr']:
+                if pkey in o:
+                    try:
+                        price = float(str(o.get(pkey, '0')).replace(',', '').strip())
+                        break
+                    except Exception:
+                        price = 0.0
+
+            # 추적 테이블에 반영
+            with self.orders_lock:
+                self.active_orders.setdefault(order_no, {
+                    'ticker': ticker,
+                    'order_type': order_type,
+                    'total_qty': total_qty,
+                    'executed_qty': executed_qty,
+                    'remaining_qty': remaining_qty,
+                    'price': price,
+                    'market': market
+                })
+            synced += 1
+
+        # 미체결 목록에서 빠진 추적 주문 정리 (주문 직후 조회 지연을 고려해 기본 연속 2회 확인)
+        dropped = []
+        with self.orders_lock:
+            for order_no, order in list(self.active_orders.items()):
+                if order['ticker'] != ticker:
+                    continue
+                if order_no in unfilled_order_nos:
+                    self.reconcile_misses.pop(order_no, None)
+                    continue
+                misses = self.reconcile_misses.get(order_no, 0) + 1
+                if misses >= miss_limit:
+                    self.logger.info(f"미체결 목록에 없는 주문 추적 종료: {order_no} - {ticker}")
+                    del self.active_orders[order_no]
+                    self.reconcile_misses.pop(order_no, None)
+                    dropped.append(order_no)
+                else:
+                    self.reconcile_misses[order_no] = misses
+
+        # 전량 체결 확인 없이 빠진 손절 주문(거부/취소/누락)은 손절을 다시 발동할 수 있도록 초기화
+        if self.stop_loss_engine is not None:
+            for order_no in dropped:
+                if self.stop_loss_engine.releaseStopOrder(order_no):
+                    self.logger.warning(f"{ticker} 손절 주문 {order_no}이 체결 확인 없이 종료되어 손절을 다시 감시합니다.")
+
+        return synced
 
     async def handle_execution_notification(self, execution_info):
-        """체결통보 처리 함수"""
+        """체결통보 처리 함수 (execution_info: ExecutionRecord)"""
         try:
-            self.logger.info("🎉 === 실시간 체결통보 수신 ===")
-            
-            # 체결통보 데이터 파싱
-            ticker = execution_info.get('ticker', 'N/A')
-            buy_sell_gb = execution_info.get('buy_sell_gb', '')
-            execution_qty = execution_info.get('execution_qty', '0')
-            execution_price = execution_info.get('execution_price', '0')
-            execution_time = execution_info.get('execution_time', 'N/A')
-            order_no = execution_info.get('order_no', 'N/A')
-            execution_yn = execution_info.get('execution_yn', 'N/A')
-            account_no = execution_info.get('account_no', 'N/A')
-            stock_name = execution_info.get('stock_name', 'N/A')
+            # 체결통보 데이터 (수량/단가는 파싱 시 숫자로 변환됨)
+            ticker = execution_info.ticker or 'N/A'
+            buy_sell_gb = execution_info.buy_sell_gb
+            execution_time = execution_info.execution_time or 'N/A'
+            order_no = self.kis_base.normalizeOrderNo(execution_info.order_no) or 'N/A'
+            execution_yn = execution_info.execution_yn or 'N/A'
+            stock_name = execution_info.stock_name or 'N/A'
             
             # 매수/매도 구분
             trade_type = ""
@@ -1049,31 +1707,23 @@ RSI: {rsi:.1f}{macd_info}
                 trade_type = f"주문({buy_sell_gb})"
             
             # 체결 금액 계산
-            try:
-                qty = int(execution_qty)
-                price = float(int(execution_price)/10000)
-                total_amount = qty * price
-            except:
-                qty = 0
-                price = 0
-                total_amount = 0
+            qty = execution_info.qty
+            price = execution_info.price
+            total_amount = qty * price
                         
-            # 로거 출력
-            self.logger.info(f"종목: {ticker} ({stock_name})")
-            self.logger.info(f"{trade_type}: {execution_qty}주 @ ${execution_price}")
-            self.logger.info(f"체결금액: ${total_amount:.2f}")
-            self.logger.info(f"체결시간: {execution_time}")
-            self.logger.info(f"주문번호: {order_no}")
-            self.logger.info(f"체결여부: {execution_yn}")
-            self.logger.info("===============================")
+            # 체결통보 수신 이벤트 (필드 포맷은 기록 스레드에서 처리)
+            self.log_util.log_event("execution_notice", ticker=ticker, stock_name=stock_name, trade_type=trade_type,
+                                    qty=qty, price=price, amount=total_amount,
+                                    time=execution_time, order_no=order_no, status=execution_yn)
             
             # 체결 완료인 경우에만 로그 기록
             if execution_yn == '2':  # 체결 완료
-                # 주문 추적 정보 먼저 조회 (삭제되기 전에)
-                order_info = self.getOrderExecutionInfo(order_no)
-                
-                # 주문 추적 정보 업데이트
-                is_fully_executed = self.updateOrderExecution(order_no, qty)
+                # 주문 추적 정보 조회(삭제되기 전 사본)와 체결량 반영을 한 번에 처리
+                # (매매 사이클 스레드가 같은 주문을 동시에 추가/조회할 수 있음)
+                order_info, is_fully_executed = self.applyExecution(order_no, qty)
+                self.applyHoldingsExecution(ticker, trade_type, qty)
+                if self.stop_loss_engine is not None:
+                    self.stop_loss_engine.applyFill(ticker, trade_type, qty, price)
                 
                 # 체결 로그 기록
                 if order_info:
@@ -1082,9 +1732,10 @@ RSI: {rsi:.1f}{macd_info}
                     remaining_qty = total_order_qty - executed_qty
                     execution_rate = (executed_qty / total_order_qty) * 100
                     
-                    self.logger.info(f"📊 {ticker} {trade_type} 체결: {qty}주 (${total_amount:,.2f}) | "
-                                   f"누적: {executed_qty}/{total_order_qty}주 ({execution_rate:.1f}%) | "
-                                   f"미체결: {remaining_qty}주")
+                    self.log_util.log_event("fill_progress", ticker=ticker, trade_type=trade_type, qty=qty,
+                                            amount=total_amount, executed_qty=executed_qty,
+                                            total_qty=total_order_qty, remaining_qty=remaining_qty,
+                                            rate=round(execution_rate, 1))
                     
                     # 전량 체결 완료시에만 텔레그램 메시지 전송
                     if is_fully_executed:
@@ -1096,13 +1747,13 @@ RSI: {rsi:.1f}{macd_info}
 현재가: ${price:.2f}
 시간: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}"""
                         
-                        # 텔레그램 전송
                         self.telegram.sendMessage(telegram_message)
                         self.logger.info(f"🎊 {ticker} {trade_type} 주문 전량 체결 완료: {total_order_qty}주")
                     
                 else:
                     # 추적 정보가 없는 경우 기본 로그
-                    self.logger.info(f"📊 {ticker} {trade_type} 체결: {qty}주 (${total_amount:,.2f})")
+                    self.log_util.log_event("fill_progress", ticker=ticker, trade_type=trade_type, qty=qty,
+                                            amount=total_amount)
             
             elif execution_yn == '1':  # 접수
                 self.logger.info(f"{ticker} 주문 접수됨 - 체결 대기 중")
@@ -1113,10 +1764,7 @@ RSI: {rsi:.1f}{macd_info}
             error_msg = f"체결통보 처리 중 오류: {e}"
             self.logger.error(error_msg)
             self.logger.error(traceback.format_exc())
-            try:
-                self.telegram.sendMessage(f"❌ <b>체결통보 처리 오류</b>\n{error_msg}")
-            except:
-                pass  # 텔레그램 전송 실패시에도 계속 진행
+            self.telegram.sendMessage(f"❌ <b>체결통보 처리 오류</b>\n{error_msg}")
 
     def getBotStatus(self):
         """봇 현재 상태 반환"""
@@ -1135,6 +1783,17 @@ RSI: {rsi:.1f}{macd_info}
             "total_trades": self.total_trades,
             "is_market_hours": self.isMarketHours(),
             "trading_tickers": self.trading_tickers,
+            "startup_seconds": self.startup_seconds,
+            "first_decision_seconds": self.first_decision_seconds,
+            "execution_queue": self.kis_websocket.get_execution_queue_stats(),
+            "websocket_reconnects": self.ws_reconnects,
+            "stream_prices": {ticker: event.price for ticker in self.trading_tickers
+                              if (event := self.market_data_bus.getLatest("price", ticker)) is not None},
+            "market_data_bus": self.market_data_bus.getStats(),
+            "telegram": self.telegram.getStats(),
+            "bar_archive": self.bar_archive.getStats() if self.bar_archive is not None else None,
+            "logging": self.log_util.get_stats(),
+            "latency": self.latency_tracer.get_percentiles(),
             "rsi_strategies": rsi_strategies_status,
             "macd_strategies": macd_strategies_status
         }
@@ -0,0 +1,172 @@
+"""
+WebSocket 프레임/REST 응답 바이너리 캡처 로그 모듈
+"""
+
+import json
+import os
+import queue
+import struct
+import threading
+import time
+from collections import namedtuple
+from datetime import datetime
+from utils.datetime_util import DateTimeUtil
+from utils.logger_util import LoggerUtil
+
+
+CaptureRecord = namedtuple('CaptureRecord', ['kind', 'monotonic_ns', 'wall_ns', 'exchange_ns', 'payload'])
+
+
+class CaptureLog:
+    """수신 원문을 길이 접두 바이너리 레코드로 추가 기록하는 캡처 로그
+
+    파일은 매직 바이트(MAGIC) 뒤에 레코드가 이어지는 추가 전용 형식입니다.
+    레코드 = 헤더(<IBqqq: 페이로드 길이, 종류, 단조 시각 ns, 벽시계 시각 ns, 거래소 시각 ns) + 페이로드
+    거래소 시각을 알 수 없으면 0이며, 실시간 체결가 프레임은 기록 스레드에서 현지일자/현지시간 필드로 채웁니다.
+
+    append는 큐에 넣기만 하고 파일 기록은 백그라운드 스레드가 버퍼링해 처리하므로 호출 경로를 막지 않습니다
+    (큐가 가득 차면 버리고 건수만 셉니다). 세션마다 rotate로 새 파일을 엽니다.
+    """
+
+    MAGIC = b"KISCAP01"
+    HEADER = struct.Struct("<IBqqq")
+
+    KIND_WS_FRAME = 1  # WebSocket 수신 원문 (시세, 암호화된 체결통보, JSON 응답)
+    KIND_FILL = 2      # 복호화된 체결통보 (TR ID|건수|데이터)
+    KIND_REST = 3      # REST 응답 (요청 정보 JSON + 줄바꿈 + 응답 본문)
+    KIND_NAMES = {KIND_WS_FRAME: "ws_frame", KIND_FILL: "fill", KIND_REST: "rest"}
+
+    def __init__(self, directory, queue_size=100000, flush_interval=1.0, buffer_size=1 << 20):
+        """
+        Args:
+            directory (str): 캡처 파일 디렉토리
+            queue_size (int): 기록 대기 큐 크기 (초과분은 버림)
+            flush_interval (float): 파일 버퍼를 비우는 주기 (초)
+            buffer_size (int): 파일 쓰기 버퍼 크기 (bytes)
+        """
+        self.logger = LoggerUtil().get_logger()
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.buffer_size = buffer_size
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.file = None
+        self.path = None
+        self.stats = {'records': 0, 'bytes': 0, 'dropped': 0, 'files': 0}
+        self.writer = threading.Thread(target=self._run, name="capture-writer", daemon=True)
+        self.writer.start()
+
+    def append(self, kind, payload, exchange_ns=0):
+        """레코드 기록 요청 (대기하지 않음)
+        Args:
+            kind (int): 레코드 종류 (KIND_*)
+            payload (str | bytes): 원문
+            exchange_ns (int): 거래소 시각 (epoch ns, 모르면 0)
+        """
+        if isinstance(payload, str):
+            payload = payload.encode('utf-8')
+        try:
+            self.queue.put_nowait((kind, time.monotonic_ns(), time.time_ns(), exchange_ns, payload))
+        except queue.Full:
+            self.stats['dropped'] += 1
+
+    def append_rest(self, method, path, tr_id, params, body, status, content):
+        """REST 응답 기록 요청 (응답 본문은 다시 직렬화하지 않고 원문 그대로 기록)"""
+        meta = json.dumps({'method': method, 'path': path, 'tr_id': tr_id, 'params': params,
+                           'body': body, 'status': status}, ensure_ascii=False)
+        self.append(self.KIND_REST, meta.encode('utf-8') + b"\n" + content)
+
+    def rotate(self, session_label):
+        """세션 시작 시 새 캡처 파일로 전환 (이전 파일은 비우고 닫음)"""
+        self.queue.put(("rotate", session_label))
+
+    def close(self, timeout=5.0):
+        """남은 레코드를 기록하고 파일을 닫음"""
+        if not self.writer.is_alive():
+            return
+        self.queue.put(("close", None))
+        self.writer.join(timeout)
+        self.logger.info(f"캡처 로그 종료: {self.stats['records']}건, {self.stats['bytes'] / 1024:.1f}KB 기록, "
+                         f"버림 {self.stats['dropped']}건 ({self.path})")
+
+    def _open(self, session_label):
+        """캡처 파일 열기 (capture_{세션}_{시각}.bin)"""
+        self._close_file()
+        os.makedirs(self.directory, exist_ok=True)
+        self.path = os.path.join(self.directory, f"capture_{session_label}_{datetime.now():%H%M%S}.bin")
+        self.file = open(self.path, "ab", buffering=self.buffer_size)
+        if self.file.tell() == 0:
+            self.file.write(self.MAGIC)
+        self.stats['files'] += 1
+
+    def _close_file(self):
+        if self.file is not None:
+            self.file.flush()
+            os.fsync(self.file.fileno())
+            self.file.close()
+            self.file = None
+
+    def _run(self):
+        """기록 스레드 (flush_interval마다 버퍼 비움)"""
+        last_flush = time.monotonic()
+        while True:
+            try:
+                item = self.queue.get(timeout=self.flush_interval)
+            except queue.Empty:
+                item = None
+
+            if item is not None:
+                try:
+                    if item[0] == "rotate":
+                        self._open(item[1])
+                    elif item[0] == "close":
+                        self._close_file()
+                        return
+                    else:
+                        self._write(*item)
+                except Exception as e:
+                    self.logger.error(f"캡처 로그 기록 오류: {e}")
+
+            if self.file is not None and time.monotonic() - last_flush >= self.flush_interval:
+                self.file.flush()
+                last_flush = time.monotonic()
+
+    def _write(self, kind, monotonic_ns, wall_ns, exchange_ns, payload):
+        if self.file is None:
+            self._open(datetime.now().strftime('%Y%m%d'))
+        if not exchange_ns and kind == self.KIND_WS_FRAME:
+            exchange_ns = self._quote_exchange_ns(payload)
+        self.file.write(self.HEADER.pack(len(payload), kind, monotonic_ns, wall_ns, exchange_ns))
+        self.file.write(payload)
+        self.stats['records'] += 1
+        self.stats['bytes'] += self.HEADER.size + len(payload)
+
+    @staticmethod
+    def _quote_exchange_ns(payload):
+        """실시간 체결가 프레임의 첫 레코드 현지일자(XYMD)/현지시간(XHMS)을 epoch ns로 변환 (아니면 0)"""
+        if not payload.startswith(b"0|HDFSCNT0|"):
+            return 0
+        try:
+            fields = payload.split(b"|", 3)[3].split(b"^", 6)
+            local = datetime.strptime((fields[4] + fields[5]).decode(), "%Y%m%d%H%M%S")
+            return int(DateTimeUtil.US_TIMEZONE.localize(local).timestamp()) * 1_000_000_000
+        except (IndexError, ValueError):
+            return 0
+
+    @classmethod
+    def read(cls, path):
+        """캡처 파일 레코드 순회 (기록 중 종료로 잘린 마지막 레코드는 무시)
+        Yields:
+            CaptureRecord
+        """
+        with open(path, "rb") as f:
+            if f.read(len(cls.MAGIC)) != cls.MAGIC:
+                raise ValueError(f"캡처 파일 형식이 아닙니다: {path}")
+            while True:
+                header = f.read(cls.HEADER.size)
+                if len(header) < cls.HEADER.size:
+                    return
+                length, kind, monotonic_ns, wall_ns, exchange_ns = cls.HEADER.unpack(header)
+                payload = f.read(length)
+                if len(payload) < length:
+                    return
+                yield CaptureRecord(kind, monotonic_ns, wall_ns, exchange_ns, payload)
@@ -0,0 +1,111 @@
+"""
+KIS 차트 응답(output2) 파싱 유틸리티 모듈
+"""
+
+import numpy as np
+from collections import namedtuple
+
+
+# 시간순(오름차순) 정렬된 차트 배열
+# ts: datetime64[s] (거래소 현지시간), 나머지: float64
+ChartArrays = namedtuple('ChartArrays', ['ts', 'open', 'high', 'low', 'close', 'volume'])
+
+
+class ChartUtil:
+    """해외주식 분봉(HHDFS76950200)/일봉(HHDFS76240000) 응답을 NumPy 배열로 변환하는 유틸리티"""
+
+    MINUTE_TR_ID = "HHDFS76950200"
+    DAILY_TR_ID = "HHDFS76240000"
+
+    # tr_id별 (일자, 시각, 시가, 고가, 저가, 종가, 거래량) 필드명
+    FIELD_MAP = {
+        MINUTE_TR_ID: ('xymd', 'xhms', 'open', 'high', 'low', 'last', 'evol'),
+        DAILY_TR_ID: ('xymd', None, 'open', 'high', 'low', 'clos', 'tvol'),
+    }
+
+    @classmethod
+    def get_tr_id(cls, interval):
+        """인터벌(day 또는 분 단위 문자열)에 해당하는 차트 tr_id 반환"""
+        return cls.DAILY_TR_ID if interval == "day" else cls.MINUTE_TR_ID
+
+    @classmethod
+    def empty(cls):
+        """빈 차트 배열 반환"""
+        empty_values = np.empty(0, dtype=np.float64)
+        return ChartArrays(np.empty(0, dtype='datetime64[s]'), empty_values, empty_values,
+                           empty_values, empty_values, empty_values)
+
+    @classmethod
+    def parse_chart(cls, chart_data, tr_id):
+        """차트 output2 리스트(최신순)를 시간순 NumPy 배열로 변환
+
+        행 단위 float() 변환 대신 응답을 한 번 순회해 문자열 2차원 배열로 모은 뒤
+        컬럼 단위로 일괄 변환하고, 종가가 비어 있거나 0 이하인 행은 마스크로 제거합니다.
+
+        Args:
+            chart_data (list): getMinuteChartPrice/getDailyPrice 응답 리스트 (최신순)
+            tr_id (str): 차트 tr_id (HHDFS76950200: 분봉, HHDFS76240000: 일봉)
+
+        Returns:
+            ChartArrays: (ts, open, high, low, close, volume)
+        """
+        if not chart_data:
+            return cls.empty()
+
+        date_field, time_field, *value_fields = cls.FIELD_MAP[tr_id]
+        fields = [date_field] + ([time_field] if time_field else []) + value_fields
+
+        # 한 번의 순회로 필드 문자열 수집 (응답은 최신순이므로 뒤집어서 시간순으로)
+        raw = np.array([[row.get(field) or '' for field in fields] for row in reversed(chart_data)], dtype=str)
+
+        dates = cls._to_int(raw[:, 0])
+        if time_field:
+            times = cls._to_int(raw[:, 1])
+            values = raw[:, 2:]
+        else:
+            times = np.zeros(len(raw), dtype=np.int64)
+            values = raw[:, 1:]
+
+        open_, high, low, close, volume = (cls._to_float(values[:, i]) for i in range(5))
+
+        # 유효하지 않은 행 일괄 제거 (일자 누락, 종가 누락/0 이하)
+        valid = (dates > 0) & np.isfinite(close) & (close > 0)
+        ts = cls._to_datetime64(dates[valid], times[valid])
+
+        return ChartArrays(ts, open_[valid], high[valid], low[valid], close[valid], volume[valid])
+
+    @staticmethod
+    def _to_float(column):
+        """문자열 컬럼을 float64로 일괄 변환 (빈 값/해석 불가 값은 NaN)"""
+        column = np.where(column == '', 'nan', column)
+        try:
+            return column.astype(np.float64)
+        except ValueError:
+            # 비정상 값이 섞인 드문 경우에만 원소 단위로 처리
+            result = np.empty(len(column), dtype=np.float64)
+            for i, value in enumerate(column):
+                try:
+                    result[i] = float(value.replace(',', ''))
+                except ValueError:
+                    result[i] = np.nan
+            return result
+
+    @classmethod
+    def _to_int(cls, column):
+        """숫자 문자열 컬럼(YYYYMMDD, HHMMSS)을 int64로 변환 (해석 불가 값은 0)"""
+        values = cls._to_float(column)
+        return np.where(np.isfinite(values), values, 0).astype(np.int64)
+
+    @staticmethod
+    def _to_datetime64(dates, times):
+        """YYYYMMDD, HHMMSS 정수 배열을 datetime64[s] 배열로 변환"""
+        years = dates // 10000
+        months = dates // 100 % 100
+        days = dates % 100
+
+        result = (years - 1970).astype('datetime64[Y]').astype('datetime64[M]')
+        result = result + (months - 1).astype('timedelta64[M]')
+        result = result.astype('datetime64[D]') + (days - 1).astype('timedelta64[D]')
+
+        seconds = times // 10000 * 3600 + times // 100 % 100 * 60 + times % 100
+        return result.astype('datetime64[s]') + seconds.astype('timedelta64[s]')
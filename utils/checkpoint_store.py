@@ -0,0 +1,74 @@
+"""
+런타임 상태 체크포인트 파일 저장/로드 모듈
+"""
+
+import os
+import pickle
+import threading
+from datetime import datetime
+from utils.logger_util import LoggerUtil
+
+
+class CheckpointStore:
+    """봇 런타임 상태를 로컬 파일 하나에 저장하고 재시작 시 불러오는 저장소
+
+    임시 파일에 기록한 뒤 교체(os.replace)하므로 저장 도중 종료되어도
+    직전 체크포인트가 깨지지 않습니다. 형식 버전이 다르거나 읽을 수 없는 파일은 무시합니다.
+    """
+
+    VERSION = 1
+
+    def __init__(self, path):
+        """
+        Args:
+            path (str): 체크포인트 파일 경로
+        """
+        self.logger = LoggerUtil().get_logger()
+        self.path = path
+        self.lock = threading.Lock()
+
+    def save(self, state):
+        """상태 저장
+        Args:
+            state (dict): 저장할 상태 (pickle 가능한 값)
+        Returns:
+            int: 저장된 파일 크기 (bytes)
+        """
+        payload = {'version': self.VERSION, 'saved_at': datetime.now(), 'state': state}
+        data = pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+
+        with self.lock:
+            tmp_path = f"{self.path}.tmp"
+            with open(tmp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.path)
+        return len(data)
+
+    def load(self):
+        """저장된 상태 로드
+        Returns:
+            tuple: (상태, 저장 시각), 없거나 읽을 수 없으면 (None, None)
+        """
+        if not os.path.exists(self.path):
+            return None, None
+
+        try:
+            with self.lock, open(self.path, 'rb') as f:
+                payload = pickle.load(f)
+        except Exception as e:
+            self.logger.warning(f"체크포인트 파일을 읽을 수 없어 무시합니다: {e}")
+            return None, None
+
+        if not isinstance(payload, dict) or payload.get('version') != self.VERSION:
+            self.logger.warning("체크포인트 형식 버전이 달라 무시합니다.")
+            return None, None
+
+        return payload['state'], payload['saved_at']
+
+    def clear(self):
+        """체크포인트 파일 삭제"""
+        with self.lock:
+            if os.path.exists(self.path):
+                os.remove(self.path)
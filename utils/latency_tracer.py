@@ -0,0 +1,118 @@
+import threading
+import time
+from collections import deque
+import numpy as np
+
+
+class LatencySpan:
+    """구간 측정 컨텍스트 (with 블록 소요 시간을 추적기에 기록)"""
+
+    __slots__ = ('tracer', 'stage', 'key', 'started')
+
+    def __init__(self, tracer, stage, key):
+        self.tracer = tracer
+        self.stage = stage
+        self.key = key
+        self.started = 0
+
+    def __enter__(self):
+        self.started = time.perf_counter_ns()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.tracer.record(self.stage, (time.perf_counter_ns() - self.started) / 1e9, self.key)
+        return False
+
+
+class LatencyTracer:
+    """구간별 지연 추적기
+
+    구간(stage)마다 최근 window개의 소요 시간을 보관해 p50/p95/p99를 계산하고,
+    회차(매매 사이클) 동안의 구간별 횟수/합계/최대(및 최대 구간의 종목 등 키)를 따로 누적합니다.
+    기록은 잠금 안에서 deque 추가와 합산만 하므로 운영 중에도 켜 둘 수 있으며,
+    백분위 계산은 조회(get_percentiles) 시에만 합니다.
+    """
+
+    def __init__(self, window=2048):
+        """
+        Args:
+            window (int): 구간별 백분위 계산에 쓰는 최근 측정 개수
+        """
+        self.window = window
+        self.samples = {}  # {stage: deque(소요 시간 초)}
+        self.cycle = {}    # {stage: [횟수, 합계, 최대, 최대 키]}
+        self.exporters = []
+        self.lock = threading.Lock()
+
+    def span(self, stage, key=None):
+        """구간 측정 컨텍스트
+        Args:
+            stage (str): 구간 이름 (예: "price", "api:HHDFS00000300")
+            key (str): 회차 요약에서 최대 소요를 구분할 키 (예: 종목 코드)
+        """
+        return LatencySpan(self, stage, key)
+
+    def record(self, stage, seconds, key=None):
+        """구간 소요 시간 기록"""
+        with self.lock:
+            samples = self.samples.get(stage)
+            if samples is None:
+                samples = self.samples[stage] = deque(maxlen=self.window)
+            samples.append(seconds)
+
+            totals = self.cycle.get(stage)
+            if totals is None:
+                self.cycle[stage] = [1, seconds, seconds, key]
+            else:
+                totals[0] += 1
+                totals[1] += seconds
+                if seconds > totals[2]:
+                    totals[2] = seconds
+                    totals[3] = key
+
+    def get_percentiles(self):
+        """구간별 최근 측정의 횟수/p50/p95/p99/최대 (초)"""
+        with self.lock:
+            snapshot = {stage: np.fromiter(samples, dtype=np.float64, count=len(samples))
+                        for stage, samples in self.samples.items()}
+
+        stats = {}
+        for stage, values in sorted(snapshot.items()):
+            p50, p95, p99 = np.percentile(values, [50, 95, 99])
+            stats[stage] = {'count': len(values), 'p50': float(p50), 'p95': float(p95), 'p99': float(p99),
+                            'max': float(values.max())}
+        return stats
+
+    def add_exporter(self, exporter):
+        """회차 종료 시 호출할 내보내기 함수 등록
+        Args:
+            exporter (Callable): exporter({'cycle': 회차 요약, 'percentiles': 구간별 백분위})
+        """
+        self.exporters.append(exporter)
+
+    def end_cycle(self):
+        """회차 누적값을 반환하고 초기화 (내보내기 함수가 있으면 백분위와 함께 전달)
+        Returns:
+            dict: {stage: {'count', 'total', 'max', 'max_key'}} (소요 합계 내림차순)
+        """
+        with self.lock:
+            cycle, self.cycle = self.cycle, {}
+
+        summary = {stage: {'count': count, 'total': total, 'max': longest, 'max_key': key}
+                   for stage, (count, total, longest, key) in sorted(cycle.items(), key=lambda item: -item[1][1])}
+        if summary and self.exporters:
+            snapshot = {'cycle': summary, 'percentiles': self.get_percentiles()}
+            for exporter in self.exporters:
+                exporter(snapshot)
+        return summary
+
+    @staticmethod
+    def format_summary(summary, limit=8):
+        """회차 요약 한 줄 문자열 (소요 합계 상위 limit개 구간)"""
+        parts = []
+        for stage, totals in list(summary.items())[:limit]:
+            text = f"{stage} {totals['count']}회 {totals['total']:.3f}s"
+            if totals['count'] > 1:
+                text += f"(최대 {totals['max']:.3f}s{' ' + totals['max_key'] if totals['max_key'] else ''})"
+            parts.append(text)
+        return ", ".join(parts)
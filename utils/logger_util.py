@@ -1,8 +1,85 @@
+import atexit
+import json
 import logging
+import logging.handlers
+import queue
+import time
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
 import os
 
+
+class DailyFileHandler(logging.FileHandler):
+    """날짜별 로그 파일 핸들러 (자정이 지나면 {날짜}{suffix} 새 파일로 전환)"""
+
+    def __init__(self, log_dir, suffix):
+        self.log_dir = Path(log_dir)
+        self.suffix = suffix
+        self.rollover_at = 0
+        super().__init__(self._computePath(time.time()), encoding='utf-8', delay=True)
+
+    def _computePath(self, created):
+        """기록 시각이 속한 날짜의 파일 경로 (다음 전환 시각도 갱신)"""
+        day = datetime.fromtimestamp(created)
+        self.rollover_at = (datetime(day.year, day.month, day.day) + timedelta(days=1)).timestamp()
+        return str(self.log_dir / f"{day.strftime('%Y-%m-%d')}{self.suffix}")
+
+    def emit(self, record):
+        if record.created >= self.rollover_at:
+            if self.stream:
+                self.stream.close()
+                self.stream = None
+            self.baseFilename = self._computePath(record.created)
+        super().emit(record)
+
+
+class TextFormatter(logging.Formatter):
+    """텍스트 포맷터 (구조화 이벤트는 이벤트 이름 뒤에 key=value 필드를 덧붙임)"""
+
+    def format(self, record):
+        text = super().format(record)
+        fields = getattr(record, 'fields', None)
+        if fields:
+            text += " " + " ".join(f"{key}={value}" for key, value in fields.items())
+        return text
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """구조화 이벤트 JSON 한 줄 포맷터"""
+
+    def format(self, record):
+        event = {
+            'ts': datetime.fromtimestamp(record.created).isoformat(timespec='milliseconds'),
+            'level': record.levelname,
+            'event': record.event,
+            'thread': record.threadName,
+        }
+        event.update(record.fields)
+        return json.dumps(event, ensure_ascii=False, default=str)
+
+
+class DroppingQueueHandler(logging.handlers.QueueHandler):
+    """큐에 넣기만 하는 핸들러
+
+    메시지 포맷과 파일/콘솔 출력은 모두 QueueListener 스레드에서 처리하므로 호출 스레드는 대기하지 않습니다.
+    큐가 가득 차면 기록을 버리고 건수만 셉니다.
+    """
+
+    def __init__(self, log_queue):
+        super().__init__(log_queue)
+        self.dropped = 0
+
+    def prepare(self, record):
+        # 같은 프로세스의 리스너 스레드가 처리하므로 포맷하지 않고 그대로 넘김 (포맷은 기록 스레드에서 지연 수행)
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+
 class LoggerUtil:
     _instance = None
     _initialized = False
@@ -17,42 +94,76 @@ class LoggerUtil:
             # 루트 디렉토리 경로 찾기 (상위 디렉토리)
             current_dir = Path(os.path.dirname(os.path.abspath(__file__)))
             root_dir = current_dir.parent
-            
+
             # 로그 디렉토리를 루트 경로의 logs 폴더로 설정
             log_dir = root_dir / 'logs'
 
             # 디렉토리가 없으면 생성
             log_dir.mkdir(parents=True, exist_ok=True)
 
-            # 로그 파일 설정
-            log_file = log_dir / f"{datetime.now().strftime('%Y-%m-%d')}_log.log"
-
-            # 로거 생성
+            # 로거 생성 (LOG_LEVEL 미만 로그는 호출 시점에 바로 걸러져 비용이 거의 없음)
+            level = logging.getLevelName(os.getenv("LOG_LEVEL", "DEBUG").upper())
             self.logger = logging.getLogger('MQLogger')
-            self.logger.setLevel(logging.DEBUG)
+            self.logger.setLevel(level if isinstance(level, int) else logging.DEBUG)
 
             # 이미 핸들러가 있다면 제거
             if self.logger.handlers:
                 self.logger.handlers.clear()
 
-            # 파일 핸들러
-            file_handler = logging.FileHandler(log_file, encoding='utf-8')
+            # 파일 핸들러 (날짜별 파일: {날짜}_log.log)
+            file_handler = DailyFileHandler(log_dir, "_log.log")
             file_handler.setLevel(logging.DEBUG)
 
             # 콘솔 핸들러
             console_handler = logging.StreamHandler()
             console_handler.setLevel(logging.DEBUG)
 
+            # 구조화 이벤트 핸들러 (날짜별 JSON Lines 파일: {날짜}_events.jsonl, log_event로 기록한 로그만)
+            event_handler = DailyFileHandler(log_dir, "_events.jsonl")
+            event_handler.setLevel(logging.DEBUG)
+            event_handler.addFilter(lambda record: hasattr(record, 'event'))
+            event_handler.setFormatter(JsonLinesFormatter())
+
             # 포맷터 설정
-            formatter = logging.Formatter('%(asctime)s [%(levelname)s] %(message)s')
+            formatter = TextFormatter('%(asctime)s [%(levelname)s] %(message)s')
             file_handler.setFormatter(formatter)
             console_handler.setFormatter(formatter)
 
-            # 핸들러 추가
-            self.logger.addHandler(file_handler)
-            self.logger.addHandler(console_handler)
-            
+            # 호출 스레드는 큐에 넣기만 하고 기록 스레드(QueueListener)가 핸들러로 출력
+            self.queue_handler = DroppingQueueHandler(queue.Queue(maxsize=int(os.getenv("LOG_QUEUE_SIZE", "10000"))))
+            self.listener = logging.handlers.QueueListener(
+                self.queue_handler.queue, file_handler, console_handler, event_handler,
+                respect_handler_level=True
+            )
+            self.logger.addHandler(self.queue_handler)
+            self.listener.start()
+
+            # 종료 시 큐에 남은 로그 기록
+            atexit.register(self.stop)
+
             LoggerUtil._initialized = True
 
     def get_logger(self):
-        return self.logger 
\ No newline at end of file
+        return self.logger
+
+    def log_event(self, event, level=logging.INFO, **fields):
+        """구조화 이벤트 기록 (텍스트 로그와 JSON Lines 파일에 함께 기록)
+
+        필드 포맷/직렬화는 기록 스레드에서 하므로 호출 측은 값만 넘깁니다.
+        level이 LOG_LEVEL 미만이면 레코드도 만들지 않습니다.
+        Args:
+            event (str): 이벤트 이름
+            level (int): 로그 레벨
+            **fields: 이벤트 필드 (넘긴 뒤 변경하지 않는 값)
+        """
+        if self.logger.isEnabledFor(level):
+            self.logger.log(level, event, extra={'event': event, 'fields': fields})
+
+    def get_stats(self):
+        """기록 대기/버림 건수"""
+        return {'pending': self.queue_handler.queue.qsize(), 'dropped': self.queue_handler.dropped}
+
+    def stop(self):
+        """큐에 남은 로그를 모두 기록하고 기록 스레드 종료"""
+        if self.listener._thread is not None:
+            self.listener.stop()
@@ -0,0 +1,128 @@
+"""
+체결기준현재잔고 컬럼형 포트폴리오 테이블 모듈
+"""
+
+import numpy as np
+
+
+class PortfolioTable:
+    """체결기준현재잔고(output1)를 종목 인덱스 기반 컬럼형 배열로 변환한 테이블
+
+    잔고 응답을 갱신마다 한 번만 변환해 두고, 손절 대상/총 평가금액/종목별 비중을
+    전체 보유 종목에 대해 한 번의 벡터 연산으로 계산합니다.
+    """
+
+    # 컬럼별 필드명 (앞에 있는 필드를 우선 사용)
+    FIELD_MAP = {
+        'ticker': ('pdno', 'ovrs_pdno'),
+        'quantity': ('cblc_qty13', 'ovrs_cblc_qty'),
+        'orderable_qty': ('ord_psbl_qty1', 'ord_psbl_qty'),
+        'avg_price': ('avg_unpr3', 'pchs_avg_pric'),
+        'current_price': ('ovrs_now_pric1', 'now_pric2'),
+        'pnl_rate': ('evlu_pfls_rt1', 'evlu_pfls_rt'),
+    }
+
+    def __init__(self, tickers, quantity, orderable_qty, avg_price, current_price, pnl_rate):
+        self.tickers = tickers
+        self.quantity = quantity
+        self.orderable_qty = orderable_qty
+        self.avg_price = avg_price
+        self.current_price = current_price
+        self.pnl_rate = pnl_rate
+        self.market_value = quantity * current_price
+        self.index = {ticker: i for i, ticker in enumerate(tickers.tolist())}
+
+    def __len__(self):
+        return len(self.tickers)
+
+    @classmethod
+    def from_present_balance(cls, stocks):
+        """체결기준현재잔고 종목 목록을 테이블로 변환 (보유 수량 0 이하 종목 제외)"""
+        stocks = [stock for stock in stocks or [] if isinstance(stock, dict)]
+        columns = list(cls.FIELD_MAP.keys())
+
+        # 한 번의 순회로 필드 문자열 수집
+        raw = np.array(
+            [[cls._get_field(stock, cls.FIELD_MAP[column]) for column in columns] for stock in stocks],
+            dtype=str
+        ).reshape(len(stocks), len(columns))
+
+        tickers = np.char.upper(np.char.strip(raw[:, 0]))
+        quantity, orderable_qty, avg_price, current_price, pnl_rate = (
+            cls._to_float(raw[:, i]) for i in range(1, len(columns))
+        )
+        orderable_qty = np.where(np.isfinite(orderable_qty), orderable_qty, quantity)
+
+        # 평가수익률이 없으면 평균가/현재가로 계산
+        computed_rate = np.divide(current_price - avg_price, avg_price,
+                                  out=np.full(len(avg_price), np.nan), where=avg_price > 0) * 100
+        pnl_rate = np.where(np.isfinite(pnl_rate), pnl_rate, computed_rate)
+
+        valid = (tickers != '') & np.isfinite(quantity) & (quantity > 0)
+        return cls(tickers[valid], quantity[valid], orderable_qty[valid], avg_price[valid],
+                   current_price[valid], pnl_rate[valid])
+
+    @staticmethod
+    def _get_field(stock, field_names):
+        for field_name in field_names:
+            value = stock.get(field_name)
+            if value not in (None, ''):
+                return str(value)
+        return ''
+
+    @staticmethod
+    def _to_float(column):
+        """문자열 컬럼을 float64로 일괄 변환 (쉼표/% 제거, 빈 값/해석 불가 값은 NaN)"""
+        column = np.char.strip(np.char.replace(np.char.replace(column, ',', ''), '%', ''))
+        column = np.where(column == '', 'nan', column)
+        try:
+            return column.astype(np.float64)
+        except ValueError:
+            result = np.empty(len(column), dtype=np.float64)
+            for i, value in enumerate(column):
+                try:
+                    result[i] = float(value)
+                except ValueError:
+                    result[i] = np.nan
+            return result
+
+    def _universe_mask(self, tickers=None):
+        """대상 종목 마스크 (None이면 전체)"""
+        if tickers is None:
+            return np.ones(len(self.tickers), dtype=bool)
+        return np.isin(self.tickers, [str(ticker).upper() for ticker in tickers])
+
+    def evaluate_stop_loss(self, stop_loss_rate, tickers=None):
+        """평가수익률이 손절 기준 미만인 매도 가능 종목 목록"""
+        mask = self._universe_mask(tickers) & (self.pnl_rate < stop_loss_rate) & (self.orderable_qty > 0)
+        return self.tickers[mask].tolist()
+
+    def stop_prices(self, stop_loss_rate):
+        """종목별 손절가 (매입평균가 기준)"""
+        return self.avg_price * (1 + stop_loss_rate / 100)
+
+    def total_exposure(self, tickers=None):
+        """총 평가금액 (현재가 × 보유 수량)"""
+        return float(np.nansum(self.market_value[self._universe_mask(tickers)]))
+
+    def weights(self, tickers=None):
+        """종목별 평가금액 비중 {ticker: 비중(0~1)}"""
+        mask = self._universe_mask(tickers)
+        total = np.nansum(self.market_value[mask])
+        if total <= 0:
+            return {}
+        return dict(zip(self.tickers[mask].tolist(), (self.market_value[mask] / total).tolist()))
+
+    def get_row(self, ticker):
+        """종목 행 조회 (없으면 None)"""
+        i = self.index.get(str(ticker).upper())
+        if i is None:
+            return None
+        return {
+            'quantity': float(self.quantity[i]),
+            'orderable_qty': float(self.orderable_qty[i]),
+            'avg_price': float(self.avg_price[i]),
+            'current_price': float(self.current_price[i]),
+            'pnl_rate': float(self.pnl_rate[i]),
+            'market_value': float(self.market_value[i])
+        }
@@ -0,0 +1,44 @@
+import threading
+import time
+
+
+class RateLimiter:
+    """스레드 안전 요청 간격 제한기
+
+    호출 스레드마다 다음 요청 시각(슬롯)을 잠금 안에서 예약하고, 대기는 잠금 밖에서 합니다.
+    여러 스레드가 동시에 요청해도 전체 요청이 min_interval 간격 이상으로 나뉘며,
+    직전 요청 후 충분히 시간이 지났다면 대기 없이 바로 요청합니다.
+    """
+
+    def __init__(self, min_interval):
+        """
+        Args:
+            min_interval (float): 요청 간 최소 간격 (초)
+        """
+        self.min_interval = min_interval
+        self.next_slot = 0.0
+        self.lock = threading.Lock()
+        self.total_wait = 0.0
+        self.requests = 0
+
+    def acquire(self):
+        """요청 슬롯 예약 후 차례가 될 때까지 대기
+        Returns:
+            float: 대기한 시간 (초)
+        """
+        with self.lock:
+            now = time.monotonic()
+            slot = max(now, self.next_slot)
+            self.next_slot = slot + self.min_interval
+            self.requests += 1
+            wait = slot - now
+            self.total_wait += wait
+
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def get_stats(self):
+        """요청 수 및 누적 대기 시간"""
+        with self.lock:
+            return {"requests": self.requests, "total_wait": self.total_wait}
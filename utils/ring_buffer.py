@@ -0,0 +1,87 @@
+"""
+고정 크기 NumPy 링 버퍼 모듈
+"""
+
+import numpy as np
+
+
+class RingBuffer:
+    """미리 할당된 고정 크기 링 버퍼
+
+    각 값을 i와 i + capacity 두 위치에 기록해 두므로, 최근 값 구간을
+    복사 없이 항상 연속된 메모리 뷰로 읽을 수 있습니다.
+    """
+
+    def __init__(self, capacity, dtype=np.float64):
+        if capacity <= 0:
+            raise ValueError(f"링 버퍼 크기는 1 이상이어야 합니다: {capacity}")
+
+        self.capacity = capacity
+        self.dtype = np.dtype(dtype)
+        self._data = np.zeros(capacity * 2, dtype=self.dtype)
+        self._head = 0  # 다음 기록 위치
+        self._size = 0
+
+    def __len__(self):
+        return self._size
+
+    def append(self, value):
+        """값 1개 추가 (가득 찬 경우 가장 오래된 값 덮어씀)"""
+        head = self._head
+        self._data[head] = value
+        self._data[head + self.capacity] = value
+        self._head = (head + 1) % self.capacity
+        if self._size < self.capacity:
+            self._size += 1
+
+    def extend(self, values):
+        """여러 값 일괄 추가"""
+        values = np.asarray(values, dtype=self.dtype)
+        if len(values) > self.capacity:
+            values = values[-self.capacity:]
+
+        count = len(values)
+        if count == 0:
+            return
+
+        head = self._head
+        first = min(count, self.capacity - head)
+        self._data[head:head + first] = values[:first]
+        self._data[head + self.capacity:head + self.capacity + first] = values[:first]
+        rest = count - first
+        if rest:
+            self._data[:rest] = values[first:]
+            self._data[self.capacity:self.capacity + rest] = values[first:]
+
+        self._head = (head + count) % self.capacity
+        self._size = min(self._size + count, self.capacity)
+
+    def view(self, count=None):
+        """최근 count개 값의 읽기 전용 연속 뷰 (시간순, 복사 없음)"""
+        size = self._size if count is None else min(count, self._size)
+        end = self._head + self.capacity
+        window = self._data[end - size:end]
+        window.flags.writeable = False
+        return window
+
+    def last(self):
+        """가장 최근 값 (비어 있으면 None)"""
+        if self._size == 0:
+            return None
+        return self._data[self._head + self.capacity - 1]
+
+    def clear(self):
+        """버퍼 비우기 (메모리는 유지)"""
+        self._head = 0
+        self._size = 0
+
+    def resize(self, capacity):
+        """버퍼 크기 변경 (최근 값 유지)"""
+        if capacity == self.capacity:
+            return
+        recent = np.array(self.view(capacity))
+        self.capacity = capacity
+        self._data = np.zeros(capacity * 2, dtype=self.dtype)
+        self._head = 0
+        self._size = 0
+        self.extend(recent)
@@ -1,9 +1,13 @@
 import os
+import queue
+import threading
+import time
 from urllib.request import urlopen
 import urllib.parse
 import requests
 from dotenv import load_dotenv
 import json
+from utils.logger_util import LoggerUtil
 
 load_dotenv()
 
@@ -18,6 +22,16 @@ class TelegramUtil:
         message = urllib.parse.quote_plus(message)
         urlopen(f"https://api.telegram.org/bot{self.bot_token}/sendMessage?chat_id={self.chat_id}&parse_mode=html&text={message}")
 
+    def postMessage(self, message, timeout=10):
+        """메시지 전송 요청 (응답을 그대로 반환, 전송 제한/오류 판단은 호출 측에서 처리)"""
+        url = f"https://api.telegram.org/bot{self.bot_token}/sendMessage"
+        payload = {
+            "chat_id": self.chat_id,
+            "parse_mode": "html",
+            "text": message
+        }
+        return requests.post(url, data=payload, timeout=timeout)
+
     def sendPhoto(self, photo_path, caption=""):
         """이미지 전송"""
         url = f"https://api.telegram.org/bot{self.bot_token}/sendPhoto"
@@ -77,4 +91,167 @@ class TelegramUtil:
             # 에러 발생시에도 파일들을 확실히 닫아줌
             for file in files.values():
                 file.close()
-            raise e 
\ No newline at end of file
+            raise e
+
+
+class TelegramNotifier:
+    """백그라운드 스레드로 텔레그램 메시지를 보내는 알림기
+
+    sendMessage는 큐에 넣기만 하므로 주문/체결 처리 경로가 텔레그램 응답을 기다리지 않습니다.
+    - 큐가 가득 차면 새 메시지를 버리고 건수만 셉니다.
+    - coalesce_seconds 동안 이어서 들어온 메시지는 최대 길이(MAX_LENGTH) 안에서 한 메시지로 묶어 보냅니다.
+    - 채팅방 전송 제한에 맞춰 전송 간격을 min_interval 이상으로 두고,
+      429 응답은 retry_after만큼, 네트워크/서버 오류는 지수 백오프로 max_retries회까지 재시도합니다.
+    - 종료 시 flush로 남은 메시지를 보내고 close로 스레드를 정리합니다.
+    """
+
+    MAX_LENGTH = 4096  # 텔레그램 메시지 최대 길이
+    SEPARATOR = "\n\n"
+
+    def __init__(self, telegram=None, queue_size=1000, coalesce_seconds=1.0, min_interval=1.0,
+                 max_retries=5, timeout=10):
+        """
+        Args:
+            telegram (TelegramUtil): 실제 전송에 사용할 텔레그램 유틸 (None이면 생성)
+            queue_size (int): 전송 대기 큐 크기 (초과분은 버림)
+            coalesce_seconds (float): 첫 메시지 이후 묶어 보낼 메시지를 기다리는 시간 (초)
+            min_interval (float): 전송 간 최소 간격 (초)
+            max_retries (int): 전송 실패 시 최대 재시도 횟수
+            timeout (float): 전송 요청 타임아웃 (초)
+        """
+        self.logger = LoggerUtil().get_logger()
+        self.telegram = telegram or TelegramUtil()
+        self.coalesce_seconds = coalesce_seconds
+        self.min_interval = min_interval
+        self.max_retries = max_retries
+        self.timeout = timeout
+        self.queue = queue.Queue(maxsize=queue_size)
+        self.pending = None  # 묶다가 길이 초과로 다음 전송으로 넘긴 메시지
+        self.last_sent = 0.0
+        self.stop_event = threading.Event()
+        self.stats = {'queued': 0, 'sent': 0, 'messages': 0, 'dropped': 0, 'failed': 0, 'retries': 0}
+        self.worker = threading.Thread(target=self._run, name="telegram-notifier", daemon=True)
+        self.worker.start()
+
+    def sendMessage(self, message):
+        """메시지 전송 요청 (대기하지 않음)"""
+        try:
+            self.queue.put_nowait(message)
+            self.stats['queued'] += 1
+        except queue.Full:
+            self.stats['dropped'] += 1
+            self.logger.warning(f"텔레그램 전송 큐가 가득 차 메시지를 버립니다: {message[:50]}")
+
+    def flush(self, timeout=10.0):
+        """큐에 남은 메시지 전송 대기
+        Returns:
+            bool: 시간 내 모두 처리했는지 여부
+        """
+        deadline = time.monotonic() + timeout
+        while self.queue.unfinished_tasks:
+            if time.monotonic() >= deadline or not self.worker.is_alive():
+                return False
+            time.sleep(0.05)
+        return True
+
+    def close(self, timeout=10.0):
+        """남은 메시지를 보내고 전송 스레드 종료"""
+        if not self.worker.is_alive():
+            return
+        flushed = self.flush(timeout)
+        self.stop_event.set()
+        self.worker.join(1.0)
+        self.logger.info(f"텔레그램 알림기 종료: 요청 {self.stats['messages']}건을 {self.stats['sent']}회 전송, "
+                         f"버림 {self.stats['dropped']}건, 실패 {self.stats['failed']}건, 재시도 {self.stats['retries']}회"
+                         + ("" if flushed else f", 미전송 {self.queue.unfinished_tasks}건"))
+
+    def getStats(self):
+        """전송 통계 (대기 건수 포함)"""
+        return {**self.stats, 'pending': self.queue.unfinished_tasks}
+
+    def _run(self):
+        """전송 스레드 (한 묶음에서 오류가 나도 기록 후 다음 메시지를 계속 처리)"""
+        while not self.stop_event.is_set():
+            try:
+                first = self.queue.get(timeout=0.5)
+            except queue.Empty:
+                continue
+
+            messages = [str(first)]
+            try:
+                length = len(messages[0])
+                deadline = time.monotonic() + self.coalesce_seconds
+                while True:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    try:
+                        message = str(self.queue.get(timeout=remaining))
+                    except queue.Empty:
+                        break
+                    if length + len(self.SEPARATOR) + len(message) > self.MAX_LENGTH:
+                        self.pending = message
+                        break
+                    messages.append(message)
+                    length += len(self.SEPARATOR) + len(message)
+            except Exception as e:
+                self.logger.error(f"텔레그램 메시지 묶기 오류: {e}")
+
+            while messages:
+                try:
+                    self._send(self.SEPARATOR.join(messages)[:self.MAX_LENGTH], len(messages))
+                except Exception as e:
+                    self.stats['failed'] += len(messages)
+                    self.logger.error(f"텔레그램 메시지 {len(messages)}건 전송 중 오류: {e}")
+                finally:
+                    for _ in messages:
+                        self.queue.task_done()
+                messages = [self.pending] if self.pending is not None else []
+                self.pending = None
+
+    def _send(self, text, count):
+        """묶은 메시지 전송 (전송 제한/오류 시 재시도)"""
+        self.stats['messages'] += count
+        delay = 1.0
+        for attempt in range(self.max_retries + 1):
+            wait = self.last_sent + self.min_interval - time.monotonic()
+            if wait > 0:
+                time.sleep(wait)
+            try:
+                response = self.telegram.postMessage(text, timeout=self.timeout)
+                self.last_sent = time.monotonic()
+                if response.status_code == 200:
+                    self.stats['sent'] += 1
+                    return True
+                if response.status_code == 429:
+                    # 전송 제한: 서버가 알려준 시간만큼 대기 후 재시도
+                    try:
+                        retry_after = response.json().get('parameters', {}).get('retry_after', delay)
+                        wait_seconds = float(retry_after)
+                    except (ValueError, TypeError, AttributeError):
+                        wait_seconds = delay
+                        delay *= 2
+                elif response.status_code < 500:
+                    # 잘못된 요청(형식 오류 등)은 재시도해도 실패하므로 포기
+                    self.logger.error(f"텔레그램 전송 실패 ({response.status_code}): {response.text[:200]}")
+                    break
+                else:
+                    wait_seconds = delay
+                    delay *= 2
+                reason = f"HTTP {response.status_code}"
+            except requests.RequestException as e:
+                self.last_sent = time.monotonic()
+                wait_seconds = delay
+                delay *= 2
+                reason = str(e)
+
+            if attempt == self.max_retries:
+                break
+            self.stats['retries'] += 1
+            self.logger.warning(f"텔레그램 전송 재시도 {attempt + 1}/{self.max_retries} ({wait_seconds:.1f}초 후): {reason}")
+            if self.stop_event.wait(wait_seconds):
+                break
+
+        self.stats['failed'] += count
+        self.logger.error(f"텔레그램 메시지 {count}건 전송 실패: {text[:100]}")
+        return False
@@ -1,6 +1,7 @@
 import os
 import json
 import time
+import threading
 import requests
 from datetime import datetime, timedelta
 from dotenv import load_dotenv
@@ -9,6 +10,10 @@ load_dotenv()
 
 TOKEN_FILE = 'token.json'
 
+# 프로세스 내 공유 토큰 캐시 (API 객체마다 token.json을 다시 읽지 않도록 메모리에 보관)
+_token_cache = {'access_token': None, 'expires_at': None}
+_token_lock = threading.Lock()
+
 def loadToken():
     """토큰 파일에서 저장된 토큰 정보를 로드"""
     if not os.path.exists(TOKEN_FILE):
@@ -23,9 +28,22 @@ def loadToken():
     
     if expires_at <= now:
         return None
-        
+    
+    _cacheToken(data['access_token'], expires_at)
     return data['access_token']
 
+def _cacheToken(access_token, expires_at):
+    """메모리 토큰 캐시 갱신"""
+    _token_cache['access_token'] = access_token
+    _token_cache['expires_at'] = expires_at
+
+def _getCachedToken():
+    """만료되지 않은 메모리 캐시 토큰 (없으면 None)"""
+    expires_at = _token_cache['expires_at']
+    if _token_cache['access_token'] and expires_at and expires_at > datetime.now():
+        return _token_cache['access_token']
+    return None
+
 def saveToken(token_info):
     """토큰 정보를 파일에 저장
     token_info: API 응답의 토큰 정보 (access_token, expires_in, access_token_token_expired 포함)
@@ -38,14 +56,43 @@ def saveToken(token_info):
     
     with open(TOKEN_FILE, 'w') as f:
         json.dump(data, f)
+    
+    _cacheToken(
+        token_info['access_token'],
+        datetime.strptime(token_info['access_token_token_expired'], "%Y-%m-%d %H:%M:%S")
+    )
 
 def getToken():
-    """토큰 조회 또는 새로 발급"""
-    # 저장된 토큰이 있는지 확인
-    token = loadToken()
+    """토큰 조회 또는 새로 발급 (메모리 캐시 -> 토큰 파일 -> 신규 발급 순)"""
+    token = _getCachedToken()
     if token:
         return token
+    
+    # 여러 스레드가 동시에 발급하지 않도록 잠금
+    with _token_lock:
+        token = _getCachedToken() or loadToken()
+        if token:
+            return token
+        
+        return _issueToken()
+
+def refreshToken(expired_token):
+    """서버에서 만료 응답을 받은 토큰 재발급
+    
+    다른 스레드가 이미 재발급했다면 새로 발급하지 않고 그 토큰을 반환합니다.
+    Args:
+        expired_token (str): 만료 응답을 받은 토큰
+    """
+    with _token_lock:
+        token = _getCachedToken()
+        if token and token != expired_token:
+            return token
         
+        _cacheToken(None, None)
+        return _issueToken()
+
+def _issueToken():
+    """토큰 신규 발급 및 저장"""
     # 만료된 토큰 파일 삭제
     if os.path.exists(TOKEN_FILE):
         os.remove(TOKEN_FILE)